@@ -42,6 +42,8 @@ SELECT create_hypertable('trading.bars', 'time',
 -- Create indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_bars_stock_id ON trading.bars (stock_id);
 CREATE INDEX IF NOT EXISTS idx_bars_time_stock_id ON trading.bars (time DESC, stock_id);
+-- Per-symbol range scans return rows already ordered by time (no sort node)
+CREATE INDEX IF NOT EXISTS idx_bars_stock_id_time ON trading.bars (stock_id, time);
 
 -- Create quotes table for bid/ask data
 -- Schema matches Alpaca API response: ap (ask_price), as (ask_size), ax (ask_exchange),
@@ -23,13 +23,20 @@ from src.backtest.backtest_engine import (
 from src.backtest.optimizer import (
     grid_search,
     random_search,
+    bayes_search,
+    optimize_multiple_symbols,
+    load_heatmap,
+    save_result_to_file,
+    load_result_from_file,
     cross_validate_optimize,
+    select_best_parameters,
     create_time_series_kfold
 )
 
 from src.backtest.results import (
     BacktestResult,
     ResultsDatabase,
+    AsyncResultWriter,
     ResultsComparator,
     save_results_batch,
     load_experiment_results,
@@ -52,11 +59,18 @@ __all__ = [
     # Optimization
     'grid_search',
     'random_search',
+    'bayes_search',
+    'optimize_multiple_symbols',
+    'load_heatmap',
+    'save_result_to_file',
+    'load_result_from_file',
     'cross_validate_optimize',
+    'select_best_parameters',
     'create_time_series_kfold',
     # Results
     'BacktestResult',
     'ResultsDatabase',
+    'AsyncResultWriter',
     'ResultsComparator',
     'save_results_batch',
     'load_experiment_results',
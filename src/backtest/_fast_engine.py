@@ -0,0 +1,166 @@
+"""
+Fast Backtest Engine
+Numba-compiled bar loop for strategies that can express their logic as a
+vectorized signal array (see BaseStrategy.signals()).
+
+The engine is deliberately simple: long-only, all-in position sizing,
+signals on bar i are filled at the open of bar i + 1 and commission is
+charged on both entry and exit. Stop loss / take profit rules implemented
+in a strategy's next() are not applied.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utility._njit import njit
+
+
+@njit(cache=True)
+def _run_backtest_numba(
+    ohlcv: np.ndarray,
+    signals: np.ndarray,
+    cash: float,
+    commission: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the bar-iteration loop over pre-extracted arrays.
+
+    Args:
+        ohlcv: (n, 5) float64 array of Open, High, Low, Close, Volume
+        signals: (n,) int8 array, 1 = enter long, -1 = exit, 0 = hold
+        cash: Initial cash
+        commission: Commission rate per trade side
+
+    Returns:
+        Tuple of (equity per bar, closed trades as an (m, 6) array of
+        entry bar, exit bar, size, entry price, exit price, PnL)
+    """
+    n = ohlcv.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    trades = np.empty((n, 6), dtype=np.float64)
+    n_trades = 0
+
+    size = 0.0
+    entry_price = 0.0
+    entry_bar = 0
+
+    for i in range(n):
+        if i > 0:
+            signal = signals[i - 1]
+            price = ohlcv[i, 0]
+
+            if signal > 0 and size == 0.0:
+                units = np.floor(cash / (price * (1.0 + commission)))
+                if units > 0:
+                    cash -= units * price * (1.0 + commission)
+                    size = units
+                    entry_price = price
+                    entry_bar = i
+
+            elif signal < 0 and size > 0.0:
+                proceeds = size * price * (1.0 - commission)
+                cash += proceeds
+                trades[n_trades, 0] = entry_bar
+                trades[n_trades, 1] = i
+                trades[n_trades, 2] = size
+                trades[n_trades, 3] = entry_price
+                trades[n_trades, 4] = price
+                trades[n_trades, 5] = proceeds - size * entry_price * (1.0 + commission)
+                n_trades += 1
+                size = 0.0
+
+        equity[i] = cash + size * ohlcv[i, 3]
+
+    return equity, trades[:n_trades]
+
+
+def run_fast_backtest(
+    df: pd.DataFrame,
+    signals: np.ndarray,
+    cash: float = 100000,
+    commission: float = 0.002
+) -> pd.Series:
+    """
+    Backtest a vectorized signal array with the numba engine.
+
+    Args:
+        df: DataFrame with columns Open, High, Low, Close, Volume
+        signals: Array aligned with df (1 = enter long, -1 = exit, 0 = hold)
+        cash: Initial cash
+        commission: Commission rate per trade side
+
+    Returns:
+        pd.Series with the same core keys as Backtest.run():
+        'Start', 'End', 'Equity Final [$]', 'Return [%]', 'Max. Drawdown [%]',
+        'Sharpe Ratio', '# Trades', 'Win Rate [%]', '_equity_curve', '_trades'
+
+    Raises:
+        ValueError: If signals are not aligned with df
+    """
+    if len(signals) != len(df):
+        raise ValueError(f"signals length ({len(signals)}) must match data length ({len(df)})")
+
+    ohlcv = df[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=np.float64)
+    equity, trades = _run_backtest_numba(
+        ohlcv, np.asarray(signals, dtype=np.int8), float(cash), float(commission)
+    )
+
+    peak = np.maximum.accumulate(equity)
+    drawdown = 1 - equity / peak
+    equity_curve = pd.DataFrame({'Equity': equity, 'DrawdownPct': drawdown}, index=df.index)
+
+    entry_bar = trades[:, 0].astype(np.int64)
+    exit_bar = trades[:, 1].astype(np.int64)
+    trades_df = pd.DataFrame({
+        'Size': trades[:, 2],
+        'EntryBar': entry_bar,
+        'ExitBar': exit_bar,
+        'EntryPrice': trades[:, 3],
+        'ExitPrice': trades[:, 4],
+        'PnL': trades[:, 5],
+        'ReturnPct': trades[:, 4] / trades[:, 3] - 1,
+        'EntryTime': df.index[entry_bar],
+        'ExitTime': df.index[exit_bar],
+    })
+
+    return pd.Series({
+        'Start': df.index[0],
+        'End': df.index[-1],
+        'Equity Final [$]': equity[-1],
+        'Return [%]': (equity[-1] / cash - 1) * 100,
+        'Max. Drawdown [%]': -drawdown.max() * 100,
+        'Sharpe Ratio': _sharpe_ratio(equity_curve['Equity']),
+        '# Trades': len(trades_df),
+        'Win Rate [%]': (trades_df['PnL'] > 0).mean() * 100 if len(trades_df) else np.nan,
+        '_equity_curve': equity_curve,
+        '_trades': trades_df,
+    })
+
+
+def _sharpe_ratio(equity: pd.Series) -> float:
+    """
+    Annualized Sharpe ratio (risk-free rate 0) computed the same way as
+    backtesting.py, so results from both engines are comparable.
+
+    Args:
+        equity: Equity curve with a DatetimeIndex
+
+    Returns:
+        Sharpe ratio, or NaN if volatility is zero
+    """
+    day_returns = equity.resample('D').last().dropna().pct_change().dropna()
+    if day_returns.empty:
+        return np.nan
+
+    gmean_day_return = np.exp(np.log1p(day_returns).mean()) - 1
+    have_weekends = equity.index.dayofweek.to_series().between(5, 6).mean() > 2 / 7 * .6
+    annual_trading_days = 365 if have_weekends else 252
+
+    annualized_return = (1 + gmean_day_return) ** annual_trading_days - 1
+    volatility = np.sqrt(
+        (day_returns.var(ddof=1) + (1 + gmean_day_return) ** 2) ** annual_trading_days
+        - (1 + gmean_day_return) ** (2 * annual_trading_days)
+    )
+    return annualized_return / volatility if volatility > 0 else np.nan
@@ -0,0 +1,438 @@
+"""
+Backtest Engine Module
+Standardized execution of strategy backtests on data loaded from TimescaleDB.
+Supports single symbol, multiple symbol and portfolio-level backtests.
+"""
+
+import os
+import sys
+from pathlib import Path
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Optional, Union, Any, Type, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+from backtesting import Backtest, Strategy
+from dotenv import load_dotenv
+
+# Add project root to path for imports when running as script
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.backtest.dataloader import (
+    load_bars_for_backtest,
+    get_nasdaq100_symbols,
+    validate_data_quality,
+)
+
+# Load environment variables once per process tree (children inherit os.environ)
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# Configure logging unless the application already did
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
+
+# Directory where backtest plots are written
+REPORTS_DIR = project_root / 'src' / 'backtest' / 'reports'
+
+
+def run_backtest(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    strategy_params: Optional[Dict[str, Any]] = None,
+    plot: bool = False,
+    reuse_engine: bool = False,
+    use_fast_engine: bool = False
+) -> Dict[str, Any]:
+    """
+    Run a backtest for a single symbol.
+
+    Args:
+        strategy_class: Strategy class to backtest (subclass of backtesting.Strategy)
+        symbol: Stock symbol (e.g., 'AAPL')
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        strategy_params: Optional strategy parameters passed to Backtest.run()
+        plot: If True, save an interactive plot to the reports directory
+        reuse_engine: If True, reuse a cached Backtest instance for the same
+                      (strategy, symbol, dates, resample, cash, commission,
+                      exclusive_orders) so parameter sweeps load the data
+                      and build the engine only once
+        use_fast_engine: If True, run the numba engine on the strategy's
+                         vectorized signals (see BaseStrategy.signals())
+                         instead of backtesting.Backtest. Long-only,
+                         all-in sizing; stop loss / take profit and plotting
+                         are not supported
+
+    Returns:
+        Dictionary with keys:
+        - 'symbol': str
+        - 'strategy': strategy class name
+        - 'stats': pd.Series returned by Backtest.run()
+        - 'trades': DataFrame of closed trades
+        - 'equity_curve': DataFrame with equity and drawdown
+        - 'parameters': dict of strategy parameters used
+        - 'data_quality': validation results from validate_data_quality()
+
+    Raises:
+        ValueError: If no data is available for the symbol
+    """
+    strategy_params = strategy_params or {}
+
+    logger.info(f"Running {strategy_class.__name__} backtest for {symbol}")
+
+    if use_fast_engine:
+        # Imported lazily: only fast-engine runs pay for the compiled kernel
+        from src.backtest._fast_engine import run_fast_backtest
+
+        df, data_quality = _load_backtest_data(symbol, start_date, end_date, resample)
+        signals = strategy_class.signals(df, **strategy_params)
+        stats = run_fast_backtest(df, signals, cash=cash, commission=commission)
+        if plot:
+            logger.warning("Plotting is not supported with use_fast_engine=True")
+    else:
+        bt_args = (strategy_class, symbol, start_date, end_date, resample,
+                   cash, commission, exclusive_orders)
+        bt, data_quality = _get_bt(*bt_args) if reuse_engine else _build_backtest(*bt_args)
+
+        stats = bt.run(**strategy_params)
+
+        if plot:
+            REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+            plot_path = REPORTS_DIR / f"{symbol}_{strategy_class.__name__}.html"
+            bt.plot(filename=str(plot_path), open_browser=False)
+            logger.info(f"Saved backtest plot to {plot_path}")
+
+    logger.info(
+        f"{symbol}: Return {stats['Return [%]']:.2f}%, "
+        f"Sharpe {stats['Sharpe Ratio']:.2f}, Trades {stats['# Trades']}"
+    )
+
+    return {
+        'symbol': symbol,
+        'strategy': strategy_class.__name__,
+        'stats': stats,
+        'trades': stats['_trades'],
+        'equity_curve': stats['_equity_curve'],
+        'parameters': strategy_params,
+        'data_quality': data_quality,
+    }
+
+
+def _load_backtest_data(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    resample: Optional[str]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Load bars for a symbol and validate them once.
+
+    Returns:
+        Tuple of (bars DataFrame, data quality results)
+
+    Raises:
+        ValueError: If no data is available for the symbol
+    """
+    df_dict = load_bars_for_backtest(symbol, start_date, end_date, resample=resample)
+    df = df_dict.get(symbol)
+
+    if df is None or df.empty:
+        raise ValueError(f"No data available for {symbol} between {start_date} and {end_date}")
+
+    # Reuse the loader's validation result if it already ran
+    data_quality = df.attrs.get('data_quality')
+    if data_quality is None:
+        data_quality = validate_data_quality(df, symbol)
+        df.attrs['data_quality'] = data_quality
+
+    return df, data_quality
+
+
+def _build_backtest(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    resample: Optional[str],
+    cash: float,
+    commission: float,
+    exclusive_orders: bool
+) -> Tuple[Backtest, Dict[str, Any]]:
+    """
+    Load bars for a symbol and construct a Backtest instance.
+
+    Returns:
+        Tuple of (Backtest instance, data quality results)
+
+    Raises:
+        ValueError: If no data is available for the symbol
+    """
+    df, data_quality = _load_backtest_data(symbol, start_date, end_date, resample)
+
+    bt = Backtest(
+        df,
+        strategy_class,
+        cash=cash,
+        commission=commission,
+        exclusive_orders=exclusive_orders
+    )
+    return bt, data_quality
+
+
+# Backtest.run() works on a shallow copy of the data, so one instance can
+# serve every parameter combination of a sweep. Use _get_bt.cache_clear()
+# after reloading data.
+_get_bt = lru_cache(maxsize=32)(_build_backtest)
+
+
+def _run_one(args: Tuple) -> Dict[str, Any]:
+    """
+    Run a single backtest from a tuple of arguments.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+
+    Args:
+        args: Tuple of (strategy_class, symbol, start_date, end_date, cash,
+              commission, exclusive_orders, resample, strategy_params,
+              use_fast_engine)
+
+    Returns:
+        Result dictionary from run_backtest()
+    """
+    (strategy_class, symbol, start_date, end_date, cash,
+     commission, exclusive_orders, resample, strategy_params, use_fast_engine) = args
+    return run_backtest(
+        strategy_class,
+        symbol,
+        start_date,
+        end_date,
+        cash=cash,
+        commission=commission,
+        exclusive_orders=exclusive_orders,
+        resample=resample,
+        strategy_params=strategy_params,
+        use_fast_engine=use_fast_engine
+    )
+
+
+def run_backtest_multiple_symbols(
+    strategy_class: Type[Strategy],
+    symbols: List[str],
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    strategy_params: Optional[Dict[str, Any]] = None,
+    n_jobs: Optional[int] = None,
+    use_fast_engine: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run backtests for multiple symbols in parallel.
+
+    Each symbol is backtested in its own worker process. A failure for one
+    symbol does not abort the others; the error is stored in its result.
+
+    Args:
+        strategy_class: Strategy class to backtest
+        symbols: List of stock symbols
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        cash: Initial cash per symbol
+        commission: Commission rate per trade
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule
+        strategy_params: Optional strategy parameters
+        n_jobs: Number of worker processes (default: all CPU cores).
+                Use 1 to run serially in the current process (useful for debugging)
+        use_fast_engine: If True, use the numba engine (see run_backtest())
+
+    Returns:
+        Dictionary mapping symbol to result dictionary (see run_backtest()).
+        Failed symbols map to {'symbol', 'strategy', 'stats': None, 'error'}
+
+    Raises:
+        ValueError: If no symbols provided
+    """
+    if not symbols:
+        raise ValueError("symbols list cannot be empty")
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    total = len(symbols)
+    logger.info(f"Running {strategy_class.__name__} backtest for {total} symbols (n_jobs={n_jobs})")
+
+    tasks = {
+        symbol: (strategy_class, symbol, start_date, end_date, cash,
+                 commission, exclusive_orders, resample, strategy_params,
+                 use_fast_engine)
+        for symbol in symbols
+    }
+
+    results = {}
+
+    def _record_error(symbol: str, error: Exception):
+        logger.error(f"Backtest failed for {symbol}: {error}")
+        results[symbol] = {
+            'symbol': symbol,
+            'strategy': strategy_class.__name__,
+            'stats': None,
+            'error': str(error),
+        }
+
+    if n_jobs == 1:
+        for i, symbol in enumerate(symbols, 1):
+            logger.info(f"[{i}/{total}] Backtesting {symbol}")
+            try:
+                results[symbol] = _run_one(tasks[symbol])
+            except Exception as e:
+                _record_error(symbol, e)
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, total)) as executor:
+            futures = {executor.submit(_run_one, args): symbol for symbol, args in tasks.items()}
+            for i, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                    logger.info(f"[{i}/{total}] Completed {symbol}")
+                except Exception as e:
+                    _record_error(symbol, e)
+
+    successful = sum(1 for r in results.values() if r.get('stats') is not None)
+    logger.info(f"Completed backtests: {successful}/{total} successful")
+    return results
+
+
+def run_backtest_all_symbols(
+    strategy_class: Type[Strategy],
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    max_symbols: Optional[int] = None,
+    **kwargs
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run backtests for all Nasdaq-100 symbols available in the database.
+
+    Args:
+        strategy_class: Strategy class to backtest
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        max_symbols: Optional limit on number of symbols
+        **kwargs: Additional arguments passed to run_backtest_multiple_symbols()
+
+    Returns:
+        Dictionary mapping symbol to result dictionary
+    """
+    symbols = get_nasdaq100_symbols(limit=max_symbols)
+
+    if not symbols:
+        logger.warning("No symbols with data found in database")
+        return {}
+
+    return run_backtest_multiple_symbols(strategy_class, symbols, start_date, end_date, **kwargs)
+
+
+def run_portfolio_backtest(
+    strategy_class: Type[Strategy],
+    symbols: List[str],
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    cash_per_symbol: float = 100000,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Run a portfolio-level backtest with equal capital allocated to each symbol.
+
+    Args:
+        strategy_class: Strategy class to backtest
+        symbols: List of stock symbols in the portfolio
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        cash_per_symbol: Initial cash allocated to each symbol
+        **kwargs: Additional arguments passed to run_backtest_multiple_symbols()
+
+    Returns:
+        Dictionary with keys:
+        - 'results': per-symbol result dictionaries
+        - 'portfolio_summary': DataFrame with one row per successful symbol
+        - 'initial_capital': total capital allocated
+        - 'final_equity': total equity at the end of the backtest
+        - 'total_return_pct': portfolio return in percent
+    """
+    results = run_backtest_multiple_symbols(
+        strategy_class, symbols, start_date, end_date, cash=cash_per_symbol, **kwargs
+    )
+
+    rows = []
+    for symbol, result in results.items():
+        stats = result.get('stats')
+        if stats is None:
+            continue
+        rows.append({
+            'Symbol': symbol,
+            'Return [%]': stats['Return [%]'],
+            'Sharpe Ratio': stats['Sharpe Ratio'],
+            'Max. Drawdown [%]': stats['Max. Drawdown [%]'],
+            '# Trades': stats['# Trades'],
+            'Equity Final [$]': stats['Equity Final [$]'],
+        })
+
+    portfolio_summary = pd.DataFrame(rows)
+    initial_capital = cash_per_symbol * len(rows)
+    final_equity = float(portfolio_summary['Equity Final [$]'].sum()) if rows else 0.0
+    total_return_pct = (final_equity / initial_capital - 1) * 100 if initial_capital else 0.0
+
+    logger.info(
+        f"Portfolio of {len(rows)} symbols: initial {initial_capital:.2f}, "
+        f"final {final_equity:.2f}, return {total_return_pct:.2f}%"
+    )
+
+    return {
+        'results': results,
+        'portfolio_summary': portfolio_summary,
+        'initial_capital': initial_capital,
+        'final_equity': final_equity,
+        'total_return_pct': total_return_pct,
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    from src.strategy.strategies import MovingAverageCrossOverStrategy
+
+    try:
+        results = run_backtest_multiple_symbols(
+            strategy_class=MovingAverageCrossOverStrategy,
+            symbols=['AAPL', 'MSFT', 'GOOGL'],
+            start_date="2025-07-01",
+            end_date="2025-08-31",
+            strategy_params={'short_window': 5, 'long_window': 20}
+        )
+
+        for symbol, result in results.items():
+            if result.get('stats') is not None:
+                print(f"{symbol}: {result['stats']['Return [%]']:.2f}%")
+            else:
+                print(f"{symbol}: failed ({result.get('error')})")
+
+    except Exception as e:
+        logger.error(f"Error in example usage: {e}")
+        import traceback
+        traceback.print_exc()
@@ -5,16 +5,22 @@ Provides functions to load bars data in formats compatible with the backtesting
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Tuple, Literal, Iterator
 from functools import lru_cache
+from itertools import islice
+from contextlib import contextmanager
 
+import numpy as np
 import pandas as pd
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
 # Add project root to path for imports when running as script
@@ -22,18 +28,41 @@ project_root = Path(__file__).resolve().parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.data.db_connection import get_db_connection, DB_CONFIG
+from src.data.db_connection import DB_CONFIG
+from src.utility._njit import njit
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once per process tree (children inherit os.environ)
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging unless the application already did
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
 logger = logging.getLogger(__name__)
 
 # SQLAlchemy engine (lazy initialization)
 _sqlalchemy_engine: Optional[Engine] = None
 
+# Loader connection pool (lazy, one per process so forked workers never share sockets)
+_POOL: Optional[ThreadedConnectionPool] = None
+_POOL_PID: Optional[int] = None
+
+# Bar columns in backtesting library order
+OHLCV_COLS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# OHLC column precision accepted by the loaders
+_PRICE_DTYPES = {'f32': np.float32, 'f64': np.float64}
+
+# Cached symbol -> trading.stock.id mapping (ids never change once assigned)
+_STOCK_IDS: Dict[str, int] = {}
+
+# Rows per chunk when streaming raw bars for client-side resampling
+BAR_CHUNK_ROWS = 100_000
+
+# Directory for cached bar data (Parquet files)
+CACHE_DIR = Path(os.getenv('BARS_CACHE_DIR', str(project_root / '.cache' / 'bars')))
+
 
 def get_sqlalchemy_engine() -> Engine:
     """
@@ -56,16 +85,74 @@ def get_sqlalchemy_engine() -> Engine:
     return _sqlalchemy_engine
 
 
+def _get_pool() -> ThreadedConnectionPool:
+    """
+    Get or create the loader connection pool for the current process.
+    
+    The pool is recreated when the process id changes, so worker processes
+    started with fork open their own connections instead of reusing the
+    parent's sockets.
+    
+    Returns:
+        ThreadedConnectionPool instance
+    """
+    global _POOL, _POOL_PID
+    
+    pid = os.getpid()
+    if _POOL is None or _POOL_PID != pid:
+        _POOL = ThreadedConnectionPool(
+            minconn=1,
+            maxconn=max(8, os.cpu_count() or 1),
+            **DB_CONFIG
+        )
+        _POOL_PID = pid
+        logger.info(f"Loader connection pool created (pid {pid})")
+    
+    return _POOL
+
+
+@contextmanager
+def _get_conn():
+    """
+    Borrow a connection from the loader pool.
+    
+    Connections are handed out without a liveness probe; a connection that
+    fails with a connection-level error is discarded instead of returned.
+    
+    Usage:
+        with _get_conn() as conn:
+            cursor = conn.cursor()
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        pool.putconn(conn, close=True)
+        conn = None
+        raise
+    finally:
+        if conn is not None:
+            pool.putconn(conn)
+
+
 def load_bars_from_db(
     symbol: str,
     start_date: Union[str, datetime],
     end_date: Union[str, datetime],
     #timeframe: str = '1min',
-    resample: Optional[str] = None
+    resample: Optional[str] = None,
+    cache: bool = True,
+    validate: bool = False,
+    dtype: Literal['f32', 'f64'] = 'f32',
+    backend: Literal['numpy', 'pyarrow'] = 'numpy',
+    conn=None
 ) -> pd.DataFrame:
     """
     Load bars data from TimescaleDB for a single symbol.
     
+    Thin wrapper around load_multiple_symbols() with a one-element list.
+    
     Args:
         symbol: Stock symbol (e.g., 'AAPL')
         start_date: Start date (string 'YYYY-MM-DD' or datetime)
@@ -73,6 +160,15 @@ def load_bars_from_db(
         timeframe: Original timeframe of data ('1min', '5min', '1hour', '1day')
                    Used for validation, not filtering
         resample: Optional resampling rule (e.g., '1H', '1D') to aggregate minute data
+        cache: If True, read from / write to the Parquet cache in CACHE_DIR
+        validate: If True, run validate_data_quality() and store the result
+                  in df.attrs['data_quality']
+        dtype: Precision of the OHLC columns, 'f32' (default) or 'f64' for
+               strategies that need double precision
+        backend: Column storage, 'numpy' (default) or 'pyarrow' for
+                 Arrow-backed OHLCV columns (the index stays a DatetimeIndex)
+        conn: Optional open psycopg2 connection to run the query on instead
+              of borrowing one from the pool
     
     Returns:
         DataFrame with columns: Open, High, Low, Close, Volume
@@ -83,121 +179,515 @@ def load_bars_from_db(
         ValueError: If symbol not found or date range invalid
         ConnectionError: If database connection fails
     """
-    # Convert string dates to datetime if needed
-    if isinstance(start_date, str):
-        start_date = pd.to_datetime(start_date)
-    if isinstance(end_date, str):
-        end_date = pd.to_datetime(end_date)
-    
-    # Ensure timezone-aware (assume UTC if naive)
-    if start_date.tzinfo is None:
-        start_date = start_date.replace(tzinfo=pd.Timestamp.now().tz)
-    if end_date.tzinfo is None:
-        end_date = end_date.replace(tzinfo=pd.Timestamp.now().tz)
-    
-    # Validate date range
-    if start_date >= end_date:
-        raise ValueError(f"start_date ({start_date}) must be before end_date ({end_date})")
-    
-    logger.info(f"Loading bars for {symbol} from {start_date.date()} to {end_date.date()}")
-    
-    query = """
-        SELECT 
-            b.time,
-            b.open,
-            b.high,
-            b.low,
-            b.close,
-            b.volume
-        FROM trading.bars b
-        JOIN trading.stock s ON b.stock_id = s.id
-        WHERE s.symbol = :symbol
-        AND b.time >= :start_date
-        AND b.time <= :end_date
-        ORDER BY b.time ASC
-    """
-    
-    try:
-        engine = get_sqlalchemy_engine()
-        df = pd.read_sql_query(
-            text(query),
-            engine,
-            params={'symbol': symbol, 'start_date': start_date, 'end_date': end_date},
-            parse_dates=['time']
-        )
-        
-        if df.empty:
-            logger.warning(f"No data found for {symbol} in date range {start_date} to {end_date}")
-            return _create_empty_bars_dataframe()
-        
-        # Set time as index
-        df.set_index('time', inplace=True)
-        
-        # Rename columns to match backtesting library format (capitalize first letter)
-        df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        
-        # Ensure timezone-aware index (UTC)
-        if df.index.tzinfo is None:
-            df.index = df.index.tz_localize('UTC')
-        else:
-            df.index = df.index.tz_convert('UTC')
-        
-        # Resample if requested
-        if resample:
-            df = _resample_bars(df, resample)
-            df.dropna(inplace=True)
-        
-        # Validate data quality
-        validate_data_quality(df, symbol)
-        
-        logger.info(f"Loaded {len(df)} bars for {symbol}")
-        return df
-        
-    except Exception as e:
-        logger.error(f"Error loading bars for {symbol}: {e}")
-        raise
+    return load_multiple_symbols([symbol], start_date, end_date, resample, cache=cache, validate=validate, dtype=dtype, backend=backend, conn=conn)[symbol]
 
 
 def load_multiple_symbols(
     symbols: List[str],
     start_date: Union[str, datetime],
     end_date: Union[str, datetime],
-    resample: Optional[str] = None
+    resample: Optional[str] = None,
+    cache: bool = True,
+    validate: bool = False,
+    dtype: Literal['f32', 'f64'] = 'f32',
+    backend: Literal['numpy', 'pyarrow'] = 'numpy',
+    conn=None
 ) -> Dict[str, pd.DataFrame]:
     """
     Load bars data for multiple symbols.
     
+    All symbols are fetched with a single query and split per symbol
+    afterwards, so the cost is one round-trip and one query plan
+    regardless of the number of symbols.
+    
+    Loaded bars are cached as Parquet files keyed by (symbol, start, end,
+    resample); later loads of the same key skip the database entirely.
+    Call clear_cache() after ingesting new data for a cached range.
+    
     Args:
         symbols: List of stock symbols
         start_date: Start date (string 'YYYY-MM-DD' or datetime)
         end_date: End date (string 'YYYY-MM-DD' or datetime)
         timeframe: Original timeframe of data
         resample: Optional resampling rule
+        cache: If True, read from / write to the Parquet cache in CACHE_DIR
+        validate: If True, run validate_data_quality() per symbol and store
+                  the result in df.attrs['data_quality']
+        dtype: Precision of the OHLC columns ('f32' or 'f64')
+        backend: Column storage ('numpy' or 'pyarrow')
+        conn: Optional open psycopg2 connection to reuse (e.g. across
+              several loads); rolled back if the query fails
     
     Returns:
         Dictionary mapping symbol to DataFrame
         Each DataFrame has same format as load_bars_from_db()
+        Symbols without data map to an empty DataFrame
     
     Raises:
         ValueError: If no symbols provided or date range invalid
     """
     if not symbols:
         raise ValueError("symbols list cannot be empty")
+    if dtype not in _PRICE_DTYPES:
+        raise ValueError(f"dtype must be one of {list(_PRICE_DTYPES)}, got {dtype!r}")
+    if backend not in ('numpy', 'pyarrow'):
+        raise ValueError(f"backend must be 'numpy' or 'pyarrow', got {backend!r}")
+    
+    # Remove duplicates while preserving order
+    symbols = list(dict.fromkeys(symbols))
+    
+    # Convert to timezone-aware UTC timestamps (assume UTC if naive)
+    start_date = _to_utc_timestamp(start_date)
+    end_date = _to_utc_timestamp(end_date)
+    
+    # Validate date range
+    if start_date >= end_date:
+        raise ValueError(f"start_date ({start_date}) must be before end_date ({end_date})")
+    
+    logger.info(f"Loading data for {len(symbols)} symbols from {start_date.date()} to {end_date.date()}")
     
-    logger.info(f"Loading data for {len(symbols)} symbols")
+    # Serve symbols from the on-disk cache where possible
+    cached = _read_cached_bars(symbols, start_date, end_date, resample) if cache else {}
+    to_load = [symbol for symbol in symbols if symbol not in cached]
+    
+    # Aggregate in the database when TimescaleDB can express the resample rule
+    bucket = _to_timescale_interval(resample) if resample else None
+    
+    groups = {}
+    if to_load:
+        try:
+            stock_ids = _get_stock_ids(to_load, conn)
+        except Exception as e:
+            logger.error(f"Error looking up stock ids for {len(to_load)} symbols: {e}")
+            raise
+    else:
+        stock_ids = {}
+    
+    if stock_ids:
+        # Filter on bars.stock_id directly (no join with trading.stock) so the
+        # planner can walk the (stock_id, time) index in order without a sort
+        params = {'stock_ids': list(stock_ids.values()), 'start_date': start_date, 'end_date': end_date}
+        
+        # Timestamps come back as epoch nanoseconds and prices as float8 so
+        # rows map straight onto numpy dtypes (no Decimal/datetime objects)
+        if bucket:
+            query = """
+                SELECT 
+                    b.stock_id,
+                    (EXTRACT(EPOCH FROM time_bucket(CAST(%(bucket)s AS INTERVAL), b.time)) * 1000000000)::bigint AS time,
+                    first(b.open, b.time)::float8 AS open,
+                    max(b.high)::float8 AS high,
+                    min(b.low)::float8 AS low,
+                    last(b.close, b.time)::float8 AS close,
+                    sum(b.volume)::bigint AS volume
+                FROM trading.bars b
+                WHERE b.stock_id = ANY(%(stock_ids)s)
+                AND b.time >= %(start_date)s
+                AND b.time <= %(end_date)s
+                GROUP BY 1, 2
+                ORDER BY 1, 2
+            """
+            params['bucket'] = bucket
+        else:
+            query = """
+                SELECT 
+                    b.stock_id,
+                    (EXTRACT(EPOCH FROM b.time) * 1000000000)::bigint AS time,
+                    b.open::float8,
+                    b.high::float8,
+                    b.low::float8,
+                    b.close::float8,
+                    b.volume
+                FROM trading.bars b
+                WHERE b.stock_id = ANY(%(stock_ids)s)
+                AND b.time >= %(start_date)s
+                AND b.time <= %(end_date)s
+                ORDER BY b.stock_id, b.time ASC
+            """
+        
+        # Rule-based resampling happens client-side: stream the raw rows in
+        # chunks and resample each one so only the resampled bars are kept.
+        # Every chunk of a symbol is binned from the midnight of its first
+        # bar, as a single resample over all of its bars would be
+        chunksize = BAR_CHUNK_ROWS if resample and not bucket else None
+        symbol_by_id = {stock_id: symbol for symbol, stock_id in stock_ids.items()}
+        pieces = {}
+        origins = {}
+        try:
+            for records in _fetch_bar_records(query, params, conn, chunksize):
+                for symbol, group in _split_records(records, symbol_by_id):
+                    origin = origins.setdefault(symbol, _start_of_day(group['time'][0]))
+                    # Bars aggregated by time_bucket() are already at the requested timeframe
+                    pieces.setdefault(symbol, []).append(
+                        _prepare_bars(group, None if bucket else resample, origin)
+                    )
+        except Exception as e:
+            logger.error(f"Error loading bars for {len(to_load)} symbols: {e}")
+            raise
+        
+        groups = {symbol: _merge_bar_chunks(frames) for symbol, frames in pieces.items()}
     
     result = {}
     for symbol in symbols:
+        if symbol in cached:
+            df = cached[symbol]
+        else:
+            df = groups.get(symbol)
+            if df is None or df.empty:
+                logger.warning(f"No data found for {symbol} in date range {start_date} to {end_date}")
+                result[symbol] = _create_empty_bars_dataframe()
+                continue
+            
+            if cache:
+                _write_cached_bars(df, symbol, start_date, end_date, resample)
+        
+        df = _cast_bars(df, dtype, backend)
+        
+        # Validate data quality (result is kept on the frame for later consumers)
+        if validate:
+            df.attrs['data_quality'] = validate_data_quality(df, symbol)
+        
+        logger.info(f"Loaded {len(df)} bars for {symbol}")
+        result[symbol] = df
+    
+    loaded = sum(1 for df in result.values() if not df.empty)
+    logger.info(f"Successfully loaded data for {loaded}/{len(symbols)} symbols")
+    return result
+
+
+def _to_utc_timestamp(value: Union[str, datetime]) -> pd.Timestamp:
+    """
+    Convert a date string or datetime to a UTC Timestamp.
+    
+    Naive values are interpreted as UTC; aware values are converted.
+    """
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+def _get_stock_ids(symbols: List[str], conn=None) -> Dict[str, int]:
+    """
+    Resolve symbols to trading.stock ids, caching the mapping per process.
+    
+    Args:
+        symbols: Stock symbols
+        conn: Optional connection to use; borrowed from the pool if None
+    
+    Returns:
+        Dictionary mapping symbol to stock id (unknown symbols are omitted)
+    """
+    missing = [symbol for symbol in symbols if symbol not in _STOCK_IDS]
+    if missing:
+        if conn is None:
+            with _get_conn() as conn:
+                return _get_stock_ids(symbols, conn)
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT symbol, id FROM trading.stock WHERE symbol = ANY(%s)", (missing,))
+        _STOCK_IDS.update(cursor.fetchall())
+        cursor.close()
+    
+    return {symbol: _STOCK_IDS[symbol] for symbol in symbols if symbol in _STOCK_IDS}
+
+
+def _fetch_bar_records(
+    query: str,
+    params: Dict,
+    conn=None,
+    chunksize: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """
+    Run a bars query on a psycopg2 cursor and collect the rows into numpy.
+    
+    A named (server-side) cursor streams rows in batches of itersize and
+    np.fromiter fills a structured array directly, so no intermediate
+    list of tuples or DataFrame is built.
+    
+    Args:
+        query: SQL returning (stock_id, time as epoch ns, open, high, low, close, volume)
+        params: Query parameters (psycopg2 pyformat style)
+        conn: Optional connection to use; borrowed from the pool if None
+        chunksize: If set, yield arrays of at most this many rows instead
+                   of a single array holding the whole result
+    
+    Yields:
+        Structured arrays with fields stock_id, time, open, high, low, close, volume
+    """
+    dtype = np.dtype([
+        ('stock_id', np.int32),
+        ('time', np.int64),
+        ('open', np.float64),
+        ('high', np.float64),
+        ('low', np.float64),
+        ('close', np.float64),
+        ('volume', np.int64),
+    ])
+    
+    if conn is None:
+        with _get_conn() as conn:
+            yield from _fetch_bar_records(query, params, conn, chunksize)
+        return
+    
+    try:
+        cursor = conn.cursor(name='load_bars')
+        cursor.itersize = 10000
+        cursor.execute(query, params)
+        if chunksize is None:
+            yield np.fromiter(cursor, dtype=dtype)
+        else:
+            rows = iter(cursor)
+            while True:
+                chunk = np.fromiter(islice(rows, chunksize), dtype=dtype)
+                if not len(chunk):
+                    break
+                yield chunk
+        cursor.close()
+    except Exception:
+        # Leave a shared connection usable for the caller's next query
+        conn.rollback()
+        raise
+
+
+def _split_records(
+    records: np.ndarray,
+    symbol_by_id: Dict[int, str]
+) -> Iterator[Tuple[str, np.ndarray]]:
+    """
+    Split records ordered by stock id into one contiguous slice per symbol.
+    
+    Args:
+        records: Structured array from _fetch_bar_records()
+        symbol_by_id: Mapping of stock id to symbol
+    
+    Yields:
+        Tuples of (symbol, records slice)
+    """
+    if not len(records):
+        return
+    
+    ids = records['stock_id']
+    bounds = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(records)]))
+    for i, j in zip(starts, ends):
+        yield symbol_by_id[int(ids[i])], records[i:j]
+
+
+def _merge_bar_chunks(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combine per-chunk bars for one symbol.
+    
+    A resample bucket can straddle a chunk boundary, so bars sharing a
+    timestamp are re-aggregated with the same OHLCV rules.
+    
+    Args:
+        frames: Chronologically ordered DataFrames for the same symbol
+    
+    Returns:
+        Single DataFrame with unique, sorted timestamps
+    """
+    if len(frames) == 1:
+        return frames[0]
+    
+    return pd.concat(frames).groupby(level=0).agg({
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last',
+        'Volume': 'sum'
+    })
+
+
+def _cache_path(
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    resample: Optional[str]
+) -> Path:
+    """
+    Build the cache file path for a (symbol, start, end, resample) key.
+    
+    Args:
+        symbol: Stock symbol
+        start_date: Timezone-aware start date
+        end_date: Timezone-aware end date
+        resample: Resampling rule or None
+    
+    Returns:
+        Path of the Parquet file inside CACHE_DIR
+    """
+    start = start_date.strftime('%Y%m%dT%H%M%S')
+    end = end_date.strftime('%Y%m%dT%H%M%S')
+    return CACHE_DIR / f"{symbol}_{start}_{end}_{resample or 'raw'}.parquet"
+
+
+def _read_cached_bars(
+    symbols: List[str],
+    start_date: datetime,
+    end_date: datetime,
+    resample: Optional[str]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Read cached bars for the given symbols.
+    
+    Returns:
+        Dictionary mapping symbol to DataFrame for cache hits only
+    """
+    cached = {}
+    for symbol in symbols:
+        path = _cache_path(symbol, start_date, end_date, resample)
+        if not path.exists():
+            continue
         try:
-            df = load_bars_from_db(symbol, start_date, end_date, resample)
-            result[symbol] = df
+            cached[symbol] = pd.read_parquet(path, memory_map=True)
+            logger.debug(f"Loaded {symbol} bars from cache {path}")
         except Exception as e:
-            logger.warning(f"Failed to load data for {symbol}: {e}")
-            # Continue with other symbols
-            continue
+            logger.warning(f"Failed to read cached bars for {symbol}: {e}")
+    return cached
+
+
+def _write_cached_bars(
+    df: pd.DataFrame,
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    resample: Optional[str]
+) -> None:
+    """
+    Write loaded bars to the cache. Failures are logged and ignored.
+    """
+    path = _cache_path(symbol, start_date, end_date, resample)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.astype({'Volume': np.int64}).to_parquet(path, compression='zstd')
+    except Exception as e:
+        logger.warning(f"Failed to cache bars for {symbol}: {e}")
+
+
+def clear_cache() -> int:
+    """
+    Delete all cached bar files.
     
-    logger.info(f"Successfully loaded data for {len(result)}/{len(symbols)} symbols")
-    return result
+    Returns:
+        Number of cache files removed
+    """
+    removed = 0
+    if CACHE_DIR.exists():
+        for path in CACHE_DIR.glob('*.parquet'):
+            path.unlink()
+            removed += 1
+    logger.info(f"Removed {removed} cached bar files from {CACHE_DIR}")
+    return removed
+
+
+def _to_timescale_interval(rule: str) -> Optional[str]:
+    """
+    Map a pandas resampling rule to a TimescaleDB time_bucket() interval.
+    
+    Args:
+        rule: Pandas resampling rule (e.g., '5min', '1H', '1D')
+    
+    Returns:
+        Interval string (e.g., '5 minutes', '1 hour', '1 day'),
+        or None if the rule cannot be expressed with time_bucket()
+    """
+    match = re.fullmatch(r'(\d*)\s*(min|T|H|h|D|d)', rule.strip())
+    if not match:
+        return None
+    
+    count = int(match.group(1) or 1)
+    unit = match.group(2)
+    
+    # time_bucket() anchors at the epoch while pandas anchors at midnight of
+    # the first bar; the bins only agree when the width divides a day
+    if unit in ('min', 'T'):
+        return f"{count} minutes" if count and 1440 % count == 0 else None
+    if unit in ('H', 'h'):
+        return f"{count} hours" if count and 24 % count == 0 else None
+    # Multi-day buckets are anchored differently by pandas and TimescaleDB
+    if count == 1:
+        return "1 day"
+    return None
+
+
+def _start_of_day(epoch_ns: int) -> pd.Timestamp:
+    """
+    Return the UTC midnight on or before an epoch-nanosecond timestamp.
+    
+    Args:
+        epoch_ns: Timestamp in nanoseconds since the epoch
+    
+    Returns:
+        Timezone-aware UTC Timestamp
+    """
+    return pd.Timestamp(int(epoch_ns), tz='UTC').floor('D')
+
+
+def _prepare_bars(
+    records: np.ndarray,
+    resample: Optional[str] = None,
+    origin: Union[str, pd.Timestamp] = 'start_day'
+) -> pd.DataFrame:
+    """
+    Convert fetched bar records into the backtesting library format.
+    
+    Args:
+        records: Structured array from _fetch_bar_records() for one symbol
+        resample: Optional resampling rule
+        origin: Timestamp the resample bins are anchored to (see
+                _resample_bars())
+    
+    Returns:
+        DataFrame with columns Open, High, Low, Close, Volume and UTC DatetimeIndex
+    """
+    index = pd.DatetimeIndex(records['time'].view('datetime64[ns]'), tz='UTC', name='time')
+    df = pd.DataFrame({
+        'Open': records['open'],
+        'High': records['high'],
+        'Low': records['low'],
+        'Close': records['close'],
+        'Volume': records['volume'],
+    }, index=index)
+    
+    # Resample if requested
+    if resample:
+        df = _resample_bars(df, resample, origin)
+        df.dropna(inplace=True)
+    
+    return df
+
+
+def _cast_bars(df: pd.DataFrame, dtype: str, backend: str = 'numpy') -> pd.DataFrame:
+    """
+    Cast OHLC columns to the requested precision and Volume to int64.
+    
+    The cache always stores full precision numpy columns; the cast happens
+    per load.
+    
+    Args:
+        df: DataFrame with columns Open, High, Low, Close, Volume
+        dtype: 'f32' or 'f64'
+        backend: 'numpy' or 'pyarrow' (Arrow-backed columns, same index)
+    
+    Returns:
+        DataFrame with cast columns
+    """
+    if df.empty:
+        return df
+    
+    price_dtype = _PRICE_DTYPES[dtype]
+    df = df.astype({
+        'Open': price_dtype,
+        'High': price_dtype,
+        'Low': price_dtype,
+        'Close': price_dtype,
+        'Volume': np.int64,
+    }, copy=False)
+    
+    if backend == 'pyarrow':
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+    
+    return df
 
 
 @lru_cache(maxsize=128)
@@ -223,7 +713,7 @@ def get_available_symbols() -> List[str]:
     """
     
     try:
-        with get_db_connection() as conn:
+        with _get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute(query)
             symbols = [row[0] for row in cursor.fetchall()]
@@ -237,6 +727,7 @@ def get_available_symbols() -> List[str]:
         raise
 
 
+@lru_cache(maxsize=128)
 def get_nasdaq100_symbols(limit: Optional[int] = None) -> List[str]:
     """
     Get list of Nasdaq-100 symbols from the database.
@@ -246,6 +737,10 @@ def get_nasdaq100_symbols(limit: Optional[int] = None) -> List[str]:
     
     Returns:
         List of Nasdaq-100 stock symbols (sorted alphabetically)
+    
+    Note:
+        Results are cached per limit.
+        Use get_nasdaq100_symbols.cache_clear() to refresh.
     """
     query = """
         SELECT DISTINCT s.symbol
@@ -258,7 +753,7 @@ def get_nasdaq100_symbols(limit: Optional[int] = None) -> List[str]:
     """
     
     try:
-        with get_db_connection() as conn:
+        with _get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute(query)
             symbols = [row[0] for row in cursor.fetchall()]
@@ -278,6 +773,7 @@ def get_nasdaq100_symbols(limit: Optional[int] = None) -> List[str]:
         raise
 
 
+@lru_cache(maxsize=512)
 def get_symbol_data_range(symbol: str) -> Dict[str, datetime]:
     """
     Get the date range of available data for a symbol.
@@ -288,6 +784,11 @@ def get_symbol_data_range(symbol: str) -> Dict[str, datetime]:
     Returns:
         Dictionary with 'start_date' and 'end_date' keys
         Returns None for both if symbol not found or has no data
+    
+    Note:
+        Results are cached per symbol, since optimizers query the same
+        ranges repeatedly. Use get_symbol_data_range.cache_clear() to
+        refresh after ingesting new data.
     """
     query = """
         SELECT 
@@ -299,7 +800,7 @@ def get_symbol_data_range(symbol: str) -> Dict[str, datetime]:
     """
     
     try:
-        with get_db_connection() as conn:
+        with _get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (symbol,))
             row = cursor.fetchone()
@@ -339,7 +840,7 @@ def validate_data_quality(
         - 'is_valid': bool
         - 'total_rows': int
         - 'missing_values': dict of column -> count
-        - 'gaps': list of gap periods
+        - 'gaps': DataFrame of gap periods (columns: start, end, duration_hours)
         - 'gap_count': int
         - 'duplicate_timestamps': int
         - 'warnings': list of warning messages
@@ -350,7 +851,7 @@ def validate_data_quality(
             'is_valid': False,
             'total_rows': 0,
             'missing_values': {},
-            'gaps': [],
+            'gaps': _empty_gaps_dataframe(),
             'gap_count': 0,
             'duplicate_timestamps': 0,
             'warnings': ['DataFrame is empty']
@@ -360,7 +861,7 @@ def validate_data_quality(
         'is_valid': True,
         'total_rows': len(df),
         'missing_values': {},
-        'gaps': [],
+        'gaps': _empty_gaps_dataframe(),
         'gap_count': 0,
         'duplicate_timestamps': 0,
         'warnings': []
@@ -373,52 +874,46 @@ def validate_data_quality(
             f"Only {len(df)} data points, minimum required: {min_data_points}"
         )
     
-    # Check for missing values
-    for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-        if col in df.columns:
-            missing_count = df[col].isna().sum()
-            if missing_count > 0:
-                results['missing_values'][col] = int(missing_count)
-                results['warnings'].append(f"Missing values in {col}: {missing_count}")
-                results['is_valid'] = False
-    
-    # Check for duplicate timestamps
-    duplicate_count = df.index.duplicated().sum()
-    if duplicate_count > 0:
-        results['duplicate_timestamps'] = int(duplicate_count)
-        results['warnings'].append(f"Duplicate timestamps: {duplicate_count}")
-        results['is_valid'] = False
+    # Extract OHLCV columns once as a float64 ndarray (Volume is optional)
+    cols = [col for col in OHLCV_COLS if col in df.columns]
+    values = df[cols].to_numpy(dtype=np.float64)
+    prices = values[:, :4]
+    
+    # Check for missing values (single pass over all columns)
+    missing_counts = np.isnan(values).sum(axis=0, dtype=np.int64)
+    for col, missing_count in zip(cols, missing_counts):
+        if missing_count > 0:
+            results['missing_values'][col] = int(missing_count)
+            results['warnings'].append(f"Missing values in {col}: {missing_count}")
+            results['is_valid'] = False
     
-    # Check for gaps in time series
+    # Check for duplicate timestamps and gaps in one pass over the sorted
+    # index (duplicates are adjacent, so they show up as zero differences)
     if len(df) > 1:
-        time_diffs = df.index.to_series().diff()
-        # Convert to hours
-        gaps = time_diffs[time_diffs > pd.Timedelta(hours=max_gap_hours)]
+        ts_ns = df.index.values.astype('datetime64[ns]', copy=False).view(np.int64)
+        gap_idx, gap_ns, duplicate_count = _scan_timestamps(ts_ns, np.int64(max_gap_hours * 3600 * 1e9))
         
-        if len(gaps) > 0:
-            results['gap_count'] = len(gaps)
-            results['gaps'] = [
-                {
-                    'start': df.index[i-1] if i > 0 else None,
-                    'end': df.index[i],
-                    'duration_hours': gap.total_seconds() / 3600
-                }
-                for i, gap in enumerate(gaps, start=1)
-            ]
+        if duplicate_count > 0:
+            results['duplicate_timestamps'] = int(duplicate_count)
+            results['warnings'].append(f"Duplicate timestamps: {duplicate_count}")
+            results['is_valid'] = False
+        
+        if len(gap_idx) > 0:
+            results['gap_count'] = len(gap_idx)
+            results['gaps'] = pd.DataFrame({
+                'start': df.index[gap_idx - 1],
+                'end': df.index[gap_idx],
+                'duration_hours': gap_ns / 3.6e12
+            })
             results['warnings'].append(
-                f"Found {len(gaps)} gaps larger than {max_gap_hours} hours"
+                f"Found {len(gap_idx)} gaps larger than {max_gap_hours} hours"
             )
             # Gaps are warnings, not necessarily invalid
     
-    # Check for invalid OHLC relationships
-    invalid_ohlc = (
-        (df['High'] < df['Low']) |
-        (df['High'] < df['Open']) |
-        (df['High'] < df['Close']) |
-        (df['Low'] > df['Open']) |
-        (df['Low'] > df['Close'])
-    )
-    invalid_count = invalid_ohlc.sum()
+    # Check for invalid OHLC relationships on the raw arrays (no Series overhead)
+    o, h, l, c = prices[:, 0], prices[:, 1], prices[:, 2], prices[:, 3]
+    invalid_ohlc = (h < l) | (h < o) | (h < c) | (l > o) | (l > c)
+    invalid_count = int(invalid_ohlc.sum())
     if invalid_count > 0:
         results['is_valid'] = False
         results['warnings'].append(
@@ -427,7 +922,7 @@ def validate_data_quality(
     
     # Check for negative or zero volume
     if 'Volume' in df.columns:
-        invalid_volume = (df['Volume'] <= 0).sum()
+        invalid_volume = int((values[:, 4] <= 0).sum())
         if invalid_volume > 0:
             results['warnings'].append(
                 f"Invalid volume (<=0): {invalid_volume} rows"
@@ -442,13 +937,48 @@ def validate_data_quality(
     return results
 
 
-def _resample_bars(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+@njit(cache=True)
+def _scan_timestamps(ts_ns: np.ndarray, max_gap_ns: np.int64) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Find gaps and duplicates between consecutive timestamps in one pass.
+    
+    Args:
+        ts_ns: Sorted timestamps as int64 nanoseconds since epoch
+        max_gap_ns: Maximum acceptable gap in nanoseconds
+    
+    Returns:
+        Tuple of (indices of the bar ending each gap, gap durations in
+        nanoseconds, number of duplicate timestamps)
+    """
+    n = ts_ns.shape[0]
+    idx = np.empty(n, dtype=np.int64)
+    durations = np.empty(n, dtype=np.int64)
+    count = 0
+    duplicates = 0
+    for i in range(1, n):
+        diff = ts_ns[i] - ts_ns[i - 1]
+        if diff == 0:
+            duplicates += 1
+        elif diff > max_gap_ns:
+            idx[count] = i
+            durations[count] = diff
+            count += 1
+    return idx[:count], durations[:count], duplicates
+
+
+def _resample_bars(
+    df: pd.DataFrame,
+    rule: str,
+    origin: Union[str, pd.Timestamp] = 'start_day'
+) -> pd.DataFrame:
     """
     Resample minute-level bars to a different timeframe.
     
     Args:
         df: DataFrame with bars data
         rule: Pandas resampling rule (e.g., '1H', '1D', '5min')
+        origin: Timestamp the bins are anchored to; pass a fixed one when
+                resampling a series in pieces so the bins line up
     
     Returns:
         Resampled DataFrame with OHLCV aggregation
@@ -457,7 +987,7 @@ def _resample_bars(df: pd.DataFrame, rule: str) -> pd.DataFrame:
         return df
     
     # Resample with OHLC aggregation
-    resampled = df.resample(rule).agg({
+    resampled = df.resample(rule, origin=origin).agg({
         'Open': 'first',
         'High': 'max',
         'Low': 'min',
@@ -472,6 +1002,20 @@ def _resample_bars(df: pd.DataFrame, rule: str) -> pd.DataFrame:
     return resampled
 
 
+def _empty_gaps_dataframe() -> pd.DataFrame:
+    """
+    Create an empty gaps report with the columns used by validate_data_quality().
+    
+    Returns:
+        Empty DataFrame with columns: start, end, duration_hours
+    """
+    return pd.DataFrame({
+        'start': pd.DatetimeIndex([], tz='UTC'),
+        'end': pd.DatetimeIndex([], tz='UTC'),
+        'duration_hours': np.array([], dtype=np.float64)
+    })
+
+
 def _create_empty_bars_dataframe() -> pd.DataFrame:
     """
     Create an empty DataFrame with the correct structure for bars data.
@@ -490,7 +1034,11 @@ def load_bars_for_backtest(
     symbol_or_symbols: Union[str, List[str]],
     start_date: Union[str, datetime],
     end_date: Union[str, datetime],
-    resample: Optional[str] = None
+    resample: Optional[str] = None,
+    cache: bool = True,
+    validate: bool = False,
+    dtype: Literal['f32', 'f64'] = 'f32',
+    backend: Literal['numpy', 'pyarrow'] = 'numpy'
 ) -> pd.DataFrame:
     """
     Convenience function to load bars in format ready for backtesting library.
@@ -503,14 +1051,18 @@ def load_bars_for_backtest(
         start_date: Start date
         end_date: End date
         timeframe: Timeframe string (for logging/validation)
+        cache: If True, use the Parquet bar cache
+        validate: If True, validate data quality while loading
+        dtype: Precision of the OHLC columns ('f32' or 'f64')
+        backend: Column storage ('numpy' or 'pyarrow')
     
     Returns:
         DataFrame compatible with backtesting library
     """
     if isinstance(symbol_or_symbols, str):
-        df_dict = {symbol_or_symbols: load_bars_from_db(symbol_or_symbols, start_date, end_date, resample=resample)}
+        df_dict = {symbol_or_symbols: load_bars_from_db(symbol_or_symbols, start_date, end_date, resample=resample, cache=cache, validate=validate, dtype=dtype, backend=backend)}
     else:
-        df_dict = load_multiple_symbols(symbol_or_symbols, start_date, end_date, resample=resample)
+        df_dict = load_multiple_symbols(symbol_or_symbols, start_date, end_date, resample=resample, cache=cache, validate=validate, dtype=dtype, backend=backend)
     
     return df_dict
 
@@ -549,7 +1101,7 @@ if __name__ == "__main__":
                     print(f"\nFirst few rows:")
                     print(df.head())
                     
-                    # Validate data quality
+                    # Validate data quality (loader skips validation by default)
                     validation = validate_data_quality(df, symbol, max_gap_hours=72)
                     print(f"\nData quality validation:")
                     print(f"Valid: {validation['is_valid']}")
@@ -557,19 +1109,6 @@ if __name__ == "__main__":
                     if validation['warnings']:
                         for warning in validation['warnings']:
                             print(f"  - {warning}")
-                    print(f"\nLoaded {len(df)} bars")
-                    print(f"Date range: {df.index.min()} to {df.index.max()}")
-                    print(f"\nFirst few rows:")
-                    print(df.head())
-                
-                    # Validate data quality
-                    validation = validate_data_quality(df, test_symbol, max_gap_hours=72)
-                    print(f"\nData quality validation:")
-                    print(f"Valid: {validation['is_valid']}")
-                    print(f"Warnings: {len(validation['warnings'])}")
-                    if validation['warnings']:
-                        for warning in validation['warnings']:
-                            print(f"  - {warning}")
         
     except Exception as e:
         logger.error(f"Error in example usage: {e}")
@@ -0,0 +1,1305 @@
+"""
+Optimizer Module
+Systematic parameter optimization for trading strategies: grid search,
+random search, Bayesian (TPE) search and time-series cross-validation.
+"""
+
+import os
+import sys
+import contextlib
+import threading
+import uuid
+import pickle
+import multiprocessing as mp
+from pathlib import Path
+import logging
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice, product
+from math import prod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union, Any, Type, Callable, Tuple, Iterable
+
+import numpy as np
+import pandas as pd
+from backtesting import Backtest, Strategy
+from dotenv import load_dotenv
+import joblib
+import orjson
+from joblib import Parallel, delayed, effective_n_jobs
+
+project_root = Path(__file__).resolve().parent.parent.parent
+
+# Add project root to path for imports when running as script; as an
+# imported module (including in joblib workers) src is already importable
+if __name__ == '__main__' and str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.backtest.dataloader import load_bars_for_backtest
+
+# Load environment variables once per process tree (children inherit os.environ)
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# Configure logging unless the application already did
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
+
+# Objective: a key of the stats Series returned by Backtest.run(), or a
+# function of that Series. backtesting.py computes the full stats for every
+# run either way, so a callable is for custom objectives, not for speed.
+Maximize = Union[str, Callable[[pd.Series], float]]
+
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Non-parameter columns of the cross_validate_optimize() trials DataFrame
+TRIAL_COLUMNS = ('symbol', 'fold', 'train_start', 'train_end', 'test_start', 'test_end',
+                 'train_value', 'test_value')
+
+# Out-of-sample stats kept per fold in the trials DataFrame
+TEST_METRICS = ('Return [%]', 'Sharpe Ratio', 'Max. Drawdown [%]', '# Trades', 'Win Rate [%]')
+
+# Headline stats written to the JSON summary by save_result_to_file()
+SUMMARY_METRICS = (
+    'Start', 'End', 'Duration', 'Return [%]', 'Buy & Hold Return [%]', 'Sharpe Ratio',
+    'Sortino Ratio', 'Max. Drawdown [%]', '# Trades', 'Win Rate [%]'
+)
+
+# random_search() stops topping up its sample after this many consecutive
+# draws that add no new combination (space exhausted or constraint too strict)
+MAX_EMPTY_DRAWS = 10
+
+# Successive halving rounds for grid_search(halving=True):
+# (fraction of bars used, fraction of combinations promoted)
+HALVING_SCHEDULE = ((0.2, 0.5), (0.5, 0.5), (1.0, 1.0))
+
+# Directory where grid_search(save_heatmap=True) writes heatmaps
+HEATMAP_DIR = project_root / 'src' / 'results' / 'heatmaps'
+
+# Directory where save_result_to_file() writes optimization results,
+# one sub-directory per strategy
+OPTIMISATION_DIR = project_root / 'src' / 'results' / 'optimisation'
+
+# Per-thread runner reused across the chunks of one _score_grid() call
+_WORKER_STATE = threading.local()
+
+
+def grid_search(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    param_grid: Dict[str, List[Any]],
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    maximize: Maximize = 'Return [%]',
+    return_heatmap: bool = False,
+    df: Optional[pd.DataFrame] = None,
+    constraint: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    save_heatmap: bool = False,
+    halving: bool = False,
+    n_jobs: int = -1,
+    early_stop_slack: Optional[float] = None,
+    min_bars: int = 200,
+    use_fast_engine: bool = False
+) -> Dict[str, Any]:
+    """
+    Exhaustively evaluate every combination in a parameter grid.
+
+    Args:
+        strategy_class: Strategy class to optimize (subclass of backtesting.Strategy)
+        symbol: Stock symbol (e.g., 'AAPL')
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        param_grid: Mapping of parameter name to list of candidate values
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        maximize: Stats key to maximize, or a callable taking the stats Series
+        return_heatmap: If True, include the per-combination heatmap Series
+        df: Optional pre-loaded bars; if None they are loaded (and cached
+            in-process) for symbol, start_date, end_date and resample
+        constraint: Optional function taking a parameter dict and returning
+                    False for combinations that should be skipped
+                    (e.g., lambda p: p['short_window'] < p['long_window'])
+        save_heatmap: If True, write the heatmap to a zstd-compressed Parquet
+                      file in HEATMAP_DIR and return its path instead of the
+                      Series (see load_heatmap()); implies return_heatmap
+        halving: If True, use successive halving instead of running every
+                 combination on the full range: all combinations are scored
+                 on the first 20% of the bars, the best half on the first
+                 50%, and the best quarter on all bars. Much cheaper for
+                 large grids, but a combination that only pays off late in
+                 the range (or needs a long warm-up) can be eliminated
+                 early. The heatmap then only covers the final round.
+        n_jobs: Number of joblib worker processes scoring combinations
+                (-1 = all CPU cores, 1 = serially in the current process)
+        early_stop_slack: If set, abandon a combination once its equity,
+                          after min_bars bars, falls more than this fraction
+                          below the best final equity found so far (shared
+                          across workers). Abandoned combinations score
+                          -inf. This is a heuristic: a combination that
+                          recovers late is lost. Only for 'Return [%]' or
+                          'Equity Final [$]' objectives.
+        min_bars: Bars to run before early stopping can trigger
+        use_fast_engine: If True, score combinations (and re-run the best)
+                         with the numba engine on the strategy's vectorized
+                         signals (see BaseStrategy.signals()). Much faster,
+                         but long-only and all-in; stop loss / take profit
+                         rules in next() are not applied. 'best_stats' then
+                         has the fast engine's reduced set of keys.
+
+    Returns:
+        Dictionary with keys: 'symbol', 'strategy', 'method', 'best_params',
+        'best_value', 'best_stats' and optionally 'heatmap' or 'heatmap_path'
+
+    Raises:
+        ValueError: If no data is available for the symbol, no
+                    combination satisfies the constraint, or early stopping
+                    is requested for another objective or the fast engine
+        NotImplementedError: If use_fast_engine is set and the strategy has
+                             no vectorized signals
+    """
+    if early_stop_slack is not None and maximize not in ('Return [%]', 'Equity Final [$]'):
+        raise ValueError("early_stop_slack requires maximize='Return [%]' or 'Equity Final [$]'")
+    if early_stop_slack is not None and use_fast_engine:
+        raise ValueError("early_stop_slack is not supported with use_fast_engine=True")
+    early_stop = (early_stop_slack, min_bars) if early_stop_slack is not None else None
+
+    df = _search_bars(symbol, start_date, end_date, resample, df)
+
+    # Duplicate candidate values would produce duplicate combinations
+    param_grid = {name: list(dict.fromkeys(values)) for name, values in param_grid.items()}
+    param_names = list(param_grid.keys())
+    param_values = list(param_grid.values())
+    if constraint is not None:
+        combinations = [c for c in product(*param_values) if constraint(dict(zip(param_names, c)))]
+        if not combinations:
+            raise ValueError("No parameter combinations satisfy the constraint")
+        total, index = len(combinations), None
+    else:
+        # Stream the full grid to the workers instead of materializing it
+        combinations = product(*param_values)
+        total = prod(len(values) for values in param_values)
+        index = pd.MultiIndex.from_product(param_values, names=param_names)
+
+    logger.info("Grid search for %s on %s", strategy_class.__name__, symbol)
+    logger.info("Parameter grid: %s", param_grid)
+    logger.info("Testing %s parameter combinations...", total)
+
+    bt_kwargs = {'cash': cash, 'commission': commission, 'exclusive_orders': exclusive_orders}
+    bt = Backtest(df, strategy_class, **bt_kwargs)
+
+    if halving:
+        heatmap = _successive_halving(
+            df, strategy_class, bt_kwargs, param_names, list(combinations), maximize, n_jobs,
+            early_stop, use_fast_engine
+        )
+    else:
+        heatmap = _score_grid(
+            df, strategy_class, bt_kwargs, param_names, combinations, maximize, n_jobs, early_stop,
+            index, use_fast_engine
+        )
+
+    if use_fast_engine:
+        stats = _run_best(partial(_run_fast, df, strategy_class, bt_kwargs), heatmap, symbol)
+        best_params = stats.attrs['params']
+    else:
+        stats = _run_best(bt.run, heatmap, symbol)
+        best_params = {p: getattr(stats._strategy, p) for p in param_names}
+
+    best_value = _score(stats, maximize)
+    logger.info("Best parameters for %s: %s", symbol, best_params)
+    logger.info("Best return: %.2f%%", stats['Return [%]'])
+
+    result = {
+        'symbol': symbol,
+        'strategy': strategy_class.__name__,
+        'method': 'grid',
+        'best_params': best_params,
+        'best_value': best_value,
+        'best_stats': stats,
+    }
+    if save_heatmap:
+        result['heatmap_path'] = _save_heatmap(heatmap, symbol, strategy_class.__name__)
+    elif return_heatmap:
+        result['heatmap'] = heatmap
+
+    return result
+
+
+def random_search(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    param_distributions: Dict[str, List[Any]],
+    n_iter: int = 50,
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    maximize: Maximize = 'Return [%]',
+    random_state: Optional[int] = None,
+    df: Optional[pd.DataFrame] = None,
+    n_jobs: int = -1,
+    constraint: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> Dict[str, Any]:
+    """
+    Evaluate randomly sampled parameter combinations.
+
+    Parameters whose candidates are all ints are sampled uniformly from the
+    integers between their min and max, parameters with float candidates
+    uniformly from [min, max], and anything else from the candidate list.
+
+    Args:
+        strategy_class: Strategy class to optimize (subclass of backtesting.Strategy)
+        symbol: Stock symbol (e.g., 'AAPL')
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        param_distributions: Mapping of parameter name to list of candidate values
+        n_iter: Number of distinct combinations to sample (fewer if the
+                search space is smaller)
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        maximize: Stats key to maximize, or a callable taking the stats Series
+        random_state: Optional seed for reproducible sampling
+        df: Optional pre-loaded bars; if None they are loaded (and cached
+            in-process) for symbol, start_date, end_date and resample
+        n_jobs: Number of joblib worker processes scoring combinations
+                (-1 = all CPU cores, 1 = serially in the current process)
+        constraint: Optional function taking a parameter dict and returning
+                    False for combinations to skip; rejected samples are
+                    replaced by new draws
+
+    Returns:
+        Dictionary with keys: 'symbol', 'strategy', 'method', 'best_params',
+        'best_value', 'best_stats'
+
+    Raises:
+        ValueError: If no data is available for the symbol, no sampled
+                    combination satisfies the constraint, or every sampled
+                    combination failed
+    """
+    # Local generator: reseeding the global RNG is not safe when symbols
+    # are searched concurrently
+    rng = np.random.default_rng(random_state)
+
+    df = _search_bars(symbol, start_date, end_date, resample, df)
+
+    param_names = list(param_distributions.keys())
+    param_ranges = _canonicalize_ranges(
+        tuple((name, tuple(values)) for name, values in param_distributions.items())
+    )
+
+    logger.info("Random search for %s on %s", strategy_class.__name__, symbol)
+    # Sample every combination up front (sequentially, so results don't
+    # depend on n_jobs), then score them in parallel
+    combinations = _sample_combinations(rng, param_ranges, n_iter, constraint)
+    if not combinations:
+        raise ValueError("No sampled parameter combinations satisfy the constraint")
+    logger.info("Testing %s random parameter combinations...", len(combinations))
+
+    bt_kwargs = {'cash': cash, 'commission': commission, 'exclusive_orders': exclusive_orders}
+    bt = Backtest(df, strategy_class, **bt_kwargs)
+
+    scores = _score_grid(df, strategy_class, bt_kwargs, param_names, combinations, maximize, n_jobs)
+    if scores.isna().all():
+        raise ValueError(f"All {len(combinations)} sampled parameter combinations failed for {symbol}")
+    best_stats = _run_best(bt.run, scores, symbol)
+    best_value = _score(best_stats, maximize)
+
+    best_params = {p: getattr(best_stats._strategy, p) for p in param_names}
+
+    logger.info("Best parameters for %s: %s", symbol, best_params)
+    logger.info("Best return: %.2f%%", best_stats['Return [%]'])
+
+    return {
+        'symbol': symbol,
+        'strategy': strategy_class.__name__,
+        'method': 'random',
+        'best_params': best_params,
+        'best_value': best_value,
+        'best_stats': best_stats,
+    }
+
+
+def bayes_search(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    param_space: Dict[str, Union[List[Any], Tuple[Any, Any]]],
+    n_trials: int = 50,
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    maximize: Maximize = 'Return [%]',
+    random_state: Optional[int] = None,
+    n_jobs: int = 1,
+    df: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    """
+    Search parameters with Optuna's TPE sampler.
+
+    Each trial is guided by the results of the previous ones, so far fewer
+    backtests are needed than for an exhaustive grid once there are three
+    or more parameters.
+
+    Args:
+        strategy_class: Strategy class to optimize (subclass of backtesting.Strategy)
+        symbol: Stock symbol (e.g., 'AAPL')
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        param_space: Mapping of parameter name to either a list of candidate
+                     values (sampled as categorical, same shape as param_grid)
+                     or a (low, high) tuple (sampled as int if both bounds are
+                     ints, else as float)
+        n_trials: Number of backtests to run
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        maximize: Stats key to maximize, or a callable taking the stats Series
+        random_state: Optional seed for the TPE sampler; results are only
+                      reproducible with n_jobs=1
+        n_jobs: Number of trials run in parallel threads (-1 = all CPU
+                cores). Trials hold the GIL, so values above 1 rarely help
+        df: Optional pre-loaded bars; if None they are loaded (and cached
+            in-process) for symbol, start_date, end_date and resample
+
+    Returns:
+        Dictionary with keys: 'symbol', 'strategy', 'method', 'best_params',
+        'best_value', 'best_stats'
+
+    Raises:
+        ValueError: If no data is available for the symbol or every trial failed
+    """
+    import optuna
+
+    df = _search_bars(symbol, start_date, end_date, resample, df)
+
+    logger.info("Bayesian search for %s on %s", strategy_class.__name__, symbol)
+    logger.info("Running %s TPE trials...", n_trials)
+
+    bt = Backtest(df, strategy_class, cash=cash, commission=commission, exclusive_orders=exclusive_orders)
+
+    def objective(trial):
+        params = {name: _suggest(trial, name, space) for name, space in param_space.items()}
+        stats = bt.run(**params)
+        value = _score(stats, maximize)
+        if np.isnan(value):
+            raise optuna.TrialPruned()
+        return value
+
+    study = optuna.create_study(
+        direction='maximize',
+        sampler=optuna.samplers.TPESampler(seed=random_state)
+    )
+    study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs, catch=(Exception,))
+
+    completed = [t for t in study.trials if t.state == optuna.trial.TrialState.COMPLETE]
+    if not completed:
+        raise ValueError(f"All {n_trials} trials failed for {symbol}")
+
+    best_params = study.best_params
+    best_stats = bt.run(**best_params)
+
+    logger.info("Best parameters for %s: %s", symbol, best_params)
+    logger.info("Best return: %.2f%%", best_stats['Return [%]'])
+
+    return {
+        'symbol': symbol,
+        'strategy': strategy_class.__name__,
+        'method': 'bayes',
+        'best_params': best_params,
+        'best_value': study.best_value,
+        'best_stats': best_stats,
+    }
+
+
+def optimize_multiple_symbols(
+    strategy_class: Type[Strategy],
+    symbols: List[str],
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    param_grid: Dict[str, List[Any]],
+    method: str = 'grid',
+    n_iter: int = 50,
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    maximize: Maximize = 'Return [%]',
+    random_state: Optional[int] = None,
+    n_jobs: int = -1,
+    constraint: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    save_heatmap: bool = False,
+    inner_n_jobs: int = 1
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Optimize a strategy independently for each symbol.
+
+    Symbols are optimized in parallel joblib (loky) worker processes.
+
+    Args:
+        strategy_class: Strategy class to optimize (subclass of backtesting.Strategy)
+        symbols: List of stock symbols
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        param_grid: Mapping of parameter name to candidate values (for
+                    method='bayes' this is the param_space)
+        method: 'grid', 'random' or 'bayes'
+        n_iter: Number of combinations / trials for 'random' and 'bayes'
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        maximize: Stats key to maximize, or a callable taking the stats Series
+        random_state: Optional seed for 'random' and 'bayes'
+        n_jobs: Number of worker processes (-1 = all CPU cores).
+                Use 1 to run serially in the current process (useful for debugging)
+        constraint: Optional parameter filter for method='grid' and 'random'
+                    (see grid_search())
+        save_heatmap: If True, write each symbol's grid heatmap to Parquet and
+                      keep only its path in the result (see grid_search())
+        inner_n_jobs: n_jobs passed to each symbol's search (worker processes
+                      for 'grid' and 'random', trial threads for 'bayes').
+                      With n_jobs=1 this parallelizes within a symbol
+                      instead of across symbols
+
+    Returns:
+        Dictionary mapping symbol to its optimization result; failed symbols
+        map to {'symbol': symbol, 'error': message}
+
+    Raises:
+        ValueError: If method is not supported
+    """
+    if method not in ('grid', 'random', 'bayes'):
+        raise ValueError(f"method must be 'grid', 'random' or 'bayes', got {method}")
+
+    logger.info("Optimizing %s on %d symbols (%s search, n_jobs=%s)",
+                strategy_class.__name__, len(symbols), method, n_jobs)
+
+    # Load all symbols in one batched query instead of once per worker
+    try:
+        dfs = load_bars_for_backtest(list(symbols), start_date, end_date, resample=resample)
+    except Exception as e:
+        logger.warning("Batch load failed, loading symbols individually: %s", e)
+        loaded = _prefetch_bars([(symbol, start_date, end_date) for symbol in symbols], resample)
+        dfs = {key[0]: df for key, df in loaded.items()}
+
+    tasks = [
+        (method, strategy_class, symbol, start_date, end_date, param_grid, n_iter,
+         cash, commission, exclusive_orders, resample, maximize, random_state,
+         inner_n_jobs, dfs.get(symbol), constraint, save_heatmap)
+        for symbol in symbols
+    ]
+
+    pairs = Parallel(n_jobs=n_jobs, backend='loky', batch_size='auto')(
+        delayed(_optimize_one)(args) for args in tasks
+    )
+    results = dict(pairs)
+
+    successful = sum(1 for r in results.values() if 'error' not in r)
+    logger.info("Completed optimizations: %s/%s successful", successful, len(symbols))
+    return results
+
+
+def _optimize_one(args: Tuple) -> Tuple[str, Dict[str, Any]]:
+    """
+    Optimize a single symbol from a tuple of arguments.
+
+    Defined at module level so it can be pickled by joblib workers. Errors
+    are caught here so one failing symbol does not abort the others.
+
+    Args:
+        args: Tuple of (method, strategy_class, symbol, start_date, end_date,
+              param_grid, n_iter, cash, commission, exclusive_orders,
+              resample, maximize, random_state, n_jobs, df,
+              constraint, save_heatmap)
+
+    Returns:
+        Tuple of (symbol, result dictionary)
+    """
+    (method, strategy_class, symbol, start_date, end_date, param_grid, n_iter,
+     cash, commission, exclusive_orders, resample, maximize, random_state,
+     n_jobs, df, constraint, save_heatmap) = args
+    try:
+        if method == 'grid':
+            result = grid_search(
+                strategy_class, symbol, start_date, end_date, param_grid,
+                cash, commission, exclusive_orders, resample, maximize,
+                df=df, constraint=constraint, save_heatmap=save_heatmap, n_jobs=n_jobs
+            )
+        elif method == 'random':
+            result = random_search(
+                strategy_class, symbol, start_date, end_date, param_grid, n_iter,
+                cash, commission, exclusive_orders, resample, maximize, random_state, df=df,
+                n_jobs=n_jobs, constraint=constraint
+            )
+        else:
+            result = bayes_search(
+                strategy_class, symbol, start_date, end_date, param_grid, n_iter,
+                cash, commission, exclusive_orders, resample, maximize, random_state,
+                n_jobs=n_jobs, df=df
+            )
+    except Exception as e:
+        logger.error("Error optimizing %s: %s", symbol, e)
+        result = {'symbol': symbol, 'error': str(e)}
+    return symbol, result
+
+
+def create_time_series_kfold(
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    n_splits: int = 5
+) -> List[Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp, pd.Timestamp]]:
+    """
+    Split a date range into expanding-window train/test folds.
+
+    The range is cut into n_splits + 1 equal periods; fold k trains on
+    periods 0..k and tests on period k + 1, so test data is always later
+    than the training data.
+
+    Args:
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        n_splits: Number of folds
+
+    Returns:
+        List of (train_start, train_end, test_start, test_end) tuples
+
+    Raises:
+        ValueError: If n_splits < 1 or end_date is not after start_date
+    """
+    if n_splits < 1:
+        raise ValueError(f"n_splits must be at least 1, got {n_splits}")
+
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    if end <= start:
+        raise ValueError(f"end_date ({end_date}) must be after start_date ({start_date})")
+
+    bounds = pd.date_range(start, end, periods=n_splits + 2)
+
+    return [
+        (bounds[0], bounds[k + 1], bounds[k + 1], bounds[k + 2])
+        for k in range(n_splits)
+    ]
+
+
+def cross_validate_optimize(
+    strategy_class: Type[Strategy],
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    param_grid: Dict[str, List[Any]],
+    n_splits: int = 5,
+    cash: float = 100000,
+    commission: float = 0.002,
+    exclusive_orders: bool = True,
+    resample: Optional[str] = None,
+    maximize: Maximize = 'Return [%]',
+    constraint: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    results_path: Optional[Union[str, Path]] = None
+) -> Dict[str, Any]:
+    """
+    Walk-forward cross-validation of a grid search.
+
+    For each fold the grid is optimized on the training window and the best
+    parameters are evaluated out-of-sample on the following test window.
+
+    Args:
+        strategy_class: Strategy class to optimize (subclass of backtesting.Strategy)
+        symbol: Stock symbol (e.g., 'AAPL')
+        start_date: Start date (string 'YYYY-MM-DD' or datetime)
+        end_date: End date (string 'YYYY-MM-DD' or datetime)
+        param_grid: Mapping of parameter name to list of candidate values
+        n_splits: Number of folds
+        cash: Initial cash
+        commission: Commission rate per trade (e.g., 0.002 = 0.2%)
+        exclusive_orders: If True, each new order closes the previous position
+        resample: Optional resampling rule (e.g., '1H', '1D')
+        maximize: Stats key to maximize, or a callable taking the stats Series
+        constraint: Optional parameter filter (see grid_search())
+        results_path: Optional Parquet file to write the trials to
+
+    Returns:
+        Dictionary with keys: 'symbol', 'strategy', 'trials' (DataFrame with
+        one row per successful fold: symbol, fold, train/test period, best
+        parameters, train_value, test_value and the TEST_METRICS of the
+        out-of-sample run), 'errors' (fold -> message),
+        'mean_train_value', 'mean_test_value', 'std_test_value'
+    """
+    folds = create_time_series_kfold(start_date, end_date, n_splits)
+
+    logger.info("Cross-validating %s on %s with %s folds", strategy_class.__name__, symbol, n_splits)
+
+    # Overlap the database round trips for every fold window; the fold loop
+    # below then hits the in-process cache
+    _prefetch_bars(
+        [(symbol, train_start, train_end) for train_start, train_end, _, _ in folds]
+        + [(symbol, test_start, test_end) for _, _, test_start, test_end in folds],
+        resample
+    )
+
+    rows = []
+    errors = {}
+    for k, (train_start, train_end, test_start, test_end) in enumerate(folds, 1):
+        logger.info("Fold %d/%d: train %s - %s, test %s - %s", k, n_splits,
+                    train_start.date(), train_end.date(), test_start.date(), test_end.date())
+        try:
+            train = grid_search(
+                strategy_class, symbol, train_start, train_end, param_grid,
+                cash, commission, exclusive_orders, resample, maximize,
+                constraint=constraint
+            )
+
+            df = _cached_load(symbol, str(test_start), str(test_end), resample)
+            if df.empty:
+                raise ValueError(f"No test data available for {symbol}")
+
+            bt = Backtest(df, strategy_class, cash=cash, commission=commission, exclusive_orders=exclusive_orders)
+            test_stats = bt.run(**train['best_params'])
+
+            rows.append({
+                'symbol': symbol,
+                'fold': k,
+                'train_start': train_start,
+                'train_end': train_end,
+                'test_start': test_start,
+                'test_end': test_end,
+                **train['best_params'],
+                'train_value': train['best_value'],
+                'test_value': _score(test_stats, maximize),
+                **{metric: float(test_stats[metric]) for metric in TEST_METRICS},
+            })
+        except Exception as e:
+            logger.error("Error in fold %s for %s: %s", k, symbol, e)
+            errors[k] = str(e)
+
+    trials = pd.DataFrame(
+        rows,
+        columns=list(TRIAL_COLUMNS[:6]) + list(param_grid) + list(TRIAL_COLUMNS[6:]) + list(TEST_METRICS)
+    )
+
+    if results_path is not None:
+        Path(results_path).parent.mkdir(parents=True, exist_ok=True)
+        trials.to_parquet(results_path, compression='zstd')
+
+    return {
+        'symbol': symbol,
+        'strategy': strategy_class.__name__,
+        'trials': trials,
+        'errors': errors,
+        'mean_train_value': trials['train_value'].mean(),
+        'mean_test_value': trials['test_value'].mean(),
+        'std_test_value': trials['test_value'].std(ddof=0),
+    }
+
+
+def select_best_parameters(
+    trials: Union[pd.DataFrame, str, Path],
+    metric: str = 'test_value',
+    min_count: int = 1
+) -> Tuple[Dict[str, Any], float]:
+    """
+    Pick the parameter set with the best average metric across folds/symbols.
+
+    Trials are grouped by their parameter values, so the average is per
+    parameter set; folds where the metric is NaN are ignored.
+
+    Args:
+        trials: Trials DataFrame from cross_validate_optimize() (several can
+                be concatenated to select across symbols), or a Parquet file
+                written by it
+        metric: Column to average ('test_value', 'train_value' or one of
+                TEST_METRICS)
+        min_count: Only consider parameter sets chosen in at least this many
+                   folds, so a set that won a single fold can't dominate
+
+    Returns:
+        Tuple of (best parameters, mean metric of those parameters)
+
+    Raises:
+        ValueError: If no parameter set has min_count valid trials
+    """
+    if not isinstance(trials, pd.DataFrame):
+        trials = pd.read_parquet(trials)
+    param_cols = [c for c in trials.columns if c not in TRIAL_COLUMNS and c not in TEST_METRICS]
+    summary = trials.groupby(param_cols, dropna=False)[metric].agg(['mean', 'std', 'count'])
+    summary = summary[summary['count'] >= max(min_count, 1)]
+    if summary.empty:
+        raise ValueError(f"No parameter set has at least {min_count} valid '{metric}' trials")
+
+    best = summary['mean'].idxmax()
+    best = best if isinstance(best, tuple) else (best,)
+
+    return {name: _to_python(value) for name, value in zip(param_cols, best)}, float(summary['mean'].max())
+
+
+def load_heatmap(path: Union[str, Path]) -> pd.Series:
+    """
+    Load a heatmap written by grid_search(save_heatmap=True).
+
+    Args:
+        path: Path returned in the result's 'heatmap_path'
+
+    Returns:
+        Heatmap Series indexed by a MultiIndex of the parameter names
+    """
+    return pd.read_parquet(path)['score']
+
+
+def save_result_to_file(
+    result: Dict[str, Any],
+    csv_heatmap: bool = False,
+    compress: int = 3,
+    parquet_heatmap: bool = False
+) -> Dict[str, str]:
+    """
+    Persist an optimization result (including 'best_stats') to disk.
+
+    The result is written with joblib using zlib compression, which keeps
+    the embedded equity curve and trades DataFrames compact, alongside a
+    JSON summary of the best parameters and SUMMARY_METRICS. A heatmap in
+    the result is kept inside the dump; it is only exported on its own when
+    requested, since writing it costs O(grid size) for runs nobody analyses.
+
+    Args:
+        result: Dictionary returned by grid_search(), random_search() or
+                bayes_search()
+        csv_heatmap: Also write the heatmap as CSV
+        compress: zlib level for the result dump; 0 writes it uncompressed,
+                  which is fastest for large equity curves since joblib
+                  then copies the numpy buffers straight to the file
+        parquet_heatmap: Also write the heatmap as Parquet (readable with
+                         load_heatmap())
+
+    Returns:
+        Dictionary of written paths under OPTIMISATION_DIR/<strategy>/:
+        'result', 'summary' and, if the result has a heatmap and it was
+        requested, 'heatmap' and/or 'heatmap_csv'
+    """
+    results_dir = OPTIMISATION_DIR / result['strategy']
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    # Plain string paths: this runs once per fold / symbol in larger sweeps
+    base_path = os.path.join(
+        os.fspath(results_dir),
+        f"{result['symbol']}_{result['method']}_{datetime.now():%Y%m%d_%H%M%S_%f}"
+    )
+    pkl_path = f"{base_path}.pkl.z" if compress else f"{base_path}.pkl"
+    joblib.dump(
+        result, pkl_path, compress=('zlib', compress) if compress else 0,
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+    paths = {'result': pkl_path}
+
+    stats = result['best_stats']
+    json_summary = {
+        'symbol': result['symbol'],
+        'strategy': result['strategy'],
+        'method': result['method'],
+        'best_params': result['best_params'],
+        'best_value': result['best_value'],
+        # Fixed schema: metrics the engine didn't report become null
+        'metrics': stats.reindex(SUMMARY_METRICS).to_dict(),
+    }
+    json_path = f"{base_path}.json"
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(
+            json_summary,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            default=str
+        ))
+    paths['summary'] = json_path
+
+    heatmap = result.get('heatmap')
+    if heatmap is not None and parquet_heatmap:
+        heatmap_path = f"{base_path}_heatmap.parquet"
+        heatmap.to_frame('score').to_parquet(heatmap_path, engine='pyarrow', compression='zstd')
+        paths['heatmap'] = heatmap_path
+    if heatmap is not None and csv_heatmap:
+        csv_path = f"{base_path}_heatmap.csv"
+        heatmap.to_csv(csv_path)
+        paths['heatmap_csv'] = csv_path
+
+    logger.info("Saved optimization result to %s", results_dir)
+    return paths
+
+
+def load_result_from_file(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load an optimization result written by save_result_to_file().
+
+    Args:
+        filepath: 'result' path returned by save_result_to_file()
+
+    Returns:
+        The result dictionary
+    """
+    return joblib.load(filepath)
+
+
+def _save_heatmap(heatmap: pd.Series, symbol: str, strategy_name: str) -> str:
+    """Write a heatmap to HEATMAP_DIR as Parquet and return the file path."""
+    HEATMAP_DIR.mkdir(parents=True, exist_ok=True)
+    path = HEATMAP_DIR / f"{symbol}_{strategy_name}_{datetime.now():%Y%m%d_%H%M%S_%f}.parquet"
+    heatmap.to_frame('score').to_parquet(path, compression='zstd')
+    return str(path)
+
+
+def _successive_halving(
+    df: pd.DataFrame,
+    strategy_class: Type[Strategy],
+    bt_kwargs: Dict[str, Any],
+    param_names: List[str],
+    combinations: List[Tuple],
+    maximize: Maximize,
+    n_jobs: int = -1,
+    early_stop: Optional[Tuple[float, int]] = None,
+    use_fast_engine: bool = False
+) -> pd.Series:
+    """
+    Score combinations on growing prefixes of df, keeping the best half
+    after each of the shorter rounds.
+
+    Each round is scored in parallel (see _score_grid()).
+
+    Returns:
+        Heatmap Series of the combinations that reached the full range
+    """
+    candidates = combinations
+    for frac, keep in HALVING_SCHEDULE:
+        df_sub = df.iloc[:max(1, int(len(df) * frac))]
+        scores = _score_grid(
+            df_sub, strategy_class, bt_kwargs, param_names, candidates, maximize, n_jobs, early_stop,
+            use_fast_engine=use_fast_engine
+        )
+        logger.info("Halving round on %s bars: scored %s combinations", len(df_sub), len(candidates))
+        if keep < 1:
+            n_keep = max(1, int(len(candidates) * keep))
+            candidates = list(scores.sort_values(ascending=False, na_position='last').index[:n_keep])
+    return scores
+
+
+def _run_best(run: Callable[..., pd.Series], heatmap: pd.Series, symbol: str) -> pd.Series:
+    """Re-run the best combination of a heatmap (e.g. with bt.run) to get its full stats."""
+    if heatmap.isna().all():
+        raise ValueError(f"All {len(heatmap)} parameter combinations failed for {symbol}")
+    best = map(_to_python, heatmap.idxmax())
+    return run(**dict(zip(heatmap.index.names, best)))
+
+
+def _run_fast(
+    df: pd.DataFrame,
+    strategy_class: Type[Strategy],
+    bt_kwargs: Dict[str, Any],
+    indicator_cache: Optional[Dict[Any, np.ndarray]] = None,
+    **params
+) -> pd.Series:
+    """
+    Backtest one combination with the numba engine; params are kept in
+    stats.attrs. indicator_cache is passed to strategy_class.signals() so
+    a sweep computes each distinct indicator once.
+    """
+    # Imported lazily: only fast-engine runs pay for the compiled kernel
+    from src.backtest._fast_engine import run_fast_backtest
+
+    signals = strategy_class.signals(df, indicator_cache=indicator_cache, **params)
+    stats = run_fast_backtest(df, signals, cash=bt_kwargs['cash'], commission=bt_kwargs['commission'])
+    stats.attrs['params'] = params
+    return stats
+
+
+def _score_grid(
+    df: pd.DataFrame,
+    strategy_class: Type[Strategy],
+    bt_kwargs: Dict[str, Any],
+    param_names: List[str],
+    combinations: Iterable[Tuple],
+    maximize: Maximize,
+    n_jobs: int = -1,
+    early_stop: Optional[Tuple[float, int]] = None,
+    index: Optional[pd.MultiIndex] = None,
+    use_fast_engine: bool = False
+) -> pd.Series:
+    """
+    Score parameter combinations in parallel joblib (loky) workers.
+
+    Combinations are sent in chunks (about four per worker); each worker
+    thread builds one Backtest per call and reuses it for all the chunks
+    it receives (see _score_chunk()). The OHLCV columns travel as one
+    column-major float64 array, which joblib memory-maps into shared memory
+    for large inputs instead of pickling the bars for every chunk.
+
+    Args:
+        combinations: Parameter tuples; may be a lazy iterator if index is
+                      given, in which case chunks are built as they are
+                      dispatched
+        early_stop: Optional (slack, min_bars); see grid_search()
+        index: MultiIndex of the combinations, in the same order
+        use_fast_engine: Score with the numba engine (see grid_search())
+
+    Returns:
+        Heatmap Series of scores indexed by a MultiIndex of param_names
+        (NaN for combinations that raised, -inf for early-stopped ones)
+    """
+    if index is None:
+        combinations = list(combinations)
+        index = pd.MultiIndex.from_tuples(combinations, names=param_names)
+
+    workers = effective_n_jobs(n_jobs)
+    size = max(1, -(-len(index) // (workers * 4)))
+    n_chunks = -(-len(index) // size)
+    remaining = iter(combinations)
+    chunks = iter(lambda: list(islice(remaining, size)), [])
+
+    ohlcv_cols = [col for col in OHLCV_COLUMNS if col in df.columns]
+    ohlcv = np.asfortranarray(df[ohlcv_cols].to_numpy(dtype=np.float64))
+    extra = df.drop(columns=ohlcv_cols)
+
+    # Identifies this call's bars and settings to the workers' cached runners
+    token = uuid.uuid4().hex
+
+    with contextlib.ExitStack() as stack:
+        shared_best = None
+        if early_stop is not None:
+            # Best final equity so far, visible to every worker
+            manager = stack.enter_context(mp.Manager())
+            shared_best = (manager.Value('d', -np.inf), manager.Lock(), *early_stop)
+
+        results = Parallel(n_jobs=min(workers, n_chunks), backend='loky')(
+            delayed(_score_chunk)(
+                token, (ohlcv, ohlcv_cols, extra), strategy_class, bt_kwargs, param_names, chunk,
+                maximize, shared_best, use_fast_engine
+            )
+            for chunk in chunks
+        )
+
+    scores = [score for chunk_scores in results for score in chunk_scores]
+    return pd.Series(scores, index=index, name=maximize if isinstance(maximize, str) else 'score')
+
+
+def _score_chunk(
+    token: str,
+    bars: Tuple[np.ndarray, List[str], pd.DataFrame],
+    strategy_class: Type[Strategy],
+    bt_kwargs: Dict[str, Any],
+    param_names: List[str],
+    combinations: List[Tuple],
+    maximize: Maximize,
+    shared_best: Optional[Tuple[Any, Any, float, int]] = None,
+    use_fast_engine: bool = False
+) -> List[float]:
+    """
+    Run a chunk of combinations and return their scores.
+
+    The Backtest (or fast-engine runner) is cached per thread under token,
+    so later chunks of the same _score_grid() call skip rebuilding the
+    DataFrame and Backtest. shared_best is (best final equity Value, Lock,
+    slack, min_bars) when early stopping is enabled.
+    """
+    cached = getattr(_WORKER_STATE, 'runner', None)
+    if cached is not None and cached[0] == token:
+        _, strategy_class, run = cached
+    else:
+        ohlcv, ohlcv_cols, extra = bars
+        # Columns of a column-major array are contiguous, so these are views
+        df = pd.DataFrame(
+            {col: ohlcv[:, i] for i, col in enumerate(ohlcv_cols)}, index=extra.index, copy=False
+        )
+        if len(extra.columns):
+            df = df.join(extra)
+
+        if shared_best is not None:
+            strategy_class = _early_stopping(strategy_class, shared_best[3])
+        if use_fast_engine:
+            run = partial(_run_fast, df, strategy_class, bt_kwargs, {})
+        else:
+            run = Backtest(df, strategy_class, **bt_kwargs).run
+        _WORKER_STATE.runner = (token, strategy_class, run)
+
+    if shared_best is not None:
+        best_equity, lock, slack, _ = shared_best
+
+    scores = []
+    for combo in combinations:
+        try:
+            if shared_best is not None:
+                strategy_class.stop_equity = best_equity.value * (1 - slack)
+            stats = run(**dict(zip(param_names, combo)))
+            scores.append(_score(stats, maximize))
+            if shared_best is not None:
+                with lock:
+                    best_equity.value = max(best_equity.value, stats['Equity Final [$]'])
+        except _EarlyStop:
+            scores.append(-np.inf)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            logger.debug("%s failed: %s", dict(zip(param_names, combo)), e)
+            scores.append(np.nan)
+    return scores
+
+
+class _EarlyStop(Exception):
+    """Raised inside a backtest to abandon a dominated combination."""
+
+
+def _early_stopping(strategy_class: Type[Strategy], min_bars: int) -> Type[Strategy]:
+    """
+    Subclass strategy_class so next() raises _EarlyStop once equity, after
+    min_bars bars, is below the class attribute stop_equity.
+    """
+    class EarlyStopping(strategy_class):
+        stop_equity = -np.inf
+
+        def next(self):
+            if len(self.data) >= min_bars and self.equity < self.stop_equity:
+                raise _EarlyStop
+            super().next()
+
+    EarlyStopping.__name__ = EarlyStopping.__qualname__ = strategy_class.__name__
+    return EarlyStopping
+
+
+def _search_bars(
+    symbol: str,
+    start_date: Union[str, datetime],
+    end_date: Union[str, datetime],
+    resample: Optional[str],
+    df: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Common data preparation for the search functions: load the bars unless
+    pre-loaded, reject an empty range and convert to float64 columns.
+    """
+    if df is None:
+        df = _cached_load(symbol, str(start_date), str(end_date), resample)
+    if df.empty:
+        raise ValueError(f"No data available for {symbol}")
+    return _as_float64_columns(df)
+
+
+def _prefetch_bars(
+    windows: List[Tuple[str, Union[str, datetime], Union[str, datetime]]],
+    resample: Optional[str]
+) -> Dict[Tuple[str, str, str], pd.DataFrame]:
+    """
+    Load several (symbol, start_date, end_date) windows concurrently.
+
+    Loading is I/O bound (psycopg2 releases the GIL while waiting on the
+    database), so threads are enough to overlap the queries. Results land
+    in the _cached_load() cache; windows that fail to load are logged and
+    left out so the caller can report the error where the data is used.
+
+    Returns:
+        Dictionary mapping (symbol, str(start), str(end)) to its bars
+    """
+    keys = list(dict.fromkeys((symbol, str(start), str(end)) for symbol, start, end in windows))
+    if not keys:
+        return {}
+
+    def load(key):
+        try:
+            return key, _cached_load(*key, resample)
+        except Exception as e:
+            logger.warning("Failed to load %s %s - %s: %s", key[0], key[1], key[2], e)
+            return key, None
+
+    with ThreadPoolExecutor(max_workers=min(16, len(keys))) as executor:
+        return {key: df for key, df in executor.map(load, keys) if df is not None}
+
+
+@lru_cache(maxsize=128)
+def _cached_load(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    resample: Optional[str]
+) -> pd.DataFrame:
+    """
+    Load bars for one symbol, memoized per process.
+
+    Repeated searches and cross-validation folds over the same window reuse
+    the DataFrame instead of reading it again. Across processes and runs the
+    loader's own parquet cache (dataloader.CACHE_DIR) is used. Dates are
+    passed as strings so the arguments are hashable.
+    """
+    df_dict = load_bars_for_backtest(symbol, start_date, end_date, resample=resample, cache=True)
+    return df_dict[symbol] if isinstance(df_dict, dict) else df_dict
+
+
+def _as_float64_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the OHLCV columns to C-contiguous float64 arrays, once per search.
+
+    backtesting.py hands each column to the strategy as a zero-copy view, so
+    with float64 columns the indicator functions no longer cast the bars on
+    every parameter combination (talib and the numba kernels need float64).
+    """
+    columns = {
+        col: np.ascontiguousarray(arr.to_numpy(dtype=np.float64)) if col in OHLCV_COLUMNS else arr
+        for col, arr in df.items()
+    }
+    out = pd.DataFrame(columns, index=df.index, copy=False)
+    out.attrs = df.attrs
+    return out
+
+
+@lru_cache(maxsize=32)
+def _canonicalize_ranges(
+    distributions: Tuple[Tuple[str, Tuple[Any, ...]], ...]
+) -> Tuple[Tuple[str, str, Tuple[Any, ...]], ...]:
+    """
+    Classify each random_search parameter once per distinct distribution.
+
+    Returns:
+        Tuple of (name, kind, spec) where kind is 'int' or 'float' with
+        spec (low, high), or 'choice' with spec the candidate values
+    """
+    ranges = []
+    for name, values in distributions:
+        if not values:
+            raise ValueError(f"No candidate values for parameter '{name}'")
+        numeric = all(isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, bool)
+                      for v in values)
+        if numeric and all(isinstance(v, (int, np.integer)) for v in values):
+            ranges.append((name, 'int', (int(min(values)), int(max(values)))))
+        elif numeric:
+            ranges.append((name, 'float', (float(min(values)), float(max(values)))))
+        else:
+            ranges.append((name, 'choice', values))
+    return tuple(ranges)
+
+
+def _sample_combinations(
+    rng: np.random.Generator,
+    param_ranges: Tuple[Tuple[str, str, Tuple[Any, ...]], ...],
+    n_iter: int,
+    constraint: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> List[Tuple]:
+    """
+    Draw up to n_iter distinct combinations from ranges classified by
+    _canonicalize_ranges().
+
+    Each parameter is sampled as a whole column, duplicates and
+    combinations rejected by constraint are dropped, and the set is topped
+    up until n_iter combinations are found, the (finite) search space is
+    exhausted, or MAX_EMPTY_DRAWS consecutive rounds add nothing new.
+    """
+    space = np.inf if any(kind == 'float' for _, kind, _ in param_ranges) else np.prod(
+        [spec[1] - spec[0] + 1 if kind == 'int' else len(spec) for _, kind, spec in param_ranges],
+        dtype=float
+    )
+    target = int(min(n_iter, space))
+
+    names = [name for name, _, _ in param_ranges]
+    combinations: Dict[Tuple, None] = {}
+    empty_draws = 0
+    while len(combinations) < target and empty_draws < MAX_EMPTY_DRAWS:
+        found = len(combinations)
+        columns = []
+        for _, kind, spec in param_ranges:
+            if kind == 'int':
+                columns.append(rng.integers(spec[0], spec[1] + 1, size=n_iter).tolist())
+            elif kind == 'float':
+                columns.append(rng.uniform(spec[0], spec[1], size=n_iter).tolist())
+            else:
+                columns.append([spec[i] for i in rng.integers(len(spec), size=n_iter)])
+        for combo in zip(*columns):
+            if combo in combinations or (
+                constraint is not None and not constraint(dict(zip(names, combo)))
+            ):
+                continue
+            combinations[combo] = None
+            if len(combinations) == target:
+                break
+        empty_draws = empty_draws + 1 if len(combinations) == found else 0
+    return list(combinations)
+
+
+def _to_python(value: Any) -> Any:
+    """Convert numpy scalars to the equivalent Python value."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _score(stats: pd.Series, maximize: Maximize) -> float:
+    """Evaluate the maximize objective on a stats Series (NaN if undefined)."""
+    value = maximize(stats) if callable(maximize) else stats[maximize]
+    return float(value) if value is not None else np.nan
+
+
+def _suggest(trial, name: str, space: Union[List[Any], Tuple[Any, Any]]) -> Any:
+    """Sample one parameter from an Optuna trial according to its space."""
+    if isinstance(space, tuple):
+        low, high = space
+        if isinstance(low, int) and isinstance(high, int):
+            return trial.suggest_int(name, low, high)
+        return trial.suggest_float(name, float(low), float(high))
+    return trial.suggest_categorical(name, list(space))
+
+
+if __name__ == '__main__':
+    from src.strategy.strategies import MovingAverageCrossOverStrategy
+
+    param_grid = {
+        'short_window': [5, 10, 20],
+        'long_window': [50, 100, 200],
+        'ma_type': ['sma', 'ema'],
+    }
+
+    result = grid_search(
+        MovingAverageCrossOverStrategy,
+        'AAPL',
+        '2025-07-01',
+        '2025-08-31',
+        param_grid,
+        maximize='Return [%]',
+        return_heatmap=True,
+        constraint=lambda p: p['short_window'] < p['long_window']
+    )
+    print(f"Best parameters: {result['best_params']}")
+    print(f"Best return: {result['best_value']:.2f}%")
+
+    result = bayes_search(
+        MovingAverageCrossOverStrategy,
+        'AAPL',
+        '2025-07-01',
+        '2025-08-31',
+        {'short_window': (5, 20), 'long_window': (50, 200), 'ma_type': ['sma', 'ema']},
+        n_trials=30,
+        random_state=42
+    )
+    print(f"Best parameters (TPE): {result['best_params']}")
+    print(f"Best return (TPE): {result['best_value']:.2f}%")
+
+    # Cross-validate several symbols and keep every fold in one Parquet file
+    # cv_path = OPTIMISATION_DIR / MovingAverageCrossOverStrategy.__name__ / 'cv_trials.parquet'
+    # trials = pd.concat([
+    #     cross_validate_optimize(
+    #         MovingAverageCrossOverStrategy,
+    #         symbol,
+    #         '2025-01-01',
+    #         '2025-08-31',
+    #         param_grid,
+    #         n_splits=4,
+    #         constraint=lambda p: p['short_window'] < p['long_window']
+    #     )['trials']
+    #     for symbol in ('AAPL', 'MSFT', 'NVDA')
+    # ], ignore_index=True)
+    # cv_path.parent.mkdir(parents=True, exist_ok=True)
+    # trials.to_parquet(cv_path, compression='zstd')
+    # print(f"Mean out-of-sample return: {trials['test_value'].mean():.2f}%")
+    # print(f"Most robust parameters: {select_best_parameters(cv_path, min_count=2)}")
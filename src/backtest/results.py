@@ -0,0 +1,774 @@
+"""
+Results Module
+Storage and comparison of backtest results.
+
+Results are kept in a single Parquet dataset under RESULTS_DIR, partitioned
+by experiment (results.parquet/experiment=<name>/...). Each backtest is one
+row: the headline metrics are typed columns and the strategy parameters a
+JSON column, so listing or loading an experiment is one filtered read.
+Equity curves go to a parallel long-format dataset (equity.parquet) with
+one (run_id, timestamp, equity) row per bar, so curves can be compared
+without keeping them in memory.
+"""
+
+import os
+import sys
+import uuid
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import logging
+from datetime import datetime
+from functools import cached_property
+from typing import List, Dict, Optional, Union, Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
+from dotenv import load_dotenv
+
+# Add project root to path for imports when running as script
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Load environment variables once per process tree (children inherit os.environ)
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# Configure logging unless the application already did
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
+
+# Default directory for stored results
+RESULTS_DIR = project_root / 'src' / 'backtest' / 'results'
+
+# Metrics stored per result: (stats key, type)
+METRICS = (
+    ('Return [%]', float),
+    ('Buy & Hold Return [%]', float),
+    ('Sharpe Ratio', float),
+    ('Sortino Ratio', float),
+    ('Calmar Ratio', float),
+    ('Max. Drawdown [%]', float),
+    ('Avg. Drawdown [%]', float),
+    ('# Trades', int),
+    ('Win Rate [%]', float),
+    ('Profit Factor', float),
+    ('Equity Final [$]', float),
+)
+METRIC_NAMES = [name for name, _ in METRICS]
+
+# Metrics shown by BacktestResult.get_summary() / ResultsComparator.compare_summary()
+SUMMARY_METRICS = ('Return [%]', 'Sharpe Ratio', 'Max. Drawdown [%]', '# Trades', 'Win Rate [%]')
+SUMMARY_COLUMNS = ('Symbol', 'Strategy') + SUMMARY_METRICS
+
+# Schema of one stored row; the 'experiment' column comes from the partition
+RESULT_SCHEMA = pa.schema(
+    [
+        ('run_id', pa.string()),
+        ('symbol', pa.string()),
+        ('strategy', pa.string()),
+        ('timestamp', pa.timestamp('us')),
+        ('parameters', pa.string()),
+    ]
+    + [(name, pa.int64() if cast is int else pa.float64()) for name, cast in METRICS]
+)
+
+
+def _to_native(value: Any) -> Any:
+    """Convert numpy scalars and timestamps to JSON-native Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class BacktestResult:
+    """
+    Container for the result of a single backtest.
+
+    Attributes:
+        symbol: Stock symbol
+        strategy_name: Name of the strategy class
+        stats: Stats Series returned by Backtest.run() (or the stored metrics
+               for a loaded result)
+        parameters: Strategy parameters used for the run
+        equity_curve: Optional equity curve DataFrame (only its 'Equity'
+                      column is stored)
+        trades: Optional trades DataFrame (not stored)
+        timestamp: When the result was created
+        run_id: Unique identifier of the stored row
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        strategy_name: str,
+        stats: Optional[pd.Series] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        equity_curve: Optional[pd.DataFrame] = None,
+        trades: Optional[pd.DataFrame] = None,
+        timestamp: Optional[datetime] = None,
+        run_id: Optional[str] = None
+    ):
+        self.symbol = symbol
+        self.strategy_name = strategy_name
+        self.stats = stats
+        # Normalized once here so the parameters serialize natively on save
+        self.parameters = {key: _to_native(value) for key, value in (parameters or {}).items()}
+        self.equity_curve = equity_curve
+        self.trades = trades
+        self.timestamp = timestamp or datetime.now()
+        self.run_id = run_id or uuid.uuid4().hex
+
+    @property
+    def stats(self) -> Optional[pd.Series]:
+        """Stats Series of the run; assigning it resets the cached metrics."""
+        return self._stats
+
+    @stats.setter
+    def stats(self, value: Optional[pd.Series]) -> None:
+        self._stats = value
+        self.__dict__.pop('_metrics', None)
+
+    @property
+    def equity(self) -> Optional[pd.DataFrame]:
+        """Equity curve DataFrame (column 'Equity'), if available."""
+        return self.equity_curve
+
+    @cached_property
+    def _metrics(self) -> Dict[str, Any]:
+        """
+        METRICS extracted from stats, computed once and shared by to_dict()
+        and get_summary(). Missing metrics become 0, metrics the engine
+        reported as NaN stay NaN. Empty if there are no stats.
+        """
+        if self.stats is None:
+            return {}
+        # One Series -> dict conversion, then plain dict lookups per metric
+        raw = self.stats.to_dict() if isinstance(self.stats, pd.Series) else dict(self.stats)
+        return {name: cast(raw.get(name, 0)) for name, cast in METRICS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with keys: 'run_id', 'symbol', 'strategy', 'timestamp',
+            'parameters', 'metrics'
+        """
+        return {
+            'run_id': self.run_id,
+            'symbol': self.symbol,
+            'strategy': self.strategy_name,
+            'timestamp': self.timestamp.isoformat(),
+            'parameters': self.parameters,
+            'metrics': dict(self._metrics),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BacktestResult':
+        """
+        Create a result from a dictionary produced by to_dict().
+
+        The metrics become the result's stats Series.
+        """
+        return cls(
+            symbol=data['symbol'],
+            strategy_name=data['strategy'],
+            stats=pd.Series(data.get('metrics', {}), dtype=object),
+            parameters=data.get('parameters', {}),
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            run_id=data.get('run_id'),
+        )
+
+    def get_summary(self) -> pd.Series:
+        """
+        Get the headline metrics of this result.
+
+        Returns:
+            Series with Symbol, Strategy, Return [%], Sharpe Ratio,
+            Max. Drawdown [%], # Trades and Win Rate [%]
+        """
+        return pd.Series(self._summary_row(), index=SUMMARY_COLUMNS, dtype=object)
+
+    def _summary_row(self) -> tuple:
+        """Values of SUMMARY_COLUMNS for this result."""
+        metrics = self._metrics
+        return (self.symbol, self.strategy_name) + tuple(
+            metrics.get(metric, 0 if metric == '# Trades' else np.nan) for metric in SUMMARY_METRICS
+        )
+
+
+class ResultsDatabase:
+    """
+    Store and load backtest results in a Parquet dataset partitioned by
+    experiment.
+    """
+
+    def __init__(
+        self,
+        results_dir: Optional[Union[str, Path]] = None,
+        compression: Optional[str] = 'zstd',
+        compression_level: Optional[int] = 3
+    ):
+        """
+        Args:
+            results_dir: Directory holding the results store (default: RESULTS_DIR)
+            compression: Parquet codec for written files (None to disable)
+            compression_level: Codec level; low zstd levels compress the
+                               repetitive metric columns almost as well as
+                               high ones at a fraction of the CPU cost
+        """
+        self.results_dir = Path(results_dir) if results_dir is not None else RESULTS_DIR
+        self.compression = compression
+        self.compression_level = compression_level if compression else None
+        self._store = self.results_dir / 'results.parquet'
+        self._equity_store = self.results_dir / 'equity.parquet'
+        # Partition directories this instance already created, as plain strings
+        self._partitions: Dict[tuple, str] = {}
+
+    def save_result(self, result: BacktestResult, experiment_name: str = 'default') -> str:
+        """
+        Save a single result.
+
+        Args:
+            result: Result to save
+            experiment_name: Experiment the result belongs to
+
+        Returns:
+            Path of the written Parquet file
+        """
+        return self.save_results([result], experiment_name)
+
+    def save_results(self, results: List[BacktestResult], experiment_name: str = 'default') -> str:
+        """
+        Save a batch of results as one Parquet file in the experiment's
+        partition.
+
+        Args:
+            results: Results to save
+            experiment_name: Experiment the results belong to
+
+        Returns:
+            Path of the written Parquet file
+
+        Raises:
+            ValueError: If results is empty
+        """
+        if not results:
+            raise ValueError("No results to save")
+
+        rows = [self._to_row(result) for result in results]
+        table = pa.Table.from_pylist(rows, schema=RESULT_SCHEMA)
+
+        filename = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{uuid.uuid4().hex[:8]}.parquet"
+        filepath = os.path.join(self._partition_dir(self._store, experiment_name), filename)
+        with pq.ParquetWriter(
+            filepath, RESULT_SCHEMA,
+            compression=self.compression or 'none',
+            compression_level=self.compression_level
+        ) as writer:
+            writer.write_table(table)
+
+        curves = [result for result in results if result.equity_curve is not None]
+        if curves:
+            self._write_equity_curves(curves, experiment_name, filename)
+
+        logger.info(f"Saved {len(results)} results to {filepath}")
+        return filepath
+
+    def load_equity_curves(
+        self,
+        experiment_name: Optional[str] = None,
+        run_ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load stored equity curves aligned on their timestamps.
+
+        Only the requested curves are read from disk (Parquet predicate
+        pushdown on experiment / run_id).
+
+        Args:
+            experiment_name: Only load this experiment (default: all)
+            run_ids: Only load these runs (default: all)
+
+        Returns:
+            DataFrame indexed by timestamp with one equity column per run_id.
+            Empty if nothing is stored.
+        """
+        filters = [('run_id', 'in', list(run_ids))] if run_ids is not None else None
+        df = self._read_store(
+            self._equity_store, experiment_name,
+            columns=['run_id', 'timestamp', 'equity'], filters=filters
+        )
+        if df is None:
+            return pd.DataFrame()
+        return df.pivot(index='timestamp', columns='run_id', values='equity')
+
+    def _partition_dir(self, store: Path, experiment_name: str) -> str:
+        """
+        Get (creating it on first use) an experiment's partition directory.
+
+        Cached per instance, so repeated saves to an experiment skip the
+        Path joins and mkdir probe.
+        """
+        key = (store, experiment_name)
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = os.path.join(os.fspath(store), f"experiment={experiment_name}")
+            os.makedirs(partition, exist_ok=True)
+            self._partitions[key] = partition
+        return partition
+
+    @staticmethod
+    def _read_store(
+        store: Path,
+        experiment_name: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[tuple]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read a partitioned store, or only one experiment's partition.
+
+        For a single experiment the partition's files are listed with
+        os.scandir and read directly, so other experiments' directories are
+        never walked.
+
+        Returns:
+            DataFrame with a str 'experiment' column (when reading all
+            experiments or no columns were selected), or None if nothing
+            is stored
+        """
+        if experiment_name is None:
+            if not store.exists():
+                return None
+            df = pd.read_parquet(store, columns=columns, filters=filters)
+            if 'experiment' in df.columns:
+                df['experiment'] = df['experiment'].astype(str)
+            return df
+
+        partition = os.path.join(os.fspath(store), f"experiment={experiment_name}")
+        if not os.path.isdir(partition):
+            return None
+        with os.scandir(partition) as entries:
+            files = sorted(entry.path for entry in entries if entry.name.endswith('.parquet'))
+        if not files:
+            return None
+        df = pq.read_table(files, columns=columns, filters=filters).to_pandas()
+        if columns is None:
+            df['experiment'] = experiment_name
+        return df
+
+    def _write_equity_curves(
+        self,
+        results: List[BacktestResult],
+        experiment_name: str,
+        filename: str
+    ) -> None:
+        """Append the results' equity curves to the equity store, one row group per curve."""
+        partition = self._partition_dir(self._equity_store, experiment_name)
+        writer = None
+        try:
+            for result in results:
+                equity = result.equity_curve['Equity']
+                table = pa.table({
+                    'run_id': pa.array([result.run_id] * len(equity), pa.string()),
+                    'timestamp': pa.array(equity.index),
+                    'equity': pa.array(equity.to_numpy(dtype=np.float64)),
+                })
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        os.path.join(partition, filename), table.schema,
+                        compression=self.compression or 'none',
+                        compression_level=self.compression_level
+                    )
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def list_results(self, experiment_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        List stored results.
+
+        Args:
+            experiment_name: Only list this experiment (default: all)
+
+        Returns:
+            DataFrame with one row per result (run_id, symbol, strategy,
+            timestamp, parameters, metrics and experiment), newest first.
+            Empty if nothing is stored.
+        """
+        df = self._read_store(self._store, experiment_name)
+        if df is None:
+            return pd.DataFrame(columns=RESULT_SCHEMA.names + ['experiment'])
+        return df.sort_values('timestamp', ascending=False, ignore_index=True)
+
+    def compact_experiment(self, experiment_name: str) -> Optional[str]:
+        """
+        Merge an experiment's files into one file per store.
+
+        Every save_result()/save_results() call adds a file, so experiments
+        built up one result at a time end up as many tiny files that each
+        cost an open and a footer read on load. Compacting rewrites them as
+        one file (results and equity curves alike) and removes the originals.
+
+        Args:
+            experiment_name: Experiment to compact
+
+        Returns:
+            Path of the compacted results file, or None if the experiment
+            has no results
+        """
+        compacted = None
+        for store in (self._store, self._equity_store):
+            partition = os.path.join(os.fspath(store), f"experiment={experiment_name}")
+            if not os.path.isdir(partition):
+                continue
+            with os.scandir(partition) as entries:
+                files = sorted(entry.path for entry in entries if entry.name.endswith('.parquet'))
+            if len(files) < 2:
+                if store is self._store and files:
+                    compacted = files[0]
+                continue
+
+            table = pq.read_table(files)
+            # Write under a hidden name (ignored by dataset discovery), then
+            # rename, so readers never see a half-written file
+            filename = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(partition, f".{filename}.tmp")
+            pq.write_table(
+                table, tmp_path,
+                compression=self.compression or 'none',
+                compression_level=self.compression_level
+            )
+            filepath = os.path.join(partition, filename)
+            os.replace(tmp_path, filepath)
+            for path in files:
+                os.remove(path)
+            logger.info(f"Compacted {len(files)} files into {filepath}")
+            if store is self._store:
+                compacted = filepath
+        return compacted
+
+    def list_experiments(self) -> List[str]:
+        """
+        List the names of stored experiments.
+
+        Returns:
+            Sorted experiment names
+        """
+        if not self._store.exists():
+            return []
+        with os.scandir(self._store) as entries:
+            return sorted(
+                entry.name[len('experiment='):] for entry in entries
+                if entry.is_dir() and entry.name.startswith('experiment=')
+            )
+
+    def load_result(self, run_id: str) -> BacktestResult:
+        """
+        Load a single result by its run_id.
+
+        Raises:
+            KeyError: If no result has this run_id
+        """
+        if self._store.exists():
+            df = pd.read_parquet(self._store, filters=[('run_id', '=', run_id)])
+            if not df.empty:
+                return self._from_row(df.iloc[0])
+        raise KeyError(f"No result with run_id {run_id}")
+
+    def load_experiment_results(self, experiment_name: str) -> List[BacktestResult]:
+        """
+        Load all results of an experiment, newest first.
+        """
+        df = self.list_results(experiment_name)
+        return [self._from_row(row) for _, row in df.iterrows()]
+
+    @staticmethod
+    def _to_row(result: BacktestResult) -> Dict[str, Any]:
+        """Flatten a result into a row of RESULT_SCHEMA."""
+        data = result.to_dict()
+        row = {
+            'run_id': data['run_id'],
+            'symbol': data['symbol'],
+            'strategy': data['strategy'],
+            'timestamp': result.timestamp,
+            # default=str only catches exotic values; parameters are
+            # normalized to native types in BacktestResult.__init__
+            'parameters': orjson.dumps(data['parameters'], default=str).decode(),
+        }
+        metrics = data['metrics']
+        row.update({name: metrics.get(name) for name in METRIC_NAMES})
+        return row
+
+    @staticmethod
+    def _from_row(row: pd.Series) -> BacktestResult:
+        """Rebuild a result from a stored row; the metrics become its stats."""
+        return BacktestResult(
+            symbol=row['symbol'],
+            strategy_name=row['strategy'],
+            stats=row[METRIC_NAMES],
+            parameters=orjson.loads(row['parameters']),
+            timestamp=pd.Timestamp(row['timestamp']).to_pydatetime(),
+            run_id=row['run_id'],
+        )
+
+
+class AsyncResultWriter:
+    """
+    Save results to a ResultsDatabase from a background thread.
+
+    submit() only enqueues, so a long run that produces results one at a
+    time is not blocked on encoding and file writes. The writer thread
+    drains up to BATCH_SIZE queued results at a time and writes each
+    experiment's share as one Parquet file.
+
+    Example:
+        with AsyncResultWriter(ResultsDatabase()) as writer:
+            for symbol in symbols:
+                writer.submit(BacktestResult(...), 'my_experiment')
+    """
+
+    BATCH_SIZE = 64
+
+    def __init__(self, db: Optional[ResultsDatabase] = None, maxsize: int = 256):
+        """
+        Args:
+            db: Database to write to (default: ResultsDatabase())
+            maxsize: Queue bound; submit() blocks while the queue is full
+        """
+        self.db = db or ResultsDatabase()
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, name='AsyncResultWriter', daemon=True)
+        self._thread.start()
+
+    def submit(self, result: BacktestResult, experiment_name: str = 'default') -> None:
+        """Queue a result for saving."""
+        self._raise_error()
+        self._queue.put((result, experiment_name))
+
+    def flush(self) -> None:
+        """
+        Block until every submitted result has been written.
+
+        Raises:
+            Exception: The first error raised while writing
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        self._queue.join()
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> 'AsyncResultWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _drain(self) -> None:
+        """Writer thread: write queued results in per-experiment batches."""
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.BATCH_SIZE:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = items[-1] is None
+            batches = {}
+            for item in items:
+                if item is not None:
+                    batches.setdefault(item[1], []).append(item[0])
+            try:
+                for experiment_name, results in batches.items():
+                    self.db.save_results(results, experiment_name)
+            except Exception as e:
+                logger.error(f"Error writing {len(items)} results: {e}")
+                self._error = self._error or e
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if stop:
+                return
+
+
+class ResultsComparator:
+    """
+    Compare several backtest results.
+    """
+
+    def __init__(self, results: List[BacktestResult]):
+        """
+        Args:
+            results: Results to compare
+        """
+        self.results = results
+
+    def compare_summary(self) -> pd.DataFrame:
+        """
+        Build a table of the headline metrics of every result with stats.
+
+        Returns:
+            DataFrame with one row per result (see BacktestResult.get_summary()),
+            indexed by the result's position in self.results
+        """
+        # One tuple per result, assembled in a single from_records call
+        positions = []
+        rows = []
+        for position, result in enumerate(self.results):
+            if result.stats is not None:
+                positions.append(position)
+                rows.append(result._summary_row())
+        return pd.DataFrame.from_records(rows, columns=SUMMARY_COLUMNS, index=positions)
+
+    def rank_by_metric(self, metric: str = 'Return [%]', ascending: bool = False) -> pd.DataFrame:
+        """
+        Rank results by a metric.
+
+        Args:
+            metric: Summary column to rank by
+            ascending: If True, lower is better
+
+        Returns:
+            Summary DataFrame sorted by metric with a 'Rank' column
+        """
+        comparison = self.compare_summary()
+        if comparison.empty:
+            return comparison
+        ranked = comparison.sort_values(metric, ascending=ascending, ignore_index=True)
+        ranked.insert(0, 'Rank', range(1, len(ranked) + 1))
+        return ranked
+
+    def get_best_result(self, metric: str = 'Return [%]') -> Optional[BacktestResult]:
+        """
+        Get the result with the highest value of a metric.
+
+        Returns:
+            The best result, or None if no result has stats
+        """
+        comparison = self.compare_summary()
+        if comparison.empty:
+            return None
+
+        # The summary is indexed by position in self.results
+        return self.results[comparison[metric].astype(float).idxmax()]
+
+    def compare_equity_curves(self, db: Optional[ResultsDatabase] = None) -> pd.DataFrame:
+        """
+        Align the equity curves of all results that have one.
+
+        Args:
+            db: Optional database to read the curves of results without an
+                in-memory equity curve (e.g. loaded results) from
+
+        Returns:
+            DataFrame with one 'symbol_strategy' column per result
+        """
+        equity_curves = {}
+        stored = {}
+        for result in self.results:
+            key = f"{result.symbol}_{result.strategy_name}"
+            if result.equity is not None:
+                equity_curves[key] = result.equity['Equity']
+            elif db is not None:
+                stored[result.run_id] = key
+
+        if stored:
+            curves = db.load_equity_curves(run_ids=list(stored))
+            for run_id in curves.columns:
+                equity_curves[stored[run_id]] = curves[run_id]
+        return pd.DataFrame(equity_curves)
+
+
+def save_results_batch(
+    results: Dict[str, Dict[str, Any]],
+    experiment_name: str,
+    results_dir: Optional[Union[str, Path]] = None,
+    n_jobs: Optional[int] = 1
+) -> List[str]:
+    """
+    Save the results of run_backtest_multiple_symbols() as one experiment.
+
+    Failed symbols (stats None) are skipped. With n_jobs > 1 the results
+    are split into n_jobs shards written concurrently, one file each.
+    Threads are used rather than processes: Parquet encoding and zstd
+    compression release the GIL, and the stats / equity curves would
+    otherwise have to be pickled over to worker processes.
+
+    Args:
+        results: Dictionary mapping symbol to result dictionary
+        experiment_name: Experiment name
+        results_dir: Optional results directory (default: RESULTS_DIR)
+        n_jobs: Number of writer threads (None: all CPU cores)
+
+    Returns:
+        Paths of the written Parquet files (empty if no result had stats)
+    """
+    pending = [(symbol, r) for symbol, r in results.items() if r.get('stats') is not None]
+    if len(pending) < len(results):
+        skipped = [symbol for symbol, r in results.items() if r.get('stats') is None]
+        logger.warning(f"Skipping {len(skipped)} results without stats: {skipped}")
+
+    batch = [
+        BacktestResult(
+            symbol=symbol,
+            strategy_name=result_dict.get('strategy', 'Unknown'),
+            stats=result_dict['stats'],
+            parameters=result_dict.get('parameters'),
+            equity_curve=result_dict.get('equity_curve'),
+            trades=result_dict.get('trades'),
+        )
+        for symbol, result_dict in pending
+    ]
+
+    if not batch:
+        logger.warning(f"No results with stats to save for experiment {experiment_name}")
+        return []
+
+    db = ResultsDatabase(results_dir)
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(batch))
+    if n_jobs == 1:
+        return [db.save_results(batch, experiment_name)]
+
+    shards = [batch[i::n_jobs] for i in range(n_jobs)]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(lambda shard: db.save_results(shard, experiment_name), shards))
+
+
+def load_experiment_results(
+    experiment_name: str,
+    results_dir: Optional[Union[str, Path]] = None
+) -> List[BacktestResult]:
+    """
+    Load all results of an experiment.
+
+    Args:
+        experiment_name: Experiment name
+        results_dir: Optional results directory (default: RESULTS_DIR)
+
+    Returns:
+        List of results, newest first
+    """
+    return ResultsDatabase(results_dir).load_experiment_results(experiment_name)
@@ -26,6 +26,7 @@ from .db_ingestion import (
     fetch_nasdaq100_tickers,
     insert_nasdaq100_stocks,
     get_last_timestamp_for_symbol,
+    get_last_timestamps,
     get_data_range_for_symbol,
     should_skip_symbol,
     get_effective_start_date,
@@ -51,6 +52,7 @@ __all__ = [
     'fetch_nasdaq100_tickers',
     'insert_nasdaq100_stocks',
     'get_last_timestamp_for_symbol',
+    'get_last_timestamps',
     'get_data_range_for_symbol',
     'should_skip_symbol',
     'get_effective_start_date',
@@ -7,8 +7,10 @@ import os
 import sys
 from pathlib import Path
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -27,8 +29,11 @@ from src.data.db_ingestion import (
     insert_bars_idempotent,
     insert_quotes_idempotent,
     insert_trades_idempotent,
+    BARS_COLUMNS,
+    QUOTES_COLUMNS,
+    TRADES_COLUMNS,
 )
-from src.data.db_connection import test_connection
+from src.data.db_connection import test_connection, get_db_connection
 
 # Load environment variables
 load_dotenv()
@@ -41,10 +46,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_alpaca_client():
+def get_alpaca_client(raw_data: bool = False):
     """
     Initialize and return Alpaca API client.
     
+    Args:
+        raw_data: If True, requests return Alpaca's JSON payload as plain
+                  dicts and lists instead of SDK models (see
+                  prepare_bars_records())
+    
     Returns:
         StockHistoricalDataClient instance
     
@@ -60,12 +70,79 @@ def get_alpaca_client():
             "ALPACA_SECRET_KEY in your .env file"
         )
     
-    client = StockHistoricalDataClient(api_key=api_key, secret_key=secret_key)
+    client = StockHistoricalDataClient(api_key=api_key, secret_key=secret_key, raw_data=raw_data)
     logger.info("Alpaca API client initialized")
     return client
 
 
-def prepare_bars_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str, Any]]:
+# Alpaca's raw bar fields and the bars columns they map to
+_RAW_BARS_FIELDS = {
+    't': 'time', 'o': 'open', 'h': 'high', 'l': 'low',
+    'c': 'close', 'v': 'volume', 'vw': 'vwap',
+}
+
+
+def _normalize_conditions(conditions: pd.Series) -> np.ndarray:
+    """
+    Normalize a conditions column to one list per row.
+    
+    Lists are kept, tuples become lists, missing values become [] and
+    scalars become [scalar]. Rows are classified with one type pass and
+    boolean masks, so the common all-lists response needs no per-row
+    Python conversion.
+    
+    Args:
+        conditions: Conditions column from an Alpaca quotes/trades DataFrame
+    
+    Returns:
+        Object array of lists aligned with conditions
+    """
+    values = conditions.to_numpy(dtype=object)
+    types = np.fromiter(map(type, values), dtype=object, count=len(values))
+    is_list = types == list
+    if is_list.all():
+        return values
+    
+    is_tuple = types == tuple
+    is_na = ~(is_list | is_tuple) & pd.isna(values)
+    is_scalar = ~(is_list | is_tuple | is_na)
+    
+    # Built through a Series so numpy doesn't turn the lists into a 2-D array
+    out = values.copy()
+    if is_tuple.any():
+        out[is_tuple] = pd.Series([list(v) for v in values[is_tuple]], dtype=object).to_numpy()
+    if is_na.any():
+        out[is_na] = pd.Series([[] for _ in range(is_na.sum())], dtype=object).to_numpy()
+    if is_scalar.any():
+        out[is_scalar] = pd.Series([[v] for v in values[is_scalar]], dtype=object).to_numpy()
+    return out
+
+
+def _with_time_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn the timestamp index of an Alpaca .df response into a 'time' column.
+    
+    Only the timestamp level is read (the symbol is already known from the
+    stock_id), on a shallow copy, so the frame is not copied wholesale like
+    reset_index() would and the caller's DataFrame is left untouched.
+    
+    Args:
+        df: DataFrame from Alpaca API response (.df), indexed by
+            [symbol, timestamp] or by timestamp
+    
+    Returns:
+        Shallow copy of df with a RangeIndex and a 'time' column
+    """
+    index = df.index
+    times = index.get_level_values(-1) if isinstance(index, pd.MultiIndex) else index
+    
+    df = df.copy(deep=False)
+    df.reset_index(drop=True, inplace=True)
+    df['time'] = times
+    return df
+
+
+def prepare_bars_dataframe(df: pd.DataFrame, stock_id: int) -> pd.DataFrame:
     """
     Prepare bars DataFrame for database insertion.
     
@@ -74,38 +151,56 @@ def prepare_bars_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str, An
         stock_id: Stock ID from database
     
     Returns:
-        List of dictionaries for database insertion
+        DataFrame with the BARS_COLUMNS columns, in insert order
     """
     if df.empty:
-        return []
+        return pd.DataFrame(columns=BARS_COLUMNS)
     
-    # Reset index to get symbol and timestamp as columns (MultiIndex: [symbol, timestamp])
-    # If MultiIndex, reset both levels; otherwise just reset
-    if isinstance(df.index, pd.MultiIndex):
-        df = df.reset_index(level=[0, 1])
-    else:
-        df = df.reset_index()
+    # Timestamp index level becomes the time column (trade_count and any
+    # other extra columns are dropped by the final column selection)
+    df = _with_time_column(df)
     
-    # Drop symbol column if present (we use stock_id instead)
-    if 'symbol' in df.columns:
-        df = df.drop('symbol', axis=1)
+    # Add stock_id column (INTEGER in the schema)
+    df['stock_id'] = np.int32(stock_id)
     
-    # Drop trade_count if present (not in our schema)
-    if 'trade_count' in df.columns:
-        df = df.drop('trade_count', axis=1)
+    # Alpaca reports volume as float64; whole share counts downcast
+    # losslessly to the smallest unsigned integer type. Prices stay float64:
+    # float32 cannot hold NUMERIC(18, 4) prices above ~1000 exactly.
+    df['volume'] = pd.to_numeric(df['volume'], downcast='unsigned')
     
-    # Rename timestamp to time
-    if 'timestamp' in df.columns:
-        df = df.rename(columns={'timestamp': 'time'})
+    # Select the insert columns in order
+    return df[BARS_COLUMNS]
+
+
+def prepare_bars_records(records: List[Dict[str, Any]], stock_id: int) -> pd.DataFrame:
+    """
+    Prepare raw bars JSON records for database insertion.
     
-    # Add stock_id column
-    df['stock_id'] = stock_id
+    Used for raw JSON bars (iter_bars_pages() or a raw_data client): the
+    records are read straight into one flat DataFrame, skipping the per-bar
+    SDK models and the (symbol, timestamp) MultiIndex that .df builds and
+    prepare_bars_dataframe() takes apart again.
     
-    # Convert to list of dictionaries
-    return df.to_dict('records')
+    Args:
+        records: One symbol's bars as returned by Alpaca (keys t, o, h, l, c, v, n, vw)
+        stock_id: Stock ID from database
+    
+    Returns:
+        DataFrame with the BARS_COLUMNS columns, in insert order
+    """
+    if not records:
+        return pd.DataFrame(columns=BARS_COLUMNS)
+    
+    df = pd.DataFrame.from_records(records, columns=list(_RAW_BARS_FIELDS))
+    df = df.rename(columns=_RAW_BARS_FIELDS)
+    df['time'] = pd.to_datetime(df['time'], utc=True, format='ISO8601')
+    df['stock_id'] = np.int32(stock_id)
+    df['volume'] = pd.to_numeric(df['volume'], downcast='unsigned')
+    
+    return df[BARS_COLUMNS]
 
 
-def prepare_quotes_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str, Any]]:
+def prepare_quotes_dataframe(df: pd.DataFrame, stock_id: int) -> pd.DataFrame:
     """
     Prepare quotes DataFrame for database insertion.
     
@@ -114,41 +209,28 @@ def prepare_quotes_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str,
         stock_id: Stock ID from database
     
     Returns:
-        List of dictionaries for database insertion
+        DataFrame with the QUOTES_COLUMNS columns, in insert order
     """
     if df.empty:
-        return []
-    
-    # Reset index to get symbol and timestamp as columns (MultiIndex: [symbol, timestamp])
-    if isinstance(df.index, pd.MultiIndex):
-        df = df.reset_index(level=[0, 1])
-    else:
-        df = df.reset_index()
-    
-    # Drop symbol column if present
-    if 'symbol' in df.columns:
-        df = df.drop('symbol', axis=1)
+        return pd.DataFrame(columns=QUOTES_COLUMNS)
     
-    # Rename timestamp to time
-    if 'timestamp' in df.columns:
-        df = df.rename(columns={'timestamp': 'time'})
+    # Timestamp index level becomes the time column
+    df = _with_time_column(df)
     
     # Handle conditions column - convert to list if it's not already
     if 'conditions' in df.columns:
-        df['conditions'] = df['conditions'].apply(
-            lambda x: list(x) if isinstance(x, (list, tuple)) else ([x] if pd.notna(x) else [])
-        )
+        df['conditions'] = _normalize_conditions(df['conditions'])
     else:
         df['conditions'] = [[]] * len(df)
     
     # Add stock_id column
     df['stock_id'] = stock_id
     
-    # Convert to list of dictionaries
-    return df.to_dict('records')
+    # Select the insert columns in order
+    return df[QUOTES_COLUMNS]
 
 
-def prepare_trades_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str, Any]]:
+def prepare_trades_dataframe(df: pd.DataFrame, stock_id: int) -> pd.DataFrame:
     """
     Prepare trades DataFrame for database insertion.
     
@@ -157,37 +239,24 @@ def prepare_trades_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str,
         stock_id: Stock ID from database
     
     Returns:
-        List of dictionaries for database insertion
+        DataFrame with the TRADES_COLUMNS columns, in insert order
     """
     if df.empty:
-        return []
-    
-    # Reset index to get symbol and timestamp as columns (MultiIndex: [symbol, timestamp])
-    if isinstance(df.index, pd.MultiIndex):
-        df = df.reset_index(level=[0, 1])
-    else:
-        df = df.reset_index()
+        return pd.DataFrame(columns=TRADES_COLUMNS)
     
-    # Drop symbol column if present
-    if 'symbol' in df.columns:
-        df = df.drop('symbol', axis=1)
-    
-    # Rename timestamp to time
-    if 'timestamp' in df.columns:
-        df = df.rename(columns={'timestamp': 'time'})
+    # Timestamp index level becomes the time column
+    df = _with_time_column(df)
     
     # Rename id to trade_id
     if 'id' in df.columns:
         df = df.rename(columns={'id': 'trade_id'})
     elif 'trade_id' not in df.columns:
         logger.warning("No trade_id column found in trades DataFrame")
-        return []
+        return pd.DataFrame(columns=TRADES_COLUMNS)
     
     # Handle conditions column - convert to list if it's not already
     if 'conditions' in df.columns:
-        df['conditions'] = df['conditions'].apply(
-            lambda x: list(x) if isinstance(x, (list, tuple)) else ([x] if pd.notna(x) else [])
-        )
+        df['conditions'] = _normalize_conditions(df['conditions'])
     else:
         df['conditions'] = [[]] * len(df)
     
@@ -197,8 +266,8 @@ def prepare_trades_dataframe(df: pd.DataFrame, stock_id: int) -> List[Dict[str,
     # Filter out rows with None trade_id
     df = df[df['trade_id'].notna()]
     
-    # Convert to list of dictionaries
-    return df.to_dict('records')
+    # Select the insert columns in order
+    return df[TRADES_COLUMNS]
 
 
 def ingest_bars_for_symbol(
@@ -241,12 +310,12 @@ def ingest_bars_for_symbol(
             
             # If effective start is after end_date, nothing to ingest
             if effective_start >= end_date:
-                logger.info(f"Symbol {symbol} already has complete bars data up to {end_date}")
+                logger.info("Symbol %s already has complete bars data up to %s", symbol, end_date)
                 return 0
             
             start_date = effective_start
         
-        logger.info(f"Fetching bars for {symbol} from {start_date.date()} to {end_date.date()}")
+        logger.info("Fetching bars for %s from %s to %s", symbol, start_date.date(), end_date.date())
         
         request = StockBarsRequest(
             symbol_or_symbols=symbol,
@@ -259,25 +328,210 @@ def ingest_bars_for_symbol(
         bars_df = client.get_stock_bars(request).df
         
         if bars_df.empty:
-            logger.warning(f"No bars data found for {symbol}")
+            logger.warning("No bars data found for %s", symbol)
             return 0
         
         # Prepare data for database insertion
         bars_data = prepare_bars_dataframe(bars_df, stock_id)
         
-        if bars_data:
+        if not bars_data.empty:
             inserted_count = insert_bars_idempotent(bars_data)
-            logger.info(f"Inserted {inserted_count} bars for {symbol}")
+            logger.info("Inserted %s bars for %s", inserted_count, symbol)
             return inserted_count
         else:
-            logger.warning(f"No bars data to insert for {symbol}")
+            logger.warning("No bars data to insert for %s", symbol)
             return 0
             
     except Exception as e:
-        logger.error(f"Error ingesting bars for {symbol}: {e}")
+        logger.error("Error ingesting bars for %s: %s", symbol, e)
         raise
 
 
+def iter_bars_pages(
+    client: StockHistoricalDataClient,
+    request: StockBarsRequest,
+    page_size: int = 10_000
+) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Fetch bars one page at a time, following Alpaca's next_page_token.
+    
+    client.get_stock_bars() collects every page before returning; reading
+    the endpoint through the client's own get() instead (same credentials
+    and retries) lets callers insert and drop each page before the next
+    arrives.
+    
+    Args:
+        client: Alpaca API client
+        request: Bars request (symbols, timeframe and date range)
+        page_size: Maximum number of bars per page
+    
+    Yields:
+        Raw JSON bars of one page, keyed by symbol (see prepare_bars_records())
+    """
+    params = request.to_request_fields()
+    params['limit'] = page_size
+    
+    while True:
+        response = client.get('/stocks/bars', params)
+        yield response.get('bars') or {}
+        
+        page_token = response.get('next_page_token')
+        if not page_token:
+            return
+        params['page_token'] = page_token
+
+
+def ingest_bars_for_symbols(
+    client: StockHistoricalDataClient,
+    stock_ids: Dict[str, int],
+    start_date: datetime,
+    end_date: datetime,
+    timeframe: TimeFrame = TimeFrame(1, TimeFrameUnit.Minute),
+    check_existing: bool = True,
+    batch_size: int = 50,
+    max_concurrent_requests: int = 4,
+    max_insert_workers: int = 4,
+    page_size: int = 10_000,
+) -> Dict[str, int]:
+    """
+    Ingest bars data for many symbols with multi-symbol API requests.
+    
+    Symbols are grouped by their effective start date (so symbols that are
+    already partly ingested only fetch the missing range) and each group is
+    fetched with one StockBarsRequest per batch_size symbols. Up to
+    max_concurrent_requests requests are in flight at once (the SDK client
+    is synchronous, so they run on threads).
+    
+    Each request is read page by page (see iter_bars_pages()) and every page
+    is inserted before the one after next is fetched, so at most two pages
+    per request are held in memory however long the date range is. A page's
+    symbols are split into up to max_insert_workers groups, inserted
+    concurrently; each group runs on its own pooled connection in a single
+    transaction, so a page costs one commit per group rather than one per
+    symbol.
+    
+    Args:
+        client: Alpaca API client
+        stock_ids: Dictionary mapping symbol to stock ID from database
+        start_date: Start date for data retrieval
+        end_date: End date for data retrieval
+        timeframe: Timeframe for bars (default: 1 minute)
+        check_existing: If True, check existing data and skip if already complete
+        batch_size: Maximum number of symbols per API request
+        max_concurrent_requests: Maximum number of API requests in flight
+        max_insert_workers: Maximum number of insert groups (transactions)
+                            running concurrently; each holds one pooled
+                            connection, so this must stay within the pool size
+        page_size: Maximum number of bars per page
+    
+    Returns:
+        Dictionary mapping symbol to number of bars inserted. Symbols whose
+        batch failed are missing from the result.
+    """
+    from src.data.db_ingestion import (
+        should_skip_symbol,
+        get_effective_start_date,
+        get_last_timestamps
+    )
+    
+    inserted = {}
+    
+    # One aggregate query for every symbol's last bar instead of two per symbol
+    last_timestamps = get_last_timestamps('bars') if check_existing else None
+    
+    # Group symbols by the date their fetch has to start from
+    groups: Dict[datetime, List[str]] = {}
+    for symbol in stock_ids:
+        symbol_start = start_date
+        if check_existing:
+            if should_skip_symbol(symbol, end_date, table='bars', last_timestamps=last_timestamps):
+                inserted[symbol] = 0
+                continue
+            
+            symbol_start = get_effective_start_date(
+                symbol, start_date, table='bars', last_timestamps=last_timestamps
+            )
+            if symbol_start >= end_date:
+                logger.info("Symbol %s already has complete bars data up to %s", symbol, end_date)
+                inserted[symbol] = 0
+                continue
+        
+        groups.setdefault(symbol_start, []).append(symbol)
+    
+    batches = [
+        (group_start, group_symbols[i:i + batch_size])
+        for group_start, group_symbols in groups.items()
+        for i in range(0, len(group_symbols), batch_size)
+    ]
+    if not batches:
+        return inserted
+    
+    def insert(group: List[tuple]) -> Dict[str, int]:
+        # One connection and one commit for the whole group of symbols
+        counts = {}
+        with get_db_connection() as conn:
+            for symbol, records in group:
+                bars_data = prepare_bars_records(records, stock_ids[symbol])
+                counts[symbol] = insert_bars_idempotent(bars_data, conn=conn)
+            conn.commit()
+        return counts
+    
+    def ingest_batch(batch_start: datetime, batch: List[str]) -> Dict[str, int]:
+        logger.info(
+            "Fetching bars for %s symbols from %s to %s",
+            len(batch), batch_start.date(), end_date.date()
+        )
+        request = StockBarsRequest(
+            symbol_or_symbols=batch,
+            timeframe=timeframe,
+            start=batch_start,
+            end=end_date,
+        )
+        
+        counts = {}
+        previous = []
+        for page in iter_bars_pages(client, request, page_size):
+            # Spread the page's symbols over the insert workers, one
+            # transaction per group instead of one per symbol
+            pending = [(symbol, records) for symbol, records in page.items() if records]
+            current = [
+                insert_executor.submit(insert, pending[i::max_insert_workers])
+                for i in range(min(max_insert_workers, len(pending)))
+            ]
+            # The next page is fetched while this page's inserts run
+            for future in previous:
+                for symbol, count in future.result().items():
+                    counts[symbol] = counts.get(symbol, 0) + count
+            previous = current
+        for future in previous:
+            for symbol, count in future.result().items():
+                counts[symbol] = counts.get(symbol, 0) + count
+        
+        for symbol in batch:
+            if symbol in counts:
+                logger.info("Inserted %s bars for %s", counts[symbol], symbol)
+            else:
+                logger.warning("No bars data found for %s", symbol)
+                counts[symbol] = 0
+        return counts
+    
+    # Copy-on-Write lets the column selections and shallow copies in the
+    # prepare/insert steps share the page's buffers instead of copying
+    with pd.option_context('mode.copy_on_write', True), \
+            ThreadPoolExecutor(max_workers=min(max_concurrent_requests, len(batches))) as fetch_executor, \
+            ThreadPoolExecutor(max_workers=max_insert_workers) as insert_executor:
+        futures = {fetch_executor.submit(ingest_batch, *batch): batch[1] for batch in batches}
+        
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                inserted.update(future.result())
+            except Exception as e:
+                logger.error("Error ingesting bars for %s: %s", batch, e)
+    
+    return inserted
+
+
 def ingest_quotes_for_symbol(
     client: StockHistoricalDataClient,
     symbol: str,
@@ -315,12 +569,12 @@ def ingest_quotes_for_symbol(
             effective_start = get_effective_start_date(symbol, start_date, table='quotes')
             
             if effective_start >= end_date:
-                logger.info(f"Symbol {symbol} already has complete quotes data up to {end_date}")
+                logger.info("Symbol %s already has complete quotes data up to %s", symbol, end_date)
                 return 0
             
             start_date = effective_start
         
-        logger.info(f"Fetching quotes for {symbol} from {start_date.date()} to {end_date.date()}")
+        logger.info("Fetching quotes for %s from %s to %s", symbol, start_date.date(), end_date.date())
         
         request = StockQuotesRequest(
             symbol_or_symbols=symbol,
@@ -332,22 +586,22 @@ def ingest_quotes_for_symbol(
         quotes_df = client.get_stock_quotes(request).df
         
         if quotes_df.empty:
-            logger.warning(f"No quotes data found for {symbol}")
+            logger.warning("No quotes data found for %s", symbol)
             return 0
         
         # Prepare data for database insertion
         quotes_data = prepare_quotes_dataframe(quotes_df, stock_id)
         
-        if quotes_data:
+        if not quotes_data.empty:
             inserted_count = insert_quotes_idempotent(quotes_data)
-            logger.info(f"Inserted {inserted_count} quotes for {symbol}")
+            logger.info("Inserted %s quotes for %s", inserted_count, symbol)
             return inserted_count
         else:
-            logger.warning(f"No quotes data to insert for {symbol}")
+            logger.warning("No quotes data to insert for %s", symbol)
             return 0
             
     except Exception as e:
-        logger.error(f"Error ingesting quotes for {symbol}: {e}")
+        logger.error("Error ingesting quotes for %s: %s", symbol, e)
         raise
 
 
@@ -388,12 +642,12 @@ def ingest_trades_for_symbol(
             effective_start = get_effective_start_date(symbol, start_date, table='trades')
             
             if effective_start >= end_date:
-                logger.info(f"Symbol {symbol} already has complete trades data up to {end_date}")
+                logger.info("Symbol %s already has complete trades data up to %s", symbol, end_date)
                 return 0
             
             start_date = effective_start
         
-        logger.info(f"Fetching trades for {symbol} from {start_date.date()} to {end_date.date()}")
+        logger.info("Fetching trades for %s from %s to %s", symbol, start_date.date(), end_date.date())
         
         request = StockTradesRequest(
             symbol_or_symbols=symbol,
@@ -405,22 +659,22 @@ def ingest_trades_for_symbol(
         trades_df = client.get_stock_trades(request).df
         
         if trades_df.empty:
-            logger.warning(f"No trades data found for {symbol}")
+            logger.warning("No trades data found for %s", symbol)
             return 0
         
         # Prepare data for database insertion
         trades_data = prepare_trades_dataframe(trades_df, stock_id)
         
-        if trades_data:
+        if not trades_data.empty:
             inserted_count = insert_trades_idempotent(trades_data)
-            logger.info(f"Inserted {inserted_count} trades for {symbol}")
+            logger.info("Inserted %s trades for %s", inserted_count, symbol)
             return inserted_count
         else:
-            logger.warning(f"No trades data to insert for {symbol}")
+            logger.warning("No trades data to insert for %s", symbol)
             return 0
             
     except Exception as e:
-        logger.error(f"Error ingesting trades for {symbol}: {e}")
+        logger.error("Error ingesting trades for %s: %s", symbol, e)
         raise
 
 
@@ -489,45 +743,34 @@ def main(
     logger.info(f"Timeframe: 1 minute")
     logger.info("Note: Will check existing data and skip symbols that are already up-to-date")
     
-    total_bars = 0
     total_quotes = 0
     total_trades = 0
-    skipped_symbols = 0
     
-    for i, symbol in enumerate(symbols, 1):
-        stock_id = stock_ids.get(symbol)
-        if stock_id is None:
-            logger.warning(f"Stock ID not found for {symbol}, skipping...")
-            continue
-        
-        logger.info(f"\n[{i}/{len(symbols)}] Processing {symbol} (ID: {stock_id})...")
-        
-        try:
-            # Ingest bars (with existing data check)
-            bars_count = ingest_bars_for_symbol(
-                client, symbol, stock_id, start_dt, end_dt, 
-                TimeFrame(1, TimeFrameUnit.Minute), check_existing=True
-            )
-            total_bars += bars_count
-            
-            if bars_count == 0:
-                skipped_symbols += 1
-            
-            # Ingest quotes
-            # quotes_count = ingest_quotes_for_symbol(
-            #     client, symbol, stock_id, start_dt, end_dt
-            # )
-            # total_quotes += quotes_count
-            
-            # Ingest trades
-            # trades_count = ingest_trades_for_symbol(
-            #     client, symbol, stock_id, start_dt, end_dt
-            # )
-            # total_trades += trades_count
-            
-        except Exception as e:
-            logger.error(f"Error processing {symbol}: {e}")
-            continue
+    missing = [symbol for symbol in symbols if stock_ids.get(symbol) is None]
+    for symbol in missing:
+        logger.warning("Stock ID not found for %s, skipping...", symbol)
+    symbol_ids = {symbol: stock_ids[symbol] for symbol in symbols if symbol not in missing}
+    
+    # Ingest bars for all symbols with batched multi-symbol requests
+    # (with existing data check)
+    bars_counts = ingest_bars_for_symbols(
+        client, symbol_ids, start_dt, end_dt,
+        TimeFrame(1, TimeFrameUnit.Minute), check_existing=True
+    )
+    total_bars = sum(bars_counts.values())
+    skipped_symbols = sum(1 for count in bars_counts.values() if count == 0)
+    
+    # Quotes and trades (disabled) are still fetched per symbol
+    # for symbol, stock_id in symbol_ids.items():
+    #     try:
+    #         total_quotes += ingest_quotes_for_symbol(
+    #             client, symbol, stock_id, start_dt, end_dt
+    #         )
+    #         total_trades += ingest_trades_for_symbol(
+    #             client, symbol, stock_id, start_dt, end_dt
+    #         )
+    #     except Exception as e:
+    #         logger.error(f"Error processing {symbol}: {e}")
     
     # Summary
     logger.info("\n" + "=" * 60)
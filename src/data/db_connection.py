@@ -6,6 +6,7 @@ Handles connection to TimescaleDB with retry logic and connection pooling.
 import os
 import time
 import logging
+import threading
 from typing import Optional
 from contextlib import contextmanager
 
@@ -32,12 +33,16 @@ DB_CONFIG = {
 
 # Connection pool (initialized on first use)
 _connection_pool: Optional[pool.ThreadedConnectionPool] = None
+_connection_pool_lock = threading.Lock()
 
 
 def get_connection_pool(min_conn: int = 1, max_conn: int = 10) -> pool.ThreadedConnectionPool:
     """
     Get or create a connection pool.
     
+    The lock is only taken until the pool exists, so concurrent ingestion
+    threads cannot create two pools and later calls stay lock-free.
+    
     Args:
         min_conn: Minimum number of connections in the pool
         max_conn: Maximum number of connections in the pool
@@ -48,26 +53,34 @@ def get_connection_pool(min_conn: int = 1, max_conn: int = 10) -> pool.ThreadedC
     global _connection_pool
     
     if _connection_pool is None:
-        try:
-            _connection_pool = pool.ThreadedConnectionPool(
-                min_conn, max_conn,
-                **DB_CONFIG
-            )
-            logger.info("Connection pool created successfully")
-        except Exception as e:
-            logger.error(f"Error creating connection pool: {e}")
-            raise
+        with _connection_pool_lock:
+            if _connection_pool is None:
+                try:
+                    _connection_pool = pool.ThreadedConnectionPool(
+                        min_conn, max_conn,
+                        **DB_CONFIG
+                    )
+                    logger.info("Connection pool created successfully")
+                except Exception as e:
+                    logger.error(f"Error creating connection pool: {e}")
+                    raise
     
     return _connection_pool
 
 
-def get_connection(max_retries: int = 3, retry_delay: float = 1.0):
+def get_connection(max_retries: int = 3, retry_delay: float = 1.0, validate: bool = False):
     """
     Get a database connection from the pool with retry logic.
     
+    Connections the pool hands back already closed are discarded. A
+    connection that broke server-side is only detected by psycopg2 on
+    use, so pass validate=True to probe it with a query first (one extra
+    round-trip per checkout).
+    
     Args:
         max_retries: Maximum number of retry attempts
         retry_delay: Delay between retries in seconds
+        validate: Run SELECT 1 on the connection before returning it
     
     Returns:
         psycopg2 connection object
@@ -81,10 +94,14 @@ def get_connection(max_retries: int = 3, retry_delay: float = 1.0):
         try:
             conn = pool.getconn()
             if conn:
-                # Test the connection
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                cursor.close()
+                if conn.closed != 0:
+                    logger.warning(f"Discarding closed connection (attempt {attempt + 1})")
+                    pool.putconn(conn, close=True)
+                    continue
+                if validate:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT 1")
+                    cursor.close()
                 return conn
         except Exception as e:
             logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
@@ -5,98 +5,234 @@ Uses ON CONFLICT to prevent duplicate data when re-running ingestion.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+import weakref
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 from io import StringIO
 
 import pandas as pd
 import requests
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.extras import execute_values
 
 from .db_connection import get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement sent by execute_values
+INSERT_PAGE_SIZE = 1000
 
-def insert_bars_idempotent(bars_data: List[Dict[str, Any]]) -> int:
+# Column order of rows written by insert_*_idempotent()
+BARS_COLUMNS = ['stock_id', 'time', 'open', 'high', 'low', 'close', 'volume', 'vwap']
+QUOTES_COLUMNS = [
+    'stock_id', 'time', 'bid_price', 'bid_size', 'bid_exchange',
+    'ask_price', 'ask_size', 'ask_exchange', 'conditions', 'tape',
+]
+TRADES_COLUMNS = [
+    'stock_id', 'trade_id', 'time', 'price', 'size', 'conditions', 'exchange', 'tape',
+]
+
+# Connections whose bars staging table and prepared bars_ins statement are
+# known to be committed (both live as long as the session)
+_bars_prepared_connections = weakref.WeakSet()
+
+
+def insert_bars_idempotent(
+    bars_data: Union[List[Dict[str, Any]], pd.DataFrame],
+    conn=None
+) -> int:
     """
     Insert bars data idempotently.
     If a bar with the same (time, stock_id) already exists, it will be skipped.
     
+    Bars are streamed with COPY into a session-local staging table and moved
+    into trading.bars with a single prepared INSERT ... SELECT ... ON
+    CONFLICT DO NOTHING, which is much faster than row-wise INSERTs for
+    minute bars.
+    
     Args:
-        bars_data: List of dictionaries with keys: stock_id, time, open, high, low, close, volume, vwap
+        bars_data: DataFrame (or list of dictionaries) with columns: stock_id, time,
+                   open, high, low, close, volume, vwap
+        conn: Optional connection whose transaction the insert joins; the
+              caller commits it. By default a pooled connection is used and
+              committed.
     
     Returns:
         Number of rows inserted (excluding conflicts)
     """
-    if not bars_data:
+    if len(bars_data) == 0:
         return 0
     
+    df = bars_data if isinstance(bars_data, pd.DataFrame) else pd.DataFrame(bars_data)
+    df = df[BARS_COLUMNS]
+    # Integer columns are written as integers (volume is BIGINT); already
+    # integer (e.g. downcast) columns are left as they are
+    casts = {c: 'int64' for c in ('stock_id', 'volume') if not pd.api.types.is_integer_dtype(df[c])}
+    if casts:
+        df = df.astype(casts)
+    # Times are staged as int64 epoch microseconds: COPY writes plain
+    # integers instead of formatting one timestamp string per row
+    df = df.assign(time=_epoch_microseconds(df['time']))
+    columns = ', '.join(BARS_COLUMNS)
+    caller_transaction = conn is not None
+    
     try:
-        with get_db_connection() as conn:
+        with _transaction(conn) as conn:
             cursor = conn.cursor()
+            _prepare_bars_insert(conn, cursor)
             
-            insert_query = """
-                INSERT INTO trading.bars (stock_id, time, open, high, low, close, volume, vwap)
-                VALUES (%(stock_id)s, %(time)s, %(open)s, %(high)s, %(low)s, %(close)s, %(volume)s, %(vwap)s)
-                ON CONFLICT (time, stock_id) DO NOTHING
-            """
+            buffer = StringIO()
+            df.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY _bars_stage ({columns}) FROM STDIN WITH (FORMAT CSV)", buffer)
             
-            cursor.executemany(insert_query, bars_data)
+            cursor.execute("EXECUTE bars_ins")
             rows_inserted = cursor.rowcount
-            conn.commit()
+            if caller_transaction:
+                # Staged rows are otherwise only cleared by the caller's commit
+                cursor.execute("TRUNCATE _bars_stage")
             
-            logger.info(f"Inserted {rows_inserted} bars (skipped duplicates)")
+            logger.info("Inserted %s bars (skipped duplicates)", rows_inserted)
             return rows_inserted
     except Exception as e:
-        logger.error(f"Error inserting bars: {e}")
+        logger.error("Error inserting bars: %s", e)
         raise
 
 
-def insert_quotes_idempotent(quotes_data: List[Dict[str, Any]]) -> int:
+def _prepare_bars_insert(conn, cursor) -> None:
+    """
+    Create the bars staging table and prepare its INSERT once per connection.
+    
+    Temp tables and prepared statements are per session, so concurrent
+    ingestions on other pooled connections never share a staging table, and
+    later batches on this connection skip parsing and planning the INSERT.
+    
+    On an idle connection the setup is committed right away, so a failed
+    batch cannot roll the staging table back from under the prepared
+    statement. Inside a caller's transaction it runs in a savepoint and is
+    never committed here; the connection is only remembered once a later
+    call finds the setup in place outside a transaction (i.e. the caller
+    committed it). If the caller rolls back, the next call sets it up again.
+    """
+    if conn in _bars_prepared_connections:
+        return
+    
+    idle = conn.info.transaction_status == TRANSACTION_STATUS_IDLE
+    cursor.execute("""
+        SELECT to_regclass('pg_temp._bars_stage') IS NOT NULL,
+               EXISTS (SELECT 1 FROM pg_prepared_statements WHERE name = 'bars_ins')
+    """)
+    table_exists, statement_exists = cursor.fetchone()
+    
+    if not table_exists:
+        if not idle:
+            cursor.execute("SAVEPOINT _bars_setup")
+        try:
+            cursor.execute("""
+                CREATE TEMP TABLE _bars_stage
+                (LIKE trading.bars) ON COMMIT DELETE ROWS
+            """)
+            cursor.execute("ALTER TABLE _bars_stage ALTER COLUMN time TYPE BIGINT USING NULL")
+            # Prepared statements survive a rollback; one left over from a
+            # rolled back setup refers to a staging table that is gone
+            if statement_exists:
+                cursor.execute("DEALLOCATE bars_ins")
+            _prepare_bars_statement(cursor)
+        except Exception:
+            if not idle:
+                cursor.execute("ROLLBACK TO SAVEPOINT _bars_setup")
+            raise
+        if idle:
+            conn.commit()
+        else:
+            cursor.execute("RELEASE SAVEPOINT _bars_setup")
+    elif not statement_exists:
+        _prepare_bars_statement(cursor)
+    
+    if idle:
+        _bars_prepared_connections.add(conn)
+
+
+def _prepare_bars_statement(cursor) -> None:
+    """Prepare bars_ins, which moves the staged rows into trading.bars."""
+    columns = ', '.join(BARS_COLUMNS)
+    # Same columns as trading.bars except time, which holds epoch microseconds
+    selected = ', '.join(
+        "timestamptz 'epoch' + time * interval '1 microsecond'" if column == 'time' else column
+        for column in BARS_COLUMNS
+    )
+    cursor.execute(f"""
+        PREPARE bars_ins AS
+        INSERT INTO trading.bars ({columns})
+        SELECT {selected} FROM _bars_stage
+        ON CONFLICT (time, stock_id) DO NOTHING
+    """)
+
+
+def _epoch_microseconds(times: pd.Series) -> pd.Series:
+    """
+    Convert a time column to int64 microseconds since the Unix epoch (UTC).
+    
+    Timezone-naive datetimes are taken to be UTC; anything that is not a
+    datetime column (e.g. ISO strings) is parsed first.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(times):
+        times = pd.to_datetime(times, utc=True)
+    return times.dt.as_unit('us').astype('int64')
+
+
+def insert_quotes_idempotent(
+    quotes_data: Union[List[Dict[str, Any]], pd.DataFrame],
+    conn=None
+) -> int:
     """
     Insert quotes data idempotently.
     If a quote with the same (time, stock_id, bid_price, bid_size, ask_price, ask_size, 
     bid_exchange, ask_exchange, tape) already exists, it will be skipped.
     
     Args:
-        quotes_data: List of dictionaries with keys: stock_id, time, bid_price, bid_size,
-                    bid_exchange, ask_price, ask_size, ask_exchange, conditions, tape
+        quotes_data: DataFrame (or list of dictionaries) with columns: stock_id, time,
+                    bid_price, bid_size, bid_exchange, ask_price, ask_size,
+                    ask_exchange, conditions, tape
+        conn: Optional connection whose transaction the insert joins; the
+              caller commits it. By default a pooled connection is used and
+              committed.
     
     Returns:
         Number of rows inserted (excluding conflicts)
     """
-    if not quotes_data:
+    if len(quotes_data) == 0:
         return 0
     
     try:
-        with get_db_connection() as conn:
+        with _transaction(conn) as conn:
             cursor = conn.cursor()
             
-            insert_query = """
-                INSERT INTO trading.quotes (
-                    stock_id, time, bid_price, bid_size, bid_exchange,
-                    ask_price, ask_size, ask_exchange, conditions, tape
-                )
-                VALUES (
-                    %(stock_id)s, %(time)s, %(bid_price)s, %(bid_size)s, %(bid_exchange)s,
-                    %(ask_price)s, %(ask_size)s, %(ask_exchange)s, %(conditions)s, %(tape)s
-                )
+            insert_query = f"""
+                INSERT INTO trading.quotes ({', '.join(QUOTES_COLUMNS)})
+                VALUES %s
                 ON CONFLICT (time, stock_id, bid_price, bid_size, ask_price, ask_size, 
                             bid_exchange, ask_exchange, tape) DO NOTHING
+                RETURNING 1
             """
             
-            cursor.executemany(insert_query, quotes_data)
-            rows_inserted = cursor.rowcount
-            conn.commit()
+            rows_inserted = len(execute_values(
+                cursor, insert_query, _iter_rows(quotes_data, QUOTES_COLUMNS),
+                page_size=INSERT_PAGE_SIZE, fetch=True
+            ))
             
-            logger.info(f"Inserted {rows_inserted} quotes (skipped duplicates)")
+            logger.info("Inserted %s quotes (skipped duplicates)", rows_inserted)
             return rows_inserted
     except Exception as e:
-        logger.error(f"Error inserting quotes: {e}")
+        logger.error("Error inserting quotes: %s", e)
         raise
 
 
-def insert_trades_idempotent(trades_data: List[Dict[str, Any]]) -> int:
+def insert_trades_idempotent(
+    trades_data: Union[List[Dict[str, Any]], pd.DataFrame],
+    conn=None
+) -> int:
     """
     Insert trades data idempotently.
     If a trade with the same (time, stock_id, trade_id) already exists, it will be skipped.
@@ -104,41 +240,70 @@ def insert_trades_idempotent(trades_data: List[Dict[str, Any]]) -> int:
     t (time), x (exchange), z (tape)
     
     Args:
-        trades_data: List of dictionaries with keys: stock_id, trade_id, time, price, size,
-                    conditions, exchange, tape
+        trades_data: DataFrame (or list of dictionaries) with columns: stock_id, trade_id,
+                    time, price, size, conditions, exchange, tape
+        conn: Optional connection whose transaction the insert joins; the
+              caller commits it. By default a pooled connection is used and
+              committed.
     
     Returns:
         Number of rows inserted (excluding conflicts)
     """
-    if not trades_data:
+    if len(trades_data) == 0:
         return 0
     
     try:
-        with get_db_connection() as conn:
+        with _transaction(conn) as conn:
             cursor = conn.cursor()
             
-            insert_query = """
-                INSERT INTO trading.trades (
-                    stock_id, trade_id, time, price, size, conditions, exchange, tape
-                )
-                VALUES (
-                    %(stock_id)s, %(trade_id)s, %(time)s, %(price)s, %(size)s,
-                    %(conditions)s, %(exchange)s, %(tape)s
-                )
+            insert_query = f"""
+                INSERT INTO trading.trades ({', '.join(TRADES_COLUMNS)})
+                VALUES %s
                 ON CONFLICT (time, stock_id, trade_id) DO NOTHING
+                RETURNING 1
             """
             
-            cursor.executemany(insert_query, trades_data)
-            rows_inserted = cursor.rowcount
-            conn.commit()
+            rows_inserted = len(execute_values(
+                cursor, insert_query, _iter_rows(trades_data, TRADES_COLUMNS),
+                page_size=INSERT_PAGE_SIZE, fetch=True
+            ))
             
-            logger.info(f"Inserted {rows_inserted} trades (skipped duplicates)")
+            logger.info("Inserted %s trades (skipped duplicates)", rows_inserted)
             return rows_inserted
     except Exception as e:
-        logger.error(f"Error inserting trades: {e}")
+        logger.error("Error inserting trades: %s", e)
         raise
 
 
+@contextmanager
+def _transaction(conn=None):
+    """
+    Yield conn as is, or a pooled connection that is committed on success.
+    
+    Lets the insert functions join a caller's transaction (the caller
+    commits) or run in their own.
+    """
+    if conn is not None:
+        yield conn
+        return
+    
+    with get_db_connection() as conn:
+        yield conn
+        conn.commit()
+
+
+def _iter_rows(data: Union[List[Dict[str, Any]], pd.DataFrame], columns: List[str]):
+    """
+    Iterate rows as plain tuples in the given column order.
+    
+    DataFrames are read column-wise with itertuples, so no per-row dict is
+    ever built; execute_values consumes the iterator one page at a time.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data[columns].itertuples(index=False, name=None)
+    return (tuple(row[column] for column in columns) for row in data)
+
+
 def fetch_nasdaq100_tickers() -> List[Tuple[str, str]]:
     """
     Fetch Nasdaq-100 ticker symbols and company names from Wikipedia.
@@ -214,7 +379,7 @@ def get_or_create_stock(symbol: str, company_name: str) -> int:
             
             if result:
                 stock_id = result[0]
-                logger.debug(f"Stock {symbol} already exists with id {stock_id}")
+                logger.debug("Stock %s already exists with id %s", symbol, stock_id)
                 return stock_id
             
             # Create new stock
@@ -230,10 +395,10 @@ def get_or_create_stock(symbol: str, company_name: str) -> int:
             stock_id = cursor.fetchone()[0]
             conn.commit()
             
-            logger.info(f"Created/updated stock {symbol} with id {stock_id}")
+            logger.info("Created/updated stock %s with id %s", symbol, stock_id)
             return stock_id
     except Exception as e:
-        logger.error(f"Error getting/creating stock {symbol}: {e}")
+        logger.error("Error getting/creating stock %s: %s", symbol, e)
         raise
 
 
@@ -275,6 +440,43 @@ def get_last_timestamp_for_symbol(
         raise
 
 
+def get_last_timestamps(table: str = 'bars') -> Dict[str, datetime]:
+    """
+    Get the last available timestamp of every symbol in a specific table.
+    
+    One aggregate query replaces a get_last_timestamp_for_symbol() call per
+    symbol; pass the result to should_skip_symbol() and
+    get_effective_start_date() as last_timestamps.
+    
+    Args:
+        table: Table name ('bars', 'quotes', or 'trades')
+    
+    Returns:
+        Dictionary mapping symbol to last timestamp (symbols without data are missing)
+    """
+    if table not in ['bars', 'quotes', 'trades']:
+        raise ValueError(f"Invalid table: {table}. Must be 'bars', 'quotes', or 'trades'")
+    
+    query = f"""
+        SELECT s.symbol, t.last_time
+        FROM (
+            SELECT stock_id, MAX(time) AS last_time
+            FROM trading.{table}
+            GROUP BY stock_id
+        ) t
+        JOIN trading.stock s ON t.stock_id = s.id
+    """
+    
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            return dict(cursor.fetchall())
+    except Exception as e:
+        logger.error(f"Error getting last timestamps in {table}: {e}")
+        raise
+
+
 def get_data_range_for_symbol(
     symbol: str,
     table: str = 'bars'
@@ -316,11 +518,23 @@ def get_data_range_for_symbol(
         raise
 
 
+def _lookup_last_timestamp(
+    symbol: str,
+    table: str,
+    last_timestamps: Optional[Dict[str, datetime]]
+) -> Optional[datetime]:
+    """Look up a symbol's last timestamp, querying only when no mapping is given."""
+    if last_timestamps is None:
+        return get_last_timestamp_for_symbol(symbol, table)
+    return last_timestamps.get(symbol)
+
+
 def should_skip_symbol(
     symbol: str,
     requested_end_date: datetime,
     table: str = 'bars',
-    tolerance_minutes: int = 60
+    tolerance_minutes: int = 60,
+    last_timestamps: Optional[Dict[str, datetime]] = None
 ) -> bool:
     """
     Check if a symbol should be skipped because it already has data up to (or close to) the requested end_date.
@@ -330,11 +544,13 @@ def should_skip_symbol(
         requested_end_date: The end date requested for ingestion
         table: Table name ('bars', 'quotes', or 'trades')
         tolerance_minutes: Tolerance in minutes - if last data is within this many minutes of end_date, skip
+        last_timestamps: Optional result of get_last_timestamps(table); if given,
+                         the last timestamp is looked up instead of queried
     
     Returns:
         True if symbol should be skipped, False otherwise
     """
-    last_timestamp = get_last_timestamp_for_symbol(symbol, table)
+    last_timestamp = _lookup_last_timestamp(symbol, table, last_timestamps)
     
     if last_timestamp is None:
         return False  # No data exists, don't skip
@@ -344,8 +560,8 @@ def should_skip_symbol(
     
     if time_diff <= tolerance_minutes:
         logger.info(
-            f"Symbol {symbol} already has {table} data up to {last_timestamp}. "
-            f"Requested end_date: {requested_end_date}. Skipping."
+            "Symbol %s already has %s data up to %s. Requested end_date: %s. Skipping.",
+            symbol, table, last_timestamp, requested_end_date
         )
         return True
     
@@ -355,7 +571,8 @@ def should_skip_symbol(
 def get_effective_start_date(
     symbol: str,
     requested_start_date: datetime,
-    table: str = 'bars'
+    table: str = 'bars',
+    last_timestamps: Optional[Dict[str, datetime]] = None
 ) -> datetime:
     """
     Get the effective start date for ingestion.
@@ -366,13 +583,15 @@ def get_effective_start_date(
         symbol: Stock symbol
         requested_start_date: The start date requested for ingestion
         table: Table name ('bars', 'quotes', or 'trades')
+        last_timestamps: Optional result of get_last_timestamps(table); if given,
+                         the last timestamp is looked up instead of queried
     
     Returns:
         Effective start date for ingestion
     """
     from datetime import timedelta
     
-    last_timestamp = get_last_timestamp_for_symbol(symbol, table)
+    last_timestamp = _lookup_last_timestamp(symbol, table, last_timestamps)
     
     if last_timestamp is None:
         # No existing data, use requested start date
@@ -388,8 +607,8 @@ def get_effective_start_date(
     # But don't start after the requested start date
     if effective_start > requested_start_date:
         logger.info(
-            f"Symbol {symbol} has existing {table} data up to {last_timestamp}. "
-            f"Starting ingestion from {effective_start} (requested: {requested_start_date})"
+            "Symbol %s has existing %s data up to %s. Starting ingestion from %s (requested: %s)",
+            symbol, table, last_timestamp, effective_start, requested_start_date
         )
         return effective_start
     
@@ -444,7 +663,7 @@ def insert_nasdaq100_stocks() -> Dict[str, int]:
                     )
                     if cursor.rowcount > 0:
                         updated_count += 1
-                        logger.debug(f"Updated stock {symbol}: {company_name}")
+                        logger.debug("Updated stock %s: %s", symbol, company_name)
                     stock_ids[symbol] = stock_id
                 else:
                     # Insert new stock
@@ -459,7 +678,7 @@ def insert_nasdaq100_stocks() -> Dict[str, int]:
                     stock_id = cursor.fetchone()[0]
                     stock_ids[symbol] = stock_id
                     inserted_count += 1
-                    logger.debug(f"Inserted stock {symbol}: {company_name}")
+                    logger.debug("Inserted stock %s: %s", symbol, company_name)
             
             conn.commit()
         
@@ -133,6 +133,11 @@ def create_bars_table(schema_name: str = 'trading') -> bool:
                 ON {schema_name}.bars (time DESC, stock_id);
             """)
             
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_bars_stock_id_time 
+                ON {schema_name}.bars (stock_id, time);
+            """)
+            
             conn.commit()
             logger.info(f"Bars table created in schema '{schema_name}'")
             return True
@@ -3,7 +3,9 @@ Base Strategy Class
 Provides common interface and shared functionality for all trading strategies.
 """
 
-from typing import Optional
+from typing import Dict, Hashable, Optional
+import numpy as np
+import pandas as pd
 from backtesting import Strategy
 from backtesting.lib import crossover
 import logging
@@ -96,6 +98,36 @@ class BaseStrategy(Strategy):
                     self.entry_price = None
                     return
     
+    @classmethod
+    def signals(
+        cls,
+        data: pd.DataFrame,
+        indicator_cache: Optional[Dict[Hashable, np.ndarray]] = None,
+        **params
+    ) -> np.ndarray:
+        """
+        Compute entry/exit signals for the whole series at once.
+        
+        Used by the fast (numba) backtest engine in place of next().
+        Signals on bar i are filled at the open of bar i + 1.
+        Override in subclasses that can be expressed in vectorized form.
+        
+        Args:
+            data: DataFrame with columns Open, High, Low, Close, Volume
+            indicator_cache: Optional dict shared by calls on the same data
+                             (e.g. across a parameter sweep); subclasses
+                             store indicator arrays in it so each distinct
+                             indicator is computed only once
+            **params: Strategy parameters overriding the class defaults
+        
+        Returns:
+            int8 array aligned with data: 1 = enter long, -1 = exit, 0 = hold
+        
+        Raises:
+            NotImplementedError: If the strategy has no vectorized form
+        """
+        raise NotImplementedError(f"{cls.__name__} does not support the fast engine")
+    
     def get_position_size(self) -> float:
         """
         Calculate position size based on equity and position_size parameter.
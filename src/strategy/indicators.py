@@ -2,15 +2,80 @@
 Indicator Utilities
 Wrapper functions around talib for consistent indicator calculation.
 Provides error handling and parameter validation.
+
+SMA and EMA, the indicators evaluated most often during parameter sweeps,
+are computed by numba kernels instead of talib so they accept float32 bars
+and run without a C-call round trip per indicator.
 """
 
 import numpy as np
 import talib
 import logging
 
+from src.utility._njit import njit
+
 logger = logging.getLogger(__name__)
 
 
+def _as_float64(arr) -> np.ndarray:
+    """Return arr as a contiguous float64 array (talib only accepts doubles)."""
+    return np.ascontiguousarray(arr, dtype=np.float64)
+
+
+@njit(cache=True)
+def _sma(arr: np.ndarray, n: int) -> np.ndarray:
+    """
+    Rolling mean over n values using a running sum.
+
+    Leading NaNs are skipped, matching talib: the first valid output is
+    n - 1 values after the first non-NaN input.
+    """
+    out = np.full(arr.shape[0], np.nan)
+    start = 0
+    while start < arr.shape[0] and np.isnan(arr[start]):
+        start += 1
+
+    total = 0.0
+    for i in range(start, arr.shape[0]):
+        total += arr[i]
+        if i - start >= n:
+            total -= arr[i - n]
+        if i - start >= n - 1:
+            out[i] = total / n
+    return out
+
+
+@njit(cache=True)
+def _ema(arr: np.ndarray, n: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (n + 1), seeded with the
+    SMA of the first n values (talib's default compatibility mode).
+    """
+    out = np.full(arr.shape[0], np.nan)
+    start = 0
+    while start < arr.shape[0] and np.isnan(arr[start]):
+        start += 1
+    if arr.shape[0] - start < n:
+        return out
+
+    alpha = 2.0 / (n + 1)
+    prev = 0.0
+    for i in range(start, start + n):
+        prev += arr[i]
+    prev /= n
+    out[start + n - 1] = prev
+    for i in range(start + n, arr.shape[0]):
+        prev += alpha * (arr[i] - prev)
+        out[i] = prev
+    return out
+
+
+# Compile (or load from the on-disk cache) once at import so the first
+# backtest of a sweep, and any forked worker, doesn't pay for it
+_sma(np.zeros(2), 1)
+_ema(np.zeros(2), 1)
+
+
 def sma(close: np.ndarray, period: int) -> np.ndarray:
     """
     Calculate Simple Moving Average.
@@ -26,7 +91,7 @@ def sma(close: np.ndarray, period: int) -> np.ndarray:
         raise ValueError(f"Period must be positive, got {period}")
     if len(close) < period:
         logger.warning(f"Insufficient data for SMA({period}): {len(close)} values")
-    return talib.SMA(close, timeperiod=period)
+    return _sma(_as_float64(close), int(period))
 
 
 def ema(close: np.ndarray, period: int) -> np.ndarray:
@@ -44,7 +109,7 @@ def ema(close: np.ndarray, period: int) -> np.ndarray:
         raise ValueError(f"Period must be positive, got {period}")
     if len(close) < period:
         logger.warning(f"Insufficient data for EMA({period}): {len(close)} values")
-    return talib.EMA(close, timeperiod=period)
+    return _ema(_as_float64(close), int(period))
 
 
 def bollinger_bands(
@@ -71,7 +136,7 @@ def bollinger_bands(
         raise ValueError(f"Period must be positive, got {period}")
     if len(close) < period:
         logger.warning(f"Insufficient data for Bollinger Bands({period}): {len(close)} values")
-    return talib.BBANDS(close, timeperiod=period, nbdevup=nbdevup, nbdevdn=nbdevdn, matype=matype)
+    return talib.BBANDS(_as_float64(close), timeperiod=period, nbdevup=nbdevup, nbdevdn=nbdevdn, matype=matype)
 
 
 def macd(
@@ -96,7 +161,7 @@ def macd(
         raise ValueError(f"fastperiod ({fastperiod}) must be less than slowperiod ({slowperiod})")
     if len(close) < slowperiod:
         logger.warning(f"Insufficient data for MACD: {len(close)} values")
-    return talib.MACD(close, fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod)
+    return talib.MACD(_as_float64(close), fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod)
 
 
 def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
@@ -114,7 +179,7 @@ def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
         raise ValueError(f"Period must be positive, got {period}")
     if len(close) < period + 1:
         logger.warning(f"Insufficient data for RSI({period}): {len(close)} values")
-    return talib.RSI(close, timeperiod=period)
+    return talib.RSI(_as_float64(close), timeperiod=period)
 
 
 def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
@@ -136,7 +201,7 @@ def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14)
         raise ValueError("high, low, and close arrays must have same length")
     if len(high) < period:
         logger.warning(f"Insufficient data for ATR({period}): {len(high)} values")
-    return talib.ATR(high, low, close, timeperiod=period)
+    return talib.ATR(_as_float64(high), _as_float64(low), _as_float64(close), timeperiod=period)
 
 
 def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
@@ -158,7 +223,7 @@ def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14)
         raise ValueError("high, low, and close arrays must have same length")
     if len(high) < period:
         logger.warning(f"Insufficient data for ADX({period}): {len(high)} values")
-    return talib.ADX(high, low, close, timeperiod=period)
+    return talib.ADX(_as_float64(high), _as_float64(low), _as_float64(close), timeperiod=period)
 
 
 def vwap(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
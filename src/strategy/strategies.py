@@ -74,6 +74,38 @@ class MovingAverageCrossOverStrategy(BaseStrategy):
         # Exit signal: death cross (short MA crosses below long MA)
         if crossover(self.ma_long, self.ma_short):
             self.position.close()
+    
+    @classmethod
+    def signals(cls, data, indicator_cache=None, **params) -> np.ndarray:
+        """Vectorized golden/death cross signals for the fast engine."""
+        short_window = params.get('short_window', cls.short_window)
+        long_window = params.get('long_window', cls.long_window)
+        ma_type = params.get('ma_type', cls.ma_type).lower()
+        
+        if short_window >= long_window:
+            raise ValueError(f"short_window ({short_window}) must be less than long_window ({long_window})")
+        if ma_type not in ("sma", "ema"):
+            raise ValueError(f"ma_type must be 'sma' or 'ema', got {ma_type}")
+        
+        # In a sweep each (ma_type, window) is computed once and shared by
+        # every combination that uses it
+        cache = {} if indicator_cache is None else indicator_cache
+        close = data['Close'].to_numpy(dtype=np.float64)
+        ma = ema if ma_type == "ema" else sma
+        for window in (short_window, long_window):
+            if (ma_type, window) not in cache:
+                cache[(ma_type, window)] = ma(close, window)
+        ma_short, ma_long = cache[(ma_type, short_window)], cache[(ma_type, long_window)]
+        
+        # Same definition as backtesting.lib.crossover() on consecutive bars
+        signals = np.zeros(len(close), dtype=np.int8)
+        above = ma_short[1:] > ma_long[1:]
+        below = ma_short[1:] < ma_long[1:]
+        was_above = ma_short[:-1] > ma_long[:-1]
+        was_below = ma_short[:-1] < ma_long[:-1]
+        signals[1:][was_below & above] = 1
+        signals[1:][was_above & below] = -1
+        return signals
 
 class BollingerBandsStrategy(BaseStrategy):
     """
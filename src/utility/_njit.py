@@ -0,0 +1,42 @@
+"""
+Numba JIT Shim
+Provides an njit decorator that compiles with numba when it is installed
+and falls back to plain Python otherwise, so modules using it always import.
+
+Kernels decorated with @njit(cache=True) are cached in a single project-level
+directory (NUMBA_CACHE_DIR, default <project>/.cache/numba) so worker
+processes spawned by joblib / ProcessPoolExecutor load the compiled code
+instead of recompiling it, even when the source tree is read-only.
+"""
+
+import os
+from pathlib import Path
+
+# Must be set before numba is imported; workers inherit it via the environment
+os.environ.setdefault(
+    'NUMBA_CACHE_DIR',
+    str(Path(__file__).resolve().parent.parent.parent / '.cache' / 'numba')
+)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op replacement for numba.njit.
+        
+        Supports both bare (@njit) and parameterized (@njit(cache=True)) usage.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']
@@ -0,0 +1,158 @@
+"""
+Tests for backtest_engine module.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backtest.backtest_engine import (
+    run_backtest,
+    run_backtest_multiple_symbols,
+    _get_bt,
+)
+from src.strategy.strategies import MovingAverageCrossOverStrategy
+
+
+def _make_bars(periods: int = 300) -> pd.DataFrame:
+    """Create a synthetic OHLCV DataFrame."""
+    rng = np.random.default_rng(42)
+    close = 100 + rng.standard_normal(periods).cumsum()
+    index = pd.date_range('2025-01-01', periods=periods, freq='1h', tz='UTC')
+    return pd.DataFrame({
+        'Open': close,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1000, 10000, periods),
+    }, index=index)
+
+
+class TestBacktestEngine(unittest.TestCase):
+    """Test cases for backtest engine functionality."""
+
+    def setUp(self):
+        """Start each test with an empty Backtest instance cache."""
+        _get_bt.cache_clear()
+
+    @patch('src.backtest.backtest_engine.load_bars_for_backtest')
+    def test_run_backtest(self, mock_load):
+        """Test running a single symbol backtest."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = run_backtest(
+            MovingAverageCrossOverStrategy,
+            'AAPL',
+            '2025-01-01',
+            '2025-02-01',
+            strategy_params={'short_window': 5, 'long_window': 20}
+        )
+
+        self.assertEqual(result['symbol'], 'AAPL')
+        self.assertEqual(result['strategy'], 'MovingAverageCrossOverStrategy')
+        self.assertIn('Return [%]', result['stats'])
+        self.assertEqual(result['parameters'], {'short_window': 5, 'long_window': 20})
+
+    @patch('src.backtest.backtest_engine.validate_data_quality')
+    @patch('src.backtest.backtest_engine.load_bars_for_backtest')
+    def test_run_backtest_reuses_validation(self, mock_load, mock_validate):
+        """Test that a loader-provided validation result is not recomputed."""
+        df = _make_bars()
+        df.attrs['data_quality'] = {'is_valid': True, 'warnings': []}
+        mock_load.return_value = {'AAPL': df}
+
+        result = run_backtest(
+            MovingAverageCrossOverStrategy,
+            'AAPL',
+            '2025-01-01',
+            '2025-02-01',
+            strategy_params={'short_window': 5, 'long_window': 20}
+        )
+
+        mock_validate.assert_not_called()
+        self.assertTrue(result['data_quality']['is_valid'])
+
+    @patch('src.backtest.backtest_engine.load_bars_for_backtest')
+    def test_run_backtest_reuse_engine(self, mock_load):
+        """Test that a parameter sweep with reuse_engine loads data once."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        results = [
+            run_backtest(
+                MovingAverageCrossOverStrategy,
+                'AAPL',
+                '2025-01-01',
+                '2025-02-01',
+                strategy_params={'short_window': short, 'long_window': 20},
+                reuse_engine=True
+            )
+            for short in (5, 10)
+        ]
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(results[1]['parameters'], {'short_window': 10, 'long_window': 20})
+
+    @patch('src.backtest.backtest_engine.load_bars_for_backtest')
+    def test_run_backtest_fast_engine(self, mock_load):
+        """Test that use_fast_engine runs the strategy's vectorized signals."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = run_backtest(
+            MovingAverageCrossOverStrategy,
+            'AAPL',
+            '2025-01-01',
+            '2025-02-01',
+            strategy_params={'short_window': 5, 'long_window': 20},
+            use_fast_engine=True
+        )
+
+        self.assertIn('Return [%]', result['stats'])
+        self.assertEqual(len(result['equity_curve']), 300)
+
+    @patch('src.backtest.backtest_engine.load_bars_for_backtest')
+    def test_run_backtest_no_data(self, mock_load):
+        """Test that a missing symbol raises ValueError."""
+        mock_load.return_value = {'AAPL': pd.DataFrame()}
+
+        with self.assertRaises(ValueError):
+            run_backtest(MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01')
+
+    @patch('src.backtest.backtest_engine.run_backtest')
+    def test_run_backtest_multiple_symbols_serial(self, mock_run):
+        """Test serial fallback records per-symbol errors without aborting."""
+        def fake_run(strategy_class, symbol, *args, **kwargs):
+            if symbol == 'BAD':
+                raise ValueError("no data")
+            return {'symbol': symbol, 'stats': pd.Series({'Return [%]': 1.0})}
+
+        mock_run.side_effect = fake_run
+
+        results = run_backtest_multiple_symbols(
+            MovingAverageCrossOverStrategy,
+            ['AAPL', 'BAD', 'MSFT'],
+            '2025-01-01',
+            '2025-02-01',
+            n_jobs=1
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertIsNotNone(results['AAPL']['stats'])
+        self.assertIsNone(results['BAD']['stats'])
+        self.assertIn('error', results['BAD'])
+        self.assertEqual(mock_run.call_count, 3)
+
+    def test_run_backtest_multiple_symbols_empty(self):
+        """Test that an empty symbol list raises ValueError."""
+        with self.assertRaises(ValueError):
+            run_backtest_multiple_symbols(MovingAverageCrossOverStrategy, [], '2025-01-01', '2025-02-01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,8 +5,10 @@ Tests for dataloader module.
 import unittest
 import os
 import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -14,6 +16,7 @@ from datetime import datetime
 project_root = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import src.backtest.dataloader as dataloader
 from src.backtest.dataloader import (
     load_bars_from_db,
     load_multiple_symbols,
@@ -24,34 +27,57 @@ from src.backtest.dataloader import (
 )
 
 
+# Stock ids preloaded into the loader's symbol -> id cache
+STOCK_IDS = {'AAPL': 1, 'MSFT': 2, 'GOOGL': 3}
+
+
+def _mock_bar_rows(mock_get_conn, rows):
+    """Make _get_conn() yield a connection whose cursor iterates rows."""
+    mock_cursor = MagicMock()
+    mock_cursor.__iter__.return_value = iter(
+        (STOCK_IDS[row[0]],) + tuple(row[1:]) for row in rows
+    )
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_get_conn.return_value.__enter__.return_value = mock_conn
+    return mock_cursor
+
+
+def _epoch_ns(timestamp: str) -> int:
+    """Convert a UTC timestamp string to epoch nanoseconds."""
+    return pd.Timestamp(timestamp, tz='UTC').value
+
+
 class TestDataLoader(unittest.TestCase):
     """Test cases for dataloader functionality."""
     
-    @patch('src.backtest.dataloader.get_sqlalchemy_engine')
-    def test_load_bars_from_db(self, mock_get_engine):
+    def setUp(self):
+        """Point the bar cache at a temporary directory and reset metadata caches."""
+        get_available_symbols.cache_clear()
+        get_symbol_data_range.cache_clear()
+        dataloader.get_nasdaq100_symbols.cache_clear()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        patcher = patch.object(dataloader, 'CACHE_DIR', Path(self._cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict(dataloader._STOCK_IDS, STOCK_IDS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._cache_dir.cleanup)
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_bars_from_db(self, mock_get_conn):
         """Test loading bars from database."""
-        # Create mock DataFrame to return from pd.read_sql_query
-        mock_df = pd.DataFrame({
-            'time': pd.to_datetime(['2025-01-01 10:00:00', '2025-01-01 10:01:00']),
-            'open': [100.0, 100.5],
-            'high': [101.0, 101.5],
-            'low': [99.0, 100.0],
-            'close': [100.5, 101.0],
-            'volume': [1000, 1100]
-        })
-        
-        # Mock SQLAlchemy engine
-        mock_engine = MagicMock()
-        mock_get_engine.return_value = mock_engine
+        _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-01 10:01:00'), 100.5, 101.5, 100.0, 101.0, 1100),
+        ])
         
-        # Mock pd.read_sql_query to return our mock DataFrame
-        with patch('src.backtest.dataloader.pd.read_sql_query', return_value=mock_df):
-            # Test loading bars
-            df = load_bars_from_db(
-                symbol='AAPL',
-                start_date='2025-01-01',
-                end_date='2025-01-02'
-            )
+        df = load_bars_from_db(
+            symbol='AAPL',
+            start_date='2025-01-01',
+            end_date='2025-01-02'
+        )
         
         self.assertIsInstance(df, pd.DataFrame)
         self.assertGreater(len(df), 0)
@@ -60,31 +86,233 @@ class TestDataLoader(unittest.TestCase):
         self.assertIn('High', df.columns)
         self.assertIn('Low', df.columns)
         self.assertIn('Volume', df.columns)
+        self.assertEqual(str(df.index.tz), 'UTC')
+        self.assertEqual(df.index[1], pd.Timestamp('2025-01-01 10:01:00', tz='UTC'))
     
-    @patch('src.backtest.dataloader.load_bars_from_db')
-    def test_load_multiple_symbols(self, mock_load_bars):
-        """Test loading multiple symbols."""
-        mock_df = pd.DataFrame({
-            'Open': [100, 101],
-            'High': [101, 102],
-            'Low': [99, 100],
-            'Close': [100.5, 101.5],
-            'Volume': [1000, 1100]
-        })
-        mock_load_bars.return_value = mock_df
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols(self, mock_get_conn):
+        """Test loading multiple symbols with a single query."""
+        mock_cursor = _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-01 10:01:00'), 100.5, 101.5, 100.0, 101.0, 1100),
+            ('MSFT', _epoch_ns('2025-01-01 10:00:00'), 200.0, 201.0, 199.0, 200.5, 2000),
+            ('MSFT', _epoch_ns('2025-01-01 10:01:00'), 200.5, 201.5, 200.0, 201.0, 2100),
+        ])
         
         result = load_multiple_symbols(
-            symbols=['AAPL', 'MSFT'],
+            symbols=['AAPL', 'MSFT', 'GOOGL'],
             start_date='2025-01-01',
             end_date='2025-01-02'
         )
         
-        self.assertEqual(len(result), 2)
-        self.assertIn('AAPL', result)
-        self.assertIn('MSFT', result)
-        self.assertEqual(mock_load_bars.call_count, 2)
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(result['AAPL']), 2)
+        self.assertEqual(result['MSFT']['Close'].iloc[-1], 201.0)
+        self.assertTrue(result['GOOGL'].empty)
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_cache(self, mock_get_conn):
+        """Test that a second load of the same key is served from the cache."""
+        mock_cursor = _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-01 10:01:00'), 100.5, 101.5, 100.0, 101.0, 1100),
+        ])
+        
+        first = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02')
+        second = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02')
+        
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+        pd.testing.assert_frame_equal(first['AAPL'], second['AAPL'], check_freq=False)
+        self.assertEqual(dataloader.clear_cache(), 1)
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_dtype(self, mock_get_conn):
+        """Test that OHLC columns default to float32 and f64 opts out."""
+        rows = [
+            ('AAPL', _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-01 10:01:00'), 100.5, 101.5, 100.0, 101.0, 1100),
+        ]
+        
+        _mock_bar_rows(mock_get_conn, rows)
+        df = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02', cache=False)['AAPL']
+        self.assertEqual(df['Close'].dtype, np.float32)
+        self.assertEqual(df['Volume'].dtype, np.int64)
+        
+        _mock_bar_rows(mock_get_conn, rows)
+        df = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02', cache=False, dtype='f64')['AAPL']
+        self.assertEqual(df['Close'].dtype, np.float64)
+        
+        with self.assertRaises(ValueError):
+            load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02', dtype='f16')
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_pyarrow_backend(self, mock_get_conn):
+        """Test that the pyarrow backend keeps a DatetimeIndex and validates."""
+        _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-01 10:01:00'), 100.5, 101.5, 100.0, 101.0, 1100),
+        ])
+        
+        df = load_multiple_symbols(
+            ['AAPL'], '2025-01-01', '2025-01-02', cache=False, validate=True, backend='pyarrow'
+        )['AAPL']
+        
+        self.assertIsInstance(df['Close'].dtype, pd.ArrowDtype)
+        self.assertIsInstance(df.index, pd.DatetimeIndex)
+        self.assertEqual(df.attrs['data_quality']['missing_values'], {})
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_utc_dates(self, mock_get_conn):
+        """Test that naive dates are treated as UTC and aware dates converted."""
+        mock_cursor = _mock_bar_rows(mock_get_conn, [])
+        
+        load_multiple_symbols(
+            ['AAPL'],
+            '2025-01-01',
+            pd.Timestamp('2025-01-01 21:00', tz='America/New_York'),
+            cache=False
+        )
+        
+        params = mock_cursor.execute.call_args[0][1]
+        self.assertEqual(params['start_date'], pd.Timestamp('2025-01-01', tz='UTC'))
+        self.assertEqual(params['end_date'], pd.Timestamp('2025-01-02 02:00', tz='UTC'))
+    
+    @patch.object(dataloader, 'BAR_CHUNK_ROWS', 2)
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_chunked_resample(self, mock_get_conn):
+        """Test that client-side resampling merges buckets split across chunks."""
+        _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-06 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-01-07 10:00:00'), 100.5, 103.0, 100.0, 101.0, 1100),
+            ('AAPL', _epoch_ns('2025-01-08 10:00:00'), 101.0, 102.0, 98.0, 101.5, 1200),
+        ])
+        
+        df = load_multiple_symbols(
+            ['AAPL'], '2025-01-01', '2025-01-31', resample='W', cache=False, dtype='f64'
+        )['AAPL']
+        
+        self.assertEqual(len(df), 1)
+        bar = df.iloc[0]
+        self.assertEqual(bar['Open'], 100.0)
+        self.assertEqual(bar['High'], 103.0)
+        self.assertEqual(bar['Low'], 98.0)
+        self.assertEqual(bar['Close'], 101.5)
+        self.assertEqual(bar['Volume'], 3300)
+    
+    @patch.object(dataloader, 'BAR_CHUNK_ROWS', 1440)
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_chunked_matches_unchunked(self, mock_get_conn):
+        """Test that chunked resampling bins like one resample over all bars."""
+        index = pd.date_range('2025-01-01', periods=6 * 1440, freq='1min', tz='UTC')
+        close = 100.0 + np.sin(np.arange(len(index)) / 50.0)
+        bars = pd.DataFrame({
+            'Open': close, 'High': close + 1.0, 'Low': close - 1.0, 'Close': close,
+            'Volume': np.arange(len(index), dtype=np.int64) % 97 + 1,
+        }, index=index)
+        rows = [
+            ('AAPL', ts.value, o, h, l, c, v)
+            for ts, (o, h, l, c, v) in zip(index, bars.itertuples(index=False))
+        ]
+        
+        for rule in ('2D', '7min'):
+            with self.subTest(rule=rule):
+                _mock_bar_rows(mock_get_conn, rows)
+                df = load_multiple_symbols(
+                    ['AAPL'], '2025-01-01', '2025-01-08', resample=rule, cache=False, dtype='f64'
+                )['AAPL']
+                
+                expected = bars.resample(rule).agg({
+                    'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'
+                }).dropna()
+                pd.testing.assert_frame_equal(df, expected, check_freq=False, check_names=False)
     
-    @patch('src.backtest.dataloader.get_db_connection')
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_shared_conn(self, mock_get_conn):
+        """Test that a caller-supplied connection is reused and rolled back on error."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([
+            (STOCK_IDS['AAPL'], _epoch_ns('2025-01-01 10:00:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+        ])
+        mock_conn.cursor.return_value = mock_cursor
+        
+        result = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02', cache=False, conn=mock_conn)
+        
+        mock_get_conn.assert_not_called()
+        self.assertEqual(len(result['AAPL']), 1)
+        
+        mock_cursor.execute.side_effect = RuntimeError("query failed")
+        with self.assertRaises(RuntimeError):
+            load_bars_from_db('MSFT', '2025-01-01', '2025-01-02', cache=False, conn=mock_conn)
+        mock_conn.rollback.assert_called_once()
+    
+    @patch('src.backtest.dataloader._resample_bars')
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_server_side_resample(self, mock_get_conn, mock_resample):
+        """Test that coarse resample rules are aggregated with time_bucket()."""
+        mock_cursor = _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-01-01'), 100.0, 101.0, 99.0, 100.5, 1000),
+        ])
+        
+        result = load_multiple_symbols(['AAPL'], '2025-01-01', '2025-01-02', resample='1D')
+        
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn('time_bucket', query)
+        self.assertNotIn('JOIN', query)
+        self.assertEqual(params['stock_ids'], [STOCK_IDS['AAPL']])
+        self.assertEqual(params['bucket'], '1 day')
+        mock_resample.assert_not_called()
+        self.assertEqual(len(result['AAPL']), 1)
+    
+    @patch('src.backtest.dataloader._get_conn')
+    def test_load_multiple_symbols_uneven_resample(self, mock_get_conn):
+        """Test that rules not dividing a day are resampled by pandas, anchored at midnight."""
+        mock_cursor = _mock_bar_rows(mock_get_conn, [
+            ('AAPL', _epoch_ns('2025-03-04 14:30:00'), 100.0, 101.0, 99.0, 100.5, 1000),
+            ('AAPL', _epoch_ns('2025-03-04 14:34:00'), 100.5, 102.0, 100.0, 101.0, 1100),
+            ('AAPL', _epoch_ns('2025-03-04 14:35:00'), 101.0, 103.0, 98.0, 101.5, 1200),
+        ])
+        
+        df = load_multiple_symbols(
+            ['AAPL'], '2025-03-04', '2025-03-05', resample='7min', cache=False, dtype='f64'
+        )['AAPL']
+        
+        query = mock_cursor.execute.call_args[0][0]
+        self.assertNotIn('time_bucket', query)
+        self.assertEqual(df.index[0], pd.Timestamp('2025-03-04 14:28:00', tz='UTC'))
+        self.assertEqual(df['Volume'].tolist(), [2100, 1200])
+    
+    def test_get_stock_ids_cached(self):
+        """Test that symbol -> stock id lookups only query unknown symbols."""
+        dataloader._STOCK_IDS.clear()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [('AAPL', 1), ('MSFT', 2)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        
+        first = dataloader._get_stock_ids(['AAPL', 'MSFT', 'NOPE'], mock_conn)
+        second = dataloader._get_stock_ids(['AAPL', 'MSFT'], mock_conn)
+        
+        self.assertEqual(first, {'AAPL': 1, 'MSFT': 2})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+    
+    @patch('src.backtest.dataloader.ThreadedConnectionPool')
+    def test_get_conn_reuses_pool(self, mock_pool_cls):
+        """Test that connections come from one pool and are returned to it."""
+        with patch.object(dataloader, '_POOL', None), patch.object(dataloader, '_POOL_PID', None):
+            with dataloader._get_conn():
+                pass
+            with dataloader._get_conn():
+                pass
+        
+        mock_pool = mock_pool_cls.return_value
+        self.assertEqual(mock_pool_cls.call_count, 1)
+        self.assertEqual(mock_pool.getconn.call_count, 2)
+        mock_pool.putconn.assert_called_with(mock_pool.getconn.return_value)
+    
+    @patch('src.backtest.dataloader._get_conn')
     def test_get_available_symbols(self, mock_get_conn):
         """Test getting available symbols from database."""
         mock_cursor = MagicMock()
@@ -100,7 +328,7 @@ class TestDataLoader(unittest.TestCase):
         self.assertGreater(len(symbols), 0)
         self.assertIn('AAPL', symbols)
     
-    @patch('src.backtest.dataloader.get_db_connection')
+    @patch('src.backtest.dataloader._get_conn')
     def test_get_symbol_data_range(self, mock_get_conn):
         """Test getting data range for a symbol."""
         from datetime import datetime
@@ -122,6 +350,21 @@ class TestDataLoader(unittest.TestCase):
         self.assertIsNotNone(result['start_date'])
         self.assertIsNotNone(result['end_date'])
     
+    @patch('src.backtest.dataloader._get_conn')
+    def test_get_symbol_data_range_cached(self, mock_get_conn):
+        """Test that repeated range lookups for a symbol hit the database once."""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (datetime(2025, 1, 1), datetime(2025, 1, 31))
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+        
+        first = get_symbol_data_range('AAPL')
+        second = get_symbol_data_range('AAPL')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+    
     def test_validate_data_quality(self):
         """Test data quality validation."""
         # Valid data
@@ -150,6 +393,48 @@ class TestDataLoader(unittest.TestCase):
         issues = validate_data_quality(invalid_df)
         self.assertGreater(len(issues), 0)
     
+    def test_validate_data_quality_gaps(self):
+        """Test gap detection between consecutive bars."""
+        index = pd.DatetimeIndex([
+            '2025-01-01 10:00', '2025-01-01 11:00',
+            '2025-01-03 11:00', '2025-01-03 12:00'
+        ], tz='UTC')
+        df = pd.DataFrame({
+            'Open': [100.0] * 4,
+            'High': [101.0] * 4,
+            'Low': [99.0] * 4,
+            'Close': [100.5] * 4,
+            'Volume': [1000] * 4
+        }, index=index)
+        
+        results = validate_data_quality(df, max_gap_hours=24, min_data_points=1)
+        
+        self.assertEqual(results['gap_count'], 1)
+        gap = results['gaps'].iloc[0]
+        self.assertEqual(gap['start'], index[1])
+        self.assertEqual(gap['end'], index[2])
+        self.assertAlmostEqual(gap['duration_hours'], 48.0)
+    
+    def test_validate_data_quality_duplicates(self):
+        """Test duplicate timestamps are counted alongside gap detection."""
+        index = pd.DatetimeIndex([
+            '2025-01-01 10:00', '2025-01-01 10:00',
+            '2025-01-01 11:00', '2025-01-03 11:00'
+        ], tz='UTC')
+        df = pd.DataFrame({
+            'Open': [100.0] * 4,
+            'High': [101.0] * 4,
+            'Low': [99.0] * 4,
+            'Close': [100.5] * 4,
+            'Volume': [1000] * 4
+        }, index=index)
+        
+        results = validate_data_quality(df, max_gap_hours=24, min_data_points=1)
+        
+        self.assertEqual(results['duplicate_timestamps'], 1)
+        self.assertEqual(results['gap_count'], 1)
+        self.assertFalse(results['is_valid'])
+    
     @patch('src.backtest.dataloader.load_bars_from_db')
     def test_load_bars_for_backtest(self, mock_load_bars):
         """Test loading bars for backtesting."""
@@ -0,0 +1,75 @@
+"""
+Tests for the numba fast backtest engine.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import pandas as pd
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backtesting import Backtest
+from src.backtest._fast_engine import run_fast_backtest
+from src.strategy.strategies import MovingAverageCrossOverStrategy
+
+
+def _make_bars(periods: int = 2000) -> pd.DataFrame:
+    """Create a synthetic OHLCV DataFrame with strictly positive prices."""
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, periods)))
+    index = pd.date_range('2025-01-01', periods=periods, freq='1h', tz='UTC')
+    return pd.DataFrame({
+        'Open': close,
+        'High': close * 1.002,
+        'Low': close * 0.998,
+        'Close': close,
+        'Volume': 1000,
+    }, index=index)
+
+
+class TestFastEngine(unittest.TestCase):
+    """Test cases for run_fast_backtest."""
+
+    def test_fills_at_next_open(self):
+        """Test that a signal is filled at the next bar's open with commission."""
+        df = _make_bars(5)
+        df['Open'] = [10.0, 10.0, 10.0, 12.0, 12.0]
+        df['Close'] = df['Open']
+        signals = np.array([1, 0, -1, 0, 0], dtype=np.int8)
+
+        stats = run_fast_backtest(df, signals, cash=1000, commission=0.0)
+
+        self.assertEqual(stats['# Trades'], 1)
+        trade = stats['_trades'].iloc[0]
+        self.assertEqual(trade['EntryBar'], 1)
+        self.assertEqual(trade['ExitBar'], 3)
+        self.assertEqual(trade['Size'], 100)
+        self.assertAlmostEqual(trade['PnL'], 200.0)
+        self.assertAlmostEqual(stats['Equity Final [$]'], 1200.0)
+
+    def test_matches_backtesting_library(self):
+        """Test parity with backtesting.Backtest for a crossover strategy."""
+        df = _make_bars()
+        params = {'short_window': 5, 'long_window': 20, 'stop_loss_pct': 0}
+
+        fast = run_fast_backtest(df, MovingAverageCrossOverStrategy.signals(df, **params))
+        reference = Backtest(
+            df, MovingAverageCrossOverStrategy, cash=100000, commission=0.002, exclusive_orders=True
+        ).run(**params)
+
+        self.assertEqual(fast['# Trades'], reference['# Trades'])
+        self.assertAlmostEqual(fast['Return [%]'], reference['Return [%]'], places=6)
+        self.assertAlmostEqual(fast['Sharpe Ratio'], reference['Sharpe Ratio'], places=6)
+
+    def test_signals_length_mismatch(self):
+        """Test that misaligned signals raise ValueError."""
+        with self.assertRaises(ValueError):
+            run_fast_backtest(_make_bars(10), np.zeros(5, dtype=np.int8))
+
+
+if __name__ == '__main__':
+    unittest.main()
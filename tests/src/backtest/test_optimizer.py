@@ -0,0 +1,547 @@
+"""
+Tests for optimizer module.
+"""
+
+import unittest
+import sys
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from joblib import Parallel
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backtest.optimizer import (
+    grid_search,
+    random_search,
+    bayes_search,
+    optimize_multiple_symbols,
+    cross_validate_optimize,
+    select_best_parameters,
+    create_time_series_kfold,
+    load_heatmap,
+    save_result_to_file,
+    load_result_from_file,
+    _cached_load,
+    _as_float64_columns,
+    _canonicalize_ranges,
+    _sample_combinations,
+    _score_chunk,
+    OHLCV_COLUMNS,
+    SUMMARY_METRICS,
+)
+from src.strategy.strategies import MovingAverageCrossOverStrategy
+
+
+def _make_bars(periods: int = 400) -> pd.DataFrame:
+    """Create a synthetic OHLCV DataFrame."""
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(rng.normal(0, 0.01, periods).cumsum())
+    index = pd.date_range('2025-01-01', periods=periods, freq='1h', tz='UTC')
+    return pd.DataFrame({
+        'Open': close,
+        'High': close * 1.005,
+        'Low': close * 0.995,
+        'Close': close,
+        'Volume': rng.integers(1000, 10000, periods),
+    }, index=index)
+
+
+PARAM_GRID = {
+    'short_window': [5, 10],
+    'long_window': [20, 50],
+    'ma_type': ['sma', 'ema'],
+}
+
+
+class TestOptimizer(unittest.TestCase):
+    """Test cases for parameter optimization."""
+
+    def setUp(self):
+        """Start each test with an empty in-memory bar cache."""
+        _cached_load.cache_clear()
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search(self, mock_load):
+        """Test that grid search returns the best combination and heatmap."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, return_heatmap=True
+        )
+
+        self.assertEqual(set(result['best_params']), set(PARAM_GRID))
+        self.assertEqual(len(result['heatmap']), 8)
+        self.assertAlmostEqual(result['best_value'], result['heatmap'].max())
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_save_heatmap(self, mock_load):
+        """Test that save_heatmap keeps only a Parquet path in the result."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('src.backtest.optimizer.HEATMAP_DIR', Path(tmp)):
+            result = grid_search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, save_heatmap=True
+            )
+            heatmap = load_heatmap(result['heatmap_path'])
+
+        self.assertNotIn('heatmap', result)
+        self.assertEqual(len(heatmap), 8)
+        self.assertEqual(heatmap.index.names, list(PARAM_GRID))
+        self.assertAlmostEqual(result['best_value'], heatmap.max())
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_save_result_to_file(self, mock_load):
+        """Test that a saved result and its heatmap round-trip from disk."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, return_heatmap=True, n_jobs=1
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch('src.backtest.optimizer.OPTIMISATION_DIR', Path(tmp_dir)):
+            paths = save_result_to_file(result, parquet_heatmap=True)
+            loaded = load_result_from_file(paths['result'])
+            heatmap = load_heatmap(paths['heatmap'])
+            summary = json.loads(Path(paths['summary']).read_text())
+            raw_paths = save_result_to_file(result, compress=0)
+            raw_path = raw_paths['result']
+            raw = load_result_from_file(raw_path)
+
+        self.assertTrue(paths['result'].endswith('.pkl.z'))
+        self.assertTrue(raw_path.endswith('.pkl'))
+        self.assertEqual(raw['best_value'], result['best_value'])
+        self.assertNotIn('heatmap_csv', paths)
+        self.assertNotIn('heatmap', raw_paths)
+        self.assertEqual(Path(paths['result']).parent.name, 'MovingAverageCrossOverStrategy')
+        self.assertEqual(loaded['best_params'], result['best_params'])
+        pd.testing.assert_frame_equal(
+            loaded['best_stats']['_equity_curve'], result['best_stats']['_equity_curve']
+        )
+        pd.testing.assert_series_equal(heatmap, result['heatmap'], check_names=False)
+        self.assertEqual(summary['best_params'], result['best_params'])
+        self.assertEqual(list(summary['metrics']), list(SUMMARY_METRICS))
+        self.assertAlmostEqual(summary['metrics']['Return [%]'], result['best_stats']['Return [%]'])
+        self.assertEqual(summary['metrics']['# Trades'], result['best_stats']['# Trades'])
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_constraint_and_duplicates(self, mock_load):
+        """Test that invalid and duplicate combinations are never run."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            {'short_window': [5, 5, 30], 'long_window': [20, 50]},
+            return_heatmap=True,
+            constraint=lambda p: p['short_window'] < p['long_window']
+        )
+
+        self.assertEqual(
+            sorted(result['heatmap'].index.tolist()),
+            [(5, 20), (5, 50), (30, 50)]
+        )
+        self.assertLess(result['best_params']['short_window'], result['best_params']['long_window'])
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_halving(self, mock_load):
+        """Test that successive halving only runs the best quarter on all bars."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, return_heatmap=True, halving=True
+        )
+
+        self.assertEqual(len(result['heatmap']), 2)
+        self.assertAlmostEqual(result['best_value'], result['heatmap'].max())
+        self.assertEqual(len(result['best_stats']['_equity_curve']), 400)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_early_stop(self, mock_load):
+        """Test that dominated combinations are abandoned with a -inf score."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, return_heatmap=True, n_jobs=1, early_stop_slack=0.0, min_bars=1
+        )
+
+        heatmap = result['heatmap']
+        self.assertTrue(np.isneginf(heatmap).any())
+        self.assertAlmostEqual(result['best_value'], heatmap.max())
+        self.assertEqual(result['best_stats']._strategy.__class__, MovingAverageCrossOverStrategy)
+
+        with self.assertRaises(ValueError):
+            grid_search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, maximize='Sharpe Ratio', early_stop_slack=0.2
+            )
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_fast_engine(self, mock_load):
+        """Test that the numba engine scores the grid from vectorized signals."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = grid_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, return_heatmap=True, n_jobs=1, use_fast_engine=True
+        )
+
+        self.assertEqual(len(result['heatmap']), 8)
+        self.assertFalse(result['heatmap'].isna().any())
+        self.assertAlmostEqual(result['best_value'], result['heatmap'].max())
+        self.assertEqual(
+            result['best_params'],
+            dict(zip(PARAM_GRID, result['heatmap'].idxmax()))
+        )
+        self.assertIsInstance(result['best_params']['short_window'], int)
+
+        from src.strategy.strategies import BollingerBandsStrategy
+        with self.assertRaises(NotImplementedError):
+            grid_search(
+                BollingerBandsStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                {'period': [10, 20]}, n_jobs=1, use_fast_engine=True
+            )
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_grid_search_parallel_matches_serial(self, mock_load):
+        """Test that joblib workers score the grid exactly like a serial run."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        serial, parallel = (
+            grid_search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, return_heatmap=True, n_jobs=n_jobs
+            )
+            for n_jobs in (1, 2)
+        )
+
+        self.assertEqual(len(parallel['heatmap']), 8)
+        self.assertEqual(parallel['heatmap'].index.names, list(PARAM_GRID))
+        pd.testing.assert_series_equal(serial['heatmap'], parallel['heatmap'])
+        self.assertEqual(serial['best_params'], parallel['best_params'])
+
+    def test_score_chunk_read_only_bars(self):
+        """Test scoring on a read-only array, as joblib passes memory-mapped bars."""
+        df = _make_bars()
+        ohlcv = np.asfortranarray(df[list(OHLCV_COLUMNS)].to_numpy(dtype=np.float64))
+        ohlcv.flags.writeable = False
+
+        scores = _score_chunk(
+            'read-only', (ohlcv, list(OHLCV_COLUMNS), df.drop(columns=list(OHLCV_COLUMNS))),
+            MovingAverageCrossOverStrategy, {'cash': 100000, 'commission': 0.002},
+            ['short_window', 'long_window'], [(5, 20), (20, 5)], 'Return [%]'
+        )
+
+        self.assertFalse(np.isnan(scores[0]))
+        self.assertTrue(np.isnan(scores[1]))
+
+    def test_score_chunk_reuses_backtest(self):
+        """Test that chunks of one search share a Backtest per thread."""
+        from backtesting import Backtest
+
+        df = _make_bars()
+        bars = (df[list(OHLCV_COLUMNS)].to_numpy(), list(OHLCV_COLUMNS),
+                df.drop(columns=list(OHLCV_COLUMNS)))
+        args = (MovingAverageCrossOverStrategy, {'cash': 100000, 'commission': 0.002},
+                ['short_window', 'long_window'])
+
+        with patch('src.backtest.optimizer.Backtest', wraps=Backtest) as mock_bt:
+            first = _score_chunk('search-1', bars, *args, [(5, 20)], 'Return [%]')
+            second = _score_chunk('search-1', bars, *args, [(10, 20), (5, 20)], 'Return [%]')
+            _score_chunk('search-2', bars, *args, [(5, 20)], 'Return [%]')
+
+        self.assertEqual(mock_bt.call_count, 2)
+        self.assertEqual(first[0], second[1])
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_callable_maximize(self, mock_load):
+        """Test that a callable objective is used for both grid and random search."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        def objective(stats):
+            return stats['Return [%]'] - abs(stats['Max. Drawdown [%]'])
+
+        for search in (grid_search, random_search):
+            result = search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, maximize=objective
+            )
+            self.assertAlmostEqual(result['best_value'], objective(result['best_stats']))
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_random_search_reproducible(self, mock_load):
+        """Test that random search is reproducible with a fixed seed."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        results = [
+            random_search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, n_iter=5, random_state=7
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(results[0]['best_params'], results[1]['best_params'])
+        self.assertEqual(results[0]['best_value'], results[1]['best_value'])
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_random_search_samples_floats(self, mock_load):
+        """Test that float parameters are sampled as floats, not truncated to ints."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        from src.strategy.strategies import BollingerBandsStrategy
+        result = random_search(
+            BollingerBandsStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            {'period': [10, 30], 'devfactor': [1.5, 2.5]}, n_iter=5, random_state=3
+        )
+
+        self.assertIsInstance(result['best_params']['period'], int)
+        self.assertIsInstance(result['best_params']['devfactor'], float)
+        self.assertTrue(1.5 <= result['best_params']['devfactor'] <= 2.5)
+        self.assertNotEqual(result['best_params']['devfactor'] % 1, 0)
+
+    def test_sample_combinations_distinct(self):
+        """Test that sampled combinations are distinct and capped by the space size."""
+        ranges = _canonicalize_ranges((('short_window', (5, 6)), ('ma_type', ('sma', 'ema'))))
+
+        small = _sample_combinations(np.random.default_rng(0), ranges, 10)
+        large = _sample_combinations(np.random.default_rng(0), _canonicalize_ranges(
+            (('short_window', (5, 50)), ('long_window', (60, 200)))
+        ), 50)
+
+        self.assertEqual(len(small), 4)
+        self.assertEqual(len(set(large)), 50)
+        self.assertIsInstance(large[0][0], int)
+
+        constrained = _sample_combinations(
+            np.random.default_rng(0), ranges, 10, lambda p: p['ma_type'] == 'sma'
+        )
+        self.assertEqual(sorted(constrained), [(5, 'sma'), (6, 'sma')])
+        self.assertEqual(
+            _sample_combinations(np.random.default_rng(0), ranges, 10, lambda p: False), []
+        )
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_random_search_leaves_global_rng(self, mock_load):
+        """Test that random search does not reseed numpy's global RNG."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+        state = np.random.get_state()
+
+        random_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            PARAM_GRID, n_iter=2, random_state=7
+        )
+
+        np.testing.assert_array_equal(np.random.get_state()[1], state[1])
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_bayes_search(self, mock_load):
+        """Test TPE search over int ranges and categorical values."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = bayes_search(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+            {'short_window': (3, 10), 'long_window': (20, 60), 'ma_type': ['sma', 'ema']},
+            n_trials=10, random_state=42, n_jobs=1
+        )
+
+        params = result['best_params']
+        self.assertTrue(3 <= params['short_window'] <= 10)
+        self.assertTrue(20 <= params['long_window'] <= 60)
+        self.assertIn(params['ma_type'], ('sma', 'ema'))
+        self.assertAlmostEqual(result['best_value'], result['best_stats']['Return [%]'])
+        self.assertEqual(mock_load.call_count, 1)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_optimize_multiple_symbols_records_errors(self, mock_load):
+        """Test that a failing symbol does not abort the other symbols."""
+        mock_load.return_value = {'AAPL': _make_bars(), 'BAD': pd.DataFrame()}
+
+        results = optimize_multiple_symbols(
+            MovingAverageCrossOverStrategy, ['AAPL', 'BAD'], '2025-01-01', '2025-02-01',
+            PARAM_GRID, n_jobs=1
+        )
+
+        self.assertIn('best_params', results['AAPL'])
+        self.assertIn('error', results['BAD'])
+        self.assertEqual(mock_load.call_count, 1)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_optimize_multiple_symbols_serial(self, mock_load):
+        """Test that n_jobs=1 runs every search serially without a worker pool."""
+        mock_load.return_value = {'AAPL': _make_bars(), 'MSFT': _make_bars()}
+
+        # Pretend to have several cores so -1 would actually mean a pool
+        with patch('src.backtest.optimizer.effective_n_jobs', lambda n: 4 if n == -1 else n), \
+                patch('src.backtest.optimizer.Parallel', wraps=Parallel) as mock_parallel:
+            results = optimize_multiple_symbols(
+                MovingAverageCrossOverStrategy, ['AAPL', 'MSFT'], '2025-01-01', '2025-02-01',
+                PARAM_GRID, n_jobs=1
+            )
+
+        self.assertIn('best_params', results['AAPL'])
+        self.assertIn('best_params', results['MSFT'])
+        self.assertTrue(mock_parallel.call_args_list)
+        for call in mock_parallel.call_args_list:
+            self.assertEqual(call.kwargs['n_jobs'], 1)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_optimize_multiple_symbols_batch_load_fallback(self, mock_load):
+        """Test that symbols are loaded individually when the batch load fails."""
+        def fake_load(symbols, *args, **kwargs):
+            if isinstance(symbols, list):
+                raise ConnectionError("batch query failed")
+            return {symbols: _make_bars()}
+
+        mock_load.side_effect = fake_load
+
+        results = optimize_multiple_symbols(
+            MovingAverageCrossOverStrategy, ['AAPL', 'MSFT'], '2025-01-01', '2025-02-01',
+            PARAM_GRID, n_jobs=1
+        )
+
+        self.assertIn('best_params', results['AAPL'])
+        self.assertIn('best_params', results['MSFT'])
+        self.assertEqual(mock_load.call_count, 3)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_repeated_search_loads_once(self, mock_load):
+        """Test that repeated searches over the same window reuse the bars."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        for _ in range(2):
+            random_search(
+                MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-02-01',
+                PARAM_GRID, n_iter=2, random_state=1
+            )
+
+        self.assertEqual(mock_load.call_count, 1)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_cached_load_uses_loader_disk_cache(self, mock_load):
+        """Test that _cached_load goes through the loader's parquet cache."""
+        bars = _make_bars()
+        mock_load.return_value = {'AAPL': bars}
+
+        result = _cached_load('AAPL', '2025-01-01', '2025-02-01', None)
+
+        mock_load.assert_called_once_with(
+            'AAPL', '2025-01-01', '2025-02-01', resample=None, cache=True
+        )
+        pd.testing.assert_frame_equal(result, bars)
+
+    def test_as_float64_columns(self):
+        """Test that float32 bars are converted to contiguous float64 columns once."""
+        df = _make_bars().astype('float32')
+        df.attrs['data_quality'] = {'is_valid': True}
+
+        result = _as_float64_columns(df)
+
+        for col in ('Open', 'High', 'Low', 'Close', 'Volume'):
+            arr = result[col].to_numpy()
+            self.assertEqual(arr.dtype, np.float64)
+            self.assertTrue(arr.flags['C_CONTIGUOUS'])
+        self.assertEqual(result.attrs, df.attrs)
+        pd.testing.assert_index_equal(result.index, df.index)
+
+    @patch('src.backtest.optimizer.load_bars_for_backtest')
+    def test_cross_validate_optimize(self, mock_load):
+        """Test that each fold becomes one row of the trials DataFrame."""
+        mock_load.return_value = {'AAPL': _make_bars()}
+
+        result = cross_validate_optimize(
+            MovingAverageCrossOverStrategy, 'AAPL', '2025-01-01', '2025-04-01',
+            PARAM_GRID, n_splits=3
+        )
+
+        trials = result['trials']
+        self.assertEqual(len(trials), 3)
+        self.assertEqual(trials['fold'].tolist(), [1, 2, 3])
+        self.assertTrue(set(PARAM_GRID).issubset(trials.columns))
+        self.assertEqual(trials['# Trades'].dtype, np.float64)
+        self.assertEqual(set(select_best_parameters(trials)[0]), set(PARAM_GRID))
+        self.assertAlmostEqual(result['mean_test_value'], trials['test_value'].mean())
+        self.assertEqual(result['errors'], {})
+        # One load per distinct train/test window, all issued up front
+        self.assertEqual(mock_load.call_count, 6)
+
+    def test_select_best_parameters(self):
+        """Test that parameters are ranked by their mean metric across trials."""
+        trials = pd.DataFrame({
+            'symbol': ['AAPL', 'AAPL', 'MSFT', 'MSFT'],
+            'fold': [1, 2, 1, 2],
+            'short_window': [5, 10, 5, 10],
+            'ma_type': ['sma', 'ema', 'sma', 'ema'],
+            'train_value': [1.0, 2.0, 3.0, 4.0],
+            'test_value': [4.0, 10.0, 6.0, -2.0],
+        })
+
+        params, value = select_best_parameters(trials)
+        self.assertEqual(params, {'short_window': 5, 'ma_type': 'sma'})
+        self.assertEqual(value, 5.0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'trials.parquet'
+            trials.to_parquet(path)
+            self.assertEqual(select_best_parameters(path), (params, value))
+
+    def test_select_best_parameters_min_count(self):
+        """Test that a set which won a single fold can be excluded, and NaNs are ignored."""
+        trials = pd.DataFrame({
+            'symbol': ['AAPL'] * 4,
+            'fold': [1, 2, 3, 4],
+            'short_window': [5, 5, 5, 10],
+            'train_value': [1.0] * 4,
+            'test_value': [2.0, np.nan, 4.0, 50.0],
+        })
+
+        self.assertEqual(select_best_parameters(trials), ({'short_window': 10}, 50.0))
+        self.assertEqual(select_best_parameters(trials, min_count=2), ({'short_window': 5}, 3.0))
+        with self.assertRaises(ValueError):
+            select_best_parameters(trials, min_count=3)
+
+    def test_backtest_run_shares_bar_arrays(self):
+        """Test that Backtest.run hands the prepared columns to strategies without copying."""
+        from backtesting import Backtest, Strategy
+
+        df = _as_float64_columns(_make_bars())
+        seen = []
+
+        class Probe(Strategy):
+            def init(self):
+                seen.append(np.asarray(self.data.Close))
+
+            def next(self):
+                pass
+
+        bt = Backtest(df, Probe)
+        bt.run()
+        bt.run()
+
+        for arr in seen:
+            self.assertTrue(np.shares_memory(arr, df['Close'].to_numpy()))
+
+    def test_create_time_series_kfold(self):
+        """Test that folds expand and test windows follow training windows."""
+        folds = create_time_series_kfold('2025-01-01', '2025-07-01', n_splits=3)
+
+        self.assertEqual(len(folds), 3)
+        for train_start, train_end, test_start, test_end in folds:
+            self.assertEqual(train_start, pd.Timestamp('2025-01-01'))
+            self.assertEqual(train_end, test_start)
+            self.assertLess(test_start, test_end)
+        self.assertEqual(folds[-1][3], pd.Timestamp('2025-07-01'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Tests for results module.
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backtest.results import (
+    BacktestResult,
+    ResultsDatabase,
+    AsyncResultWriter,
+    ResultsComparator,
+    save_results_batch,
+    load_experiment_results,
+)
+
+
+def _make_stats(ret: float, trades: int = 5) -> pd.Series:
+    """Create a minimal stats Series like Backtest.run() returns."""
+    return pd.Series({
+        'Return [%]': ret,
+        'Sharpe Ratio': ret / 10,
+        'Max. Drawdown [%]': -5.0,
+        '# Trades': trades,
+        'Win Rate [%]': 50.0,
+    })
+
+
+class TestResults(unittest.TestCase):
+    """Test cases for result storage and comparison."""
+
+    def setUp(self):
+        """Give each test its own results directory."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.results_dir = Path(tmp_dir.name)
+
+    def test_save_and_load_result(self):
+        """Test that a result round-trips through the Parquet store."""
+        db = ResultsDatabase(self.results_dir)
+        result = BacktestResult(
+            'AAPL', 'MovingAverageCrossOverStrategy', _make_stats(12.5),
+            parameters={'short_window': np.int64(5), 'ma_type': 'ema'}
+        )
+
+        db.save_result(result, experiment_name='exp1')
+        loaded = db.load_result(result.run_id)
+
+        self.assertEqual(loaded.symbol, 'AAPL')
+        self.assertEqual(loaded.parameters, {'short_window': 5, 'ma_type': 'ema'})
+        self.assertIs(type(result.parameters['short_window']), int)
+        self.assertEqual(loaded.stats['Return [%]'], 12.5)
+        self.assertEqual(loaded.stats['# Trades'], 5)
+        with self.assertRaises(KeyError):
+            db.load_result('missing')
+
+    def test_list_results_filters_experiment(self):
+        """Test that results are partitioned by experiment."""
+        db = ResultsDatabase(self.results_dir)
+        db.save_results([
+            BacktestResult('AAPL', 'S', _make_stats(1.0)),
+            BacktestResult('MSFT', 'S', _make_stats(2.0)),
+        ], experiment_name='exp1')
+        db.save_result(BacktestResult('GOOGL', 'S', _make_stats(3.0)), experiment_name='exp2')
+
+        self.assertEqual(len(db.list_results()), 3)
+        self.assertEqual(sorted(db.list_results('exp1')['symbol']), ['AAPL', 'MSFT'])
+        self.assertEqual(len(db.load_experiment_results('exp2')), 1)
+        self.assertEqual(set(db.list_results('exp2')['experiment']), {'exp2'})
+        self.assertEqual(db.list_experiments(), ['exp1', 'exp2'])
+        self.assertTrue(db.list_results('missing').empty)
+        self.assertTrue(ResultsDatabase(self.results_dir / 'empty').list_results().empty)
+
+    def test_to_dict_metrics(self):
+        """Test metric extraction: missing metrics become 0, NaN stays NaN."""
+        stats = _make_stats(2.0)
+        stats['Profit Factor'] = np.nan
+
+        metrics = BacktestResult('AAPL', 'S', stats).to_dict()['metrics']
+
+        self.assertEqual(metrics['Return [%]'], 2.0)
+        self.assertIsInstance(metrics['# Trades'], int)
+        self.assertEqual(metrics['Sortino Ratio'], 0.0)
+        self.assertTrue(np.isnan(metrics['Profit Factor']))
+        self.assertEqual(BacktestResult('AAPL', 'S', {'# Trades': 3}).to_dict()['metrics']['# Trades'], 3)
+
+    def test_metrics_reset_with_stats(self):
+        """Test that the cached metrics follow a reassigned stats Series."""
+        result = BacktestResult('AAPL', 'S', _make_stats(2.0))
+        self.assertEqual(result.get_summary()['Return [%]'], 2.0)
+
+        result.stats = _make_stats(5.0)
+
+        self.assertEqual(result.get_summary()['Return [%]'], 5.0)
+        self.assertEqual(result.to_dict()['metrics']['Return [%]'], 5.0)
+
+    def test_uncompressed_store(self):
+        """Test that an uncompressed store reads back like a compressed one."""
+        db = ResultsDatabase(self.results_dir, compression=None)
+        result = BacktestResult('AAPL', 'S', _make_stats(1.5))
+
+        path = db.save_result(result)
+
+        self.assertTrue(Path(path).exists())
+        self.assertEqual(db.load_result(result.run_id).stats['Return [%]'], 1.5)
+
+    def test_async_writer(self):
+        """Test that queued results are written in per-experiment batches."""
+        db = ResultsDatabase(self.results_dir)
+
+        with AsyncResultWriter(db) as writer:
+            for i in range(10):
+                writer.submit(BacktestResult(f'S{i}', 'S', _make_stats(i)), f'exp{i % 2}')
+            writer.flush()
+            self.assertEqual(len(db.list_results()), 10)
+
+        self.assertEqual(len(db.list_results('exp0')), 5)
+
+    def test_compact_experiment(self):
+        """Test that compacting merges an experiment's files without losing rows."""
+        db = ResultsDatabase(self.results_dir)
+        for i in range(3):
+            db.save_result(BacktestResult(f'S{i}', 'S', _make_stats(i)), 'exp1')
+        db.save_result(BacktestResult('OTHER', 'S', _make_stats(9.0)), 'exp2')
+
+        path = db.compact_experiment('exp1')
+
+        self.assertEqual(len(list(Path(path).parent.glob('*.parquet'))), 1)
+        self.assertEqual(sorted(db.list_results('exp1')['symbol']), ['S0', 'S1', 'S2'])
+        self.assertEqual(len(db.list_results()), 4)
+
+    def test_equity_curves_round_trip(self):
+        """Test that stored equity curves load back aligned per run."""
+        db = ResultsDatabase(self.results_dir)
+        index = pd.date_range('2025-01-01', periods=4, freq='1h', tz='UTC')
+        results = [
+            BacktestResult(
+                symbol, 'S', _make_stats(1.0),
+                equity_curve=pd.DataFrame({'Equity': [100.0 + i, 101.0, 102.0, 103.0]}, index=index)
+            )
+            for i, symbol in enumerate(['AAPL', 'MSFT'])
+        ]
+        db.save_results(results, 'exp1')
+
+        curves = db.load_equity_curves('exp1')
+        loaded = db.load_experiment_results('exp1')
+        compared = ResultsComparator(loaded).compare_equity_curves(db)
+
+        self.assertEqual(curves.shape, (4, 2))
+        self.assertEqual(curves[results[1].run_id].iloc[0], 101.0)
+        self.assertEqual(sorted(compared.columns), ['AAPL_S', 'MSFT_S'])
+        self.assertEqual(compared['AAPL_S'].iloc[0], 100.0)
+
+    def test_save_results_batch_skips_failures(self):
+        """Test saving run_backtest_multiple_symbols() output as an experiment."""
+        results = {
+            'AAPL': {'strategy': 'S', 'stats': _make_stats(4.0), 'parameters': {'n': 1}},
+            'BAD': {'strategy': 'S', 'stats': None, 'error': 'no data'},
+        }
+
+        paths = save_results_batch(results, 'batch', results_dir=self.results_dir)
+        loaded = load_experiment_results('batch', results_dir=self.results_dir)
+
+        self.assertEqual(len(paths), 1)
+        self.assertEqual([r.symbol for r in loaded], ['AAPL'])
+        self.assertEqual(loaded[0].parameters, {'n': 1})
+
+    def test_save_results_batch_sharded(self):
+        """Test that n_jobs > 1 writes one file per shard and keeps every result."""
+        results = {
+            f'S{i}': {'strategy': 'S', 'stats': _make_stats(float(i))} for i in range(7)
+        }
+
+        paths = save_results_batch(results, 'sharded', results_dir=self.results_dir, n_jobs=3)
+        loaded = load_experiment_results('sharded', results_dir=self.results_dir)
+
+        self.assertEqual(len(set(paths)), 3)
+        self.assertEqual(sorted(r.symbol for r in loaded), sorted(results))
+
+    def test_comparator(self):
+        """Test ranking and best-result selection."""
+        results = [
+            BacktestResult('AAPL', 'S', _make_stats(1.0)),
+            BacktestResult('GOOGL', 'S'),
+            BacktestResult('MSFT', 'S', _make_stats(7.0)),
+            BacktestResult('MSFT', 'S', _make_stats(3.0)),
+        ]
+        comparator = ResultsComparator(results)
+
+        ranked = comparator.rank_by_metric('Return [%]')
+
+        self.assertEqual(list(ranked['Symbol']), ['MSFT', 'MSFT', 'AAPL'])
+        self.assertEqual(list(ranked['Rank']), [1, 2, 3])
+        self.assertEqual(ranked['Return [%]'].dtype, np.float64)
+        self.assertIs(comparator.get_best_result(), results[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
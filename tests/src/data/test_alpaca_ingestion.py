@@ -0,0 +1,229 @@
+"""
+Tests for Alpaca ingestion module.
+"""
+
+import unittest
+import os
+import threading
+import numpy as np
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+import pandas as pd
+
+# Add project root to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data.alpaca_ingestion import (
+    ingest_bars_for_symbols,
+    prepare_bars_dataframe,
+    prepare_bars_records,
+    _normalize_conditions,
+)
+from src.data.db_ingestion import BARS_COLUMNS
+
+
+def _make_bars_response(symbols, periods=3):
+    """Create a multi-symbol bars DataFrame shaped like the Alpaca .df response."""
+    times = pd.date_range('2025-07-01 13:30', periods=periods, freq='1min', tz='UTC')
+    index = pd.MultiIndex.from_product([symbols, times], names=['symbol', 'timestamp'])
+    n = len(index)
+    return pd.DataFrame({
+        'open': [1.0] * n,
+        'high': [1.0] * n,
+        'low': [1.0] * n,
+        'close': [1.0] * n,
+        'volume': [100.0] * n,
+        'trade_count': [1.0] * n,
+        'vwap': [1.0] * n,
+    }, index=index)
+
+
+def _make_raw_bars(periods=3):
+    """Create one symbol's bars as returned by a raw_data client."""
+    return [
+        {'t': f'2025-07-01T13:{30 + i}:00Z', 'o': 1.0, 'h': 1.0, 'l': 1.0,
+         'c': 1.0, 'v': 100, 'n': 1, 'vw': 1.0}
+        for i in range(periods)
+    ]
+
+
+def _make_raw_page(symbols, periods=3, next_page_token=None):
+    """Create one page of the raw /stocks/bars JSON response."""
+    return {
+        'bars': {symbol: _make_raw_bars(periods) for symbol in symbols},
+        'next_page_token': next_page_token,
+    }
+
+
+def _count_rows(bars_data, conn=None):
+    """Stand-in for insert_bars_idempotent that reports every row as inserted."""
+    return len(bars_data)
+
+
+START = datetime(2025, 7, 1, tzinfo=timezone.utc)
+END = datetime(2025, 7, 2, tzinfo=timezone.utc)
+
+
+class TestAlpacaIngestion(unittest.TestCase):
+    """Test cases for Alpaca data ingestion."""
+    
+    def setUp(self):
+        """Keep bar ingestion off the database."""
+        patcher = patch('src.data.alpaca_ingestion.get_db_connection')
+        self.mock_get_db_conn = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_normalize_conditions(self):
+        """Test that every conditions value becomes a list."""
+        conditions = pd.Series([['@'], ('F', 'T'), None, np.nan, 'I'])
+        
+        normalized = _normalize_conditions(conditions)
+        
+        self.assertEqual(list(normalized), [['@'], ['F', 'T'], [], [], ['I']])
+        self.assertEqual(normalized.shape, (5,))
+    
+    def test_prepare_bars_dataframe(self):
+        """Test that bars are prepared as a DataFrame in insert column order."""
+        response = _make_bars_response(['AAPL'])
+        df = prepare_bars_dataframe(response, stock_id=5)
+        
+        pd.testing.assert_frame_equal(response, _make_bars_response(['AAPL']))
+        self.assertEqual(list(df.columns), BARS_COLUMNS)
+        self.assertEqual(df['time'].iloc[1], response.index[1][1])
+        self.assertEqual(len(df), 3)
+        self.assertTrue((df['stock_id'] == 5).all())
+        self.assertEqual(df['volume'].dtype, np.uint8)
+        self.assertEqual(df['close'].dtype, np.float64)
+        self.assertEqual(list(prepare_bars_dataframe(pd.DataFrame(), 5).columns), BARS_COLUMNS)
+    
+    def test_prepare_bars_records(self):
+        """Test that raw JSON bars prepare like the .df response."""
+        df = prepare_bars_records(_make_raw_bars(), stock_id=5)
+        expected = prepare_bars_dataframe(_make_bars_response(['AAPL']), stock_id=5)
+        
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+        self.assertEqual(str(df['time'].dt.tz), 'UTC')
+        self.assertEqual(list(prepare_bars_records([], 5).columns), BARS_COLUMNS)
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    def test_ingest_bars_for_symbols_streams_pages(self, mock_insert):
+        """Test that every page is inserted as it is read and counts add up per symbol."""
+        mock_insert.side_effect = _count_rows
+        client = MagicMock()
+        client.get.side_effect = [
+            _make_raw_page(['AAPL'], next_page_token='p2'),
+            _make_raw_page(['AAPL', 'MSFT'], periods=2),
+        ]
+        
+        counts = ingest_bars_for_symbols(
+            client, {'AAPL': 1, 'MSFT': 2, 'NVDA': 3}, START, END,
+            check_existing=False, page_size=3
+        )
+        
+        self.assertEqual(counts, {'AAPL': 5, 'MSFT': 2, 'NVDA': 0})
+        self.assertEqual(mock_insert.call_count, 3)
+        self.assertEqual(list(mock_insert.call_args.args[0].columns), BARS_COLUMNS)
+        first, second = [c.args for c in client.get.call_args_list]
+        self.assertEqual(first[0], '/stocks/bars')
+        self.assertEqual(first[1]['limit'], 3)
+        self.assertEqual(second[1]['page_token'], 'p2')
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    @patch('src.data.db_ingestion.get_last_timestamp_for_symbol')
+    @patch('src.data.db_ingestion.get_last_timestamps')
+    def test_ingest_bars_for_symbols_batches_requests(self, mock_last, mock_last_symbol, mock_insert):
+        """Test that symbols sharing a start date are fetched in one request."""
+        mock_last.return_value = {'DONE': END}
+        mock_insert.side_effect = _count_rows
+        client = MagicMock()
+        client.get.return_value = _make_raw_page(['AAPL', 'MSFT'])
+        
+        counts = ingest_bars_for_symbols(
+            client, {'AAPL': 1, 'MSFT': 2, 'NVDA': 3, 'DONE': 4}, START, END
+        )
+        
+        # Existing data is looked up with one query for all symbols
+        mock_last.assert_called_once_with('bars')
+        mock_last_symbol.assert_not_called()
+        client.get.assert_called_once()
+        self.assertEqual(client.get.call_args.args[1]['symbols'], 'AAPL,MSFT,NVDA')
+        self.assertEqual(counts, {'AAPL': 3, 'MSFT': 3, 'NVDA': 0, 'DONE': 0})
+        inserted_ids = {call.args[0]['stock_id'].iloc[0] for call in mock_insert.call_args_list}
+        self.assertEqual(inserted_ids, {1, 2})
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    def test_ingest_bars_for_symbols_batch_size(self, mock_insert):
+        """Test that batch_size caps the number of symbols per request."""
+        mock_insert.side_effect = _count_rows
+        client = MagicMock()
+        client.get.return_value = {'bars': {}, 'next_page_token': None}
+        
+        ingest_bars_for_symbols(
+            client, {'A': 1, 'B': 2, 'C': 3}, START, END,
+            check_existing=False, batch_size=2
+        )
+        
+        self.assertEqual(client.get.call_count, 2)
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    def test_ingest_bars_for_symbols_concurrent_requests(self, mock_insert):
+        """Test that batch requests are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def get(path, params):
+            barrier.wait()  # Only passes if both requests run concurrently
+            return _make_raw_page(params['symbols'].split(','))
+        
+        mock_insert.side_effect = _count_rows
+        client = MagicMock()
+        client.get.side_effect = get
+        
+        counts = ingest_bars_for_symbols(
+            client, {'A': 1, 'B': 2}, START, END,
+            check_existing=False, batch_size=1, max_concurrent_requests=2
+        )
+        
+        self.assertEqual(counts, {'A': 3, 'B': 3})
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    def test_ingest_bars_for_symbols_concurrent_inserts(self, mock_insert):
+        """Test that symbols from one page are inserted concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def insert(bars_data, conn=None):
+            barrier.wait()  # Only passes if both inserts run concurrently
+            return len(bars_data)
+        
+        mock_insert.side_effect = insert
+        client = MagicMock()
+        client.get.return_value = _make_raw_page(['A', 'B'])
+        
+        counts = ingest_bars_for_symbols(
+            client, {'A': 1, 'B': 2}, START, END,
+            check_existing=False, max_insert_workers=2
+        )
+        
+        self.assertEqual(counts, {'A': 3, 'B': 3})
+    
+    @patch('src.data.alpaca_ingestion.insert_bars_idempotent')
+    def test_ingest_bars_for_symbols_one_transaction_per_group(self, mock_insert):
+        """Test that a group of symbols is inserted on one connection with one commit."""
+        mock_insert.side_effect = _count_rows
+        mock_conn = self.mock_get_db_conn.return_value.__enter__.return_value
+        client = MagicMock()
+        client.get.return_value = _make_raw_page(['A', 'B', 'C'])
+        
+        counts = ingest_bars_for_symbols(
+            client, {'A': 1, 'B': 2, 'C': 3}, START, END,
+            check_existing=False, max_insert_workers=1
+        )
+        
+        self.assertEqual(counts, {'A': 3, 'B': 3, 'C': 3})
+        self.mock_get_db_conn.assert_called_once()
+        mock_conn.commit.assert_called_once()
+        self.assertTrue(all(c.kwargs['conn'] is mock_conn for c in mock_insert.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
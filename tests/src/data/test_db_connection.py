@@ -62,7 +62,7 @@ class TestDBConnection(unittest.TestCase):
     def test_get_connection_success(self, mock_get_pool):
         """Test successful connection retrieval."""
         mock_pool = MagicMock()
-        mock_conn = MagicMock()
+        mock_conn = MagicMock(closed=0)
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_pool.getconn.return_value = mock_conn
@@ -72,8 +72,25 @@ class TestDBConnection(unittest.TestCase):
         
         self.assertIsNotNone(conn)
         mock_pool.getconn.assert_called_once()
+        mock_cursor.execute.assert_not_called()
+        
+        get_connection(validate=True)
         mock_cursor.execute.assert_called_once_with("SELECT 1")
     
+    @patch('src.data.db_connection.get_connection_pool')
+    def test_get_connection_discards_closed(self, mock_get_pool):
+        """Test that a closed pooled connection is dropped and replaced."""
+        mock_pool = MagicMock()
+        closed_conn = MagicMock(closed=1)
+        open_conn = MagicMock(closed=0)
+        mock_pool.getconn.side_effect = [closed_conn, open_conn]
+        mock_get_pool.return_value = mock_pool
+        
+        conn = get_connection()
+        
+        self.assertIs(conn, open_conn)
+        mock_pool.putconn.assert_called_once_with(closed_conn, close=True)
+    
     @patch('src.data.db_connection.get_connection_pool')
     def test_get_connection_retry(self, mock_get_pool):
         """Test connection retry logic on failure."""
@@ -85,7 +102,7 @@ class TestDBConnection(unittest.TestCase):
         mock_get_pool.return_value = mock_pool
         
         # Mock cursor for successful connection
-        mock_conn = MagicMock()
+        mock_conn = MagicMock(closed=0)
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_pool.getconn.side_effect = [
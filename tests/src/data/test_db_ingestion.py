@@ -0,0 +1,142 @@
+"""
+Tests for database ingestion module.
+"""
+
+import unittest
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+# Add project root to path for imports
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data.db_ingestion import (
+    insert_bars_idempotent,
+    insert_trades_idempotent,
+    INSERT_PAGE_SIZE,
+)
+
+
+def _bar(minute: int) -> dict:
+    """Create one bar row as produced by prepare_bars_dataframe()."""
+    return {
+        'stock_id': 1,
+        'time': datetime(2025, 7, 1, 13, minute, tzinfo=timezone.utc),
+        'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0,
+        'volume': 100.0, 'vwap': 1.0,
+    }
+
+
+class TestDBIngestion(unittest.TestCase):
+    """Test cases for idempotent inserts."""
+    
+    @patch('src.data.db_ingestion.get_db_connection')
+    def test_insert_bars_idempotent(self, mock_get_db_conn):
+        """Test that bars are COPYed to staging and moved with a prepared INSERT."""
+        mock_conn = MagicMock()
+        mock_conn.info.transaction_status = TRANSACTION_STATUS_IDLE
+        mock_cursor = MagicMock()
+        # No staging table or prepared statement yet
+        mock_cursor.fetchone.return_value = (False, False)
+        mock_conn.cursor.return_value = mock_cursor
+        mock_get_db_conn.return_value.__enter__.return_value = mock_conn
+        copied = []
+        mock_cursor.copy_expert.side_effect = lambda sql, f: copied.append(f.read())
+        # One of the three rows conflicts
+        mock_cursor.rowcount = 2
+        
+        inserted = insert_bars_idempotent([_bar(30), _bar(31), _bar(32)])
+        
+        self.assertEqual(inserted, 2)
+        lines = copied[0].splitlines()
+        self.assertEqual(len(lines), 3)
+        # Columns in BARS_COLUMNS order, volume written as an integer
+        self.assertEqual(lines[0].split(',')[0], '1')
+        self.assertEqual(lines[0].split(',')[6], '100')
+        # Times are staged as epoch microseconds
+        self.assertEqual(lines[0].split(',')[1], '1751376600000000')
+        executed = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn('ON CONFLICT (time, stock_id) DO NOTHING', executed[3])
+        self.assertEqual(executed[-1], 'EXECUTE bars_ins')
+        mock_conn.commit.assert_called()
+        
+        # The staging table and statement are only prepared once per connection
+        mock_cursor.execute.reset_mock()
+        insert_bars_idempotent([_bar(33)])
+        mock_cursor.execute.assert_called_once_with('EXECUTE bars_ins')
+    
+    @patch('src.data.db_ingestion.execute_values')
+    @patch('src.data.db_ingestion.get_db_connection')
+    def test_insert_trades_idempotent(self, mock_get_db_conn, mock_execute_values):
+        """Test that trades are sent as multi-row INSERTs and inserted rows counted."""
+        mock_conn = MagicMock()
+        mock_get_db_conn.return_value.__enter__.return_value = mock_conn
+        mock_execute_values.return_value = [(1,)]
+        trades = [{
+            'stock_id': 1, 'trade_id': 7, 'time': datetime(2025, 7, 1, tzinfo=timezone.utc),
+            'price': 1.0, 'size': 10, 'conditions': ['@'], 'exchange': 'V', 'tape': 'C',
+        }]
+        
+        inserted = insert_trades_idempotent(trades)
+        
+        self.assertEqual(inserted, 1)
+        args, kwargs = mock_execute_values.call_args
+        self.assertIn('VALUES %s', args[1])
+        self.assertEqual(kwargs['page_size'], INSERT_PAGE_SIZE)
+        self.assertTrue(kwargs['fetch'])
+    
+    @patch('src.data.db_ingestion.execute_values')
+    @patch('src.data.db_ingestion.get_db_connection')
+    def test_insert_joins_caller_transaction(self, mock_get_db_conn, mock_execute_values):
+        """Test that a caller's connection is used as is and not committed."""
+        mock_conn = MagicMock()
+        mock_execute_values.return_value = []
+        
+        insert_trades_idempotent([{
+            'stock_id': 1, 'trade_id': 7, 'time': datetime(2025, 7, 1, tzinfo=timezone.utc),
+            'price': 1.0, 'size': 10, 'conditions': [], 'exchange': 'V', 'tape': 'C',
+        }], conn=mock_conn)
+        
+        mock_get_db_conn.assert_not_called()
+        self.assertIs(mock_execute_values.call_args.args[0], mock_conn.cursor.return_value)
+        mock_conn.commit.assert_not_called()
+    
+    @patch('src.data.db_ingestion.get_db_connection')
+    def test_insert_bars_joins_caller_transaction(self, mock_get_db_conn):
+        """Test that staging setup in a caller's open transaction uses a savepoint, not a commit."""
+        mock_conn = MagicMock()
+        mock_conn.info.transaction_status = TRANSACTION_STATUS_INTRANS
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (False, False)
+        mock_conn.cursor.return_value = mock_cursor
+        
+        insert_bars_idempotent([_bar(30)], conn=mock_conn)
+        
+        mock_get_db_conn.assert_not_called()
+        mock_conn.commit.assert_not_called()
+        executed = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn('SAVEPOINT _bars_setup', executed)
+        self.assertIn('RELEASE SAVEPOINT _bars_setup', executed)
+        
+        # Until the caller commits, the setup is checked again on every insert
+        mock_cursor.execute.reset_mock()
+        mock_cursor.fetchone.return_value = (True, True)
+        insert_bars_idempotent([_bar(31)], conn=mock_conn)
+        executed = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn('pg_prepared_statements', executed[0])
+        self.assertNotIn('SAVEPOINT _bars_setup', executed)
+        mock_conn.commit.assert_not_called()
+    
+    @patch('src.data.db_ingestion.get_db_connection')
+    def test_insert_empty(self, mock_get_db_conn):
+        """Test that empty input does not touch the database."""
+        self.assertEqual(insert_bars_idempotent([]), 0)
+        self.assertEqual(insert_trades_idempotent([]), 0)
+        mock_get_db_conn.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,6 +66,21 @@ class TestIndicators(unittest.TestCase):
         # First period-1 values should be NaN
         self.assertTrue(np.isnan(result[:period-1]).all())
     
+    def test_sma_ema_match_talib(self):
+        """Test that the numba SMA/EMA kernels match talib."""
+        import talib
+        
+        for period in (1, 5, 20):
+            np.testing.assert_allclose(sma(self.close_prices, period), talib.SMA(self.close_prices, period))
+            np.testing.assert_allclose(ema(self.close_prices, period), talib.EMA(self.close_prices, period))
+    
+    def test_float32_input(self):
+        """Test that indicators accept float32 bars."""
+        close = self.close_prices.astype(np.float32)
+        
+        np.testing.assert_allclose(sma(close, 20), sma(self.close_prices, 20), rtol=1e-5)
+        self.assertEqual(len(rsi(close, 14)), len(close))
+    
     def test_bollinger_bands(self):
         """Test Bollinger Bands calculation."""
         period = 20
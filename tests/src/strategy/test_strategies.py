@@ -94,6 +94,24 @@ class TestStrategies(unittest.TestCase):
         self.assertTrue(hasattr(strategy, 'vwap'))
         self.assertIsInstance(strategy.vwap, list)
     
+    def test_moving_average_signals_share_indicator_cache(self):
+        """Test that signals() reuses cached moving averages across a sweep."""
+        cache = {}
+        first = MovingAverageCrossOverStrategy.signals(
+            self.test_data, cache, short_window=5, long_window=20, ma_type='ema'
+        )
+        MovingAverageCrossOverStrategy.signals(
+            self.test_data, cache, short_window=10, long_window=20, ma_type='ema'
+        )
+        
+        self.assertEqual(set(cache), {('ema', 5), ('ema', 10), ('ema', 20)})
+        np.testing.assert_array_equal(
+            first,
+            MovingAverageCrossOverStrategy.signals(
+                self.test_data, short_window=5, long_window=20, ma_type='ema'
+            )
+        )
+    
     def test_strategy_parameter_validation(self):
         """Test strategy parameter validation."""
         # Test with invalid parameters